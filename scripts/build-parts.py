@@ -0,0 +1,38 @@
+#! /usr/bin/env python
+import argparse
+import os
+import pathlib
+import sys
+
+import baca
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build parts in parallel.")
+    parser.add_argument("--jobs", help="number of worker processes", type=int)
+    parser.add_argument(
+        "--keep-temporary-files", help="keep .[i]ly files", action="store_true"
+    )
+    parser.add_argument(
+        "--lilypond-jobs", help="number of concurrent LilyPond calls", type=int
+    )
+    parser.add_argument(
+        "--xelatex-jobs", help="number of concurrent xelatex calls", type=int
+    )
+    arguments = parser.parse_args()
+    directory = pathlib.Path(os.getcwd())
+    if not directory.name.endswith("-parts"):
+        baca.build.print_always("Must call script in parts directory ...")
+        return 1
+    failures = baca.build.build_parts(
+        directory,
+        jobs=arguments.jobs,
+        keep_temporary_files=arguments.keep_temporary_files,
+        lilypond_jobs=arguments.lilypond_jobs,
+        xelatex_jobs=arguments.xelatex_jobs,
+    )
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+#! /usr/bin/env python
+import argparse
+import os
+import pathlib
+import sys
+
+import baca
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build sections in parallel; other options pass to music.py."
+    )
+    parser.add_argument("--jobs", help="number of worker processes", type=int)
+    arguments, music_py_arguments = parser.parse_known_args()
+    directory = pathlib.Path(os.getcwd())
+    sections_directory = baca.path.get_sections_directory(str(directory))
+    failures = baca.build.build_sections(
+        sections_directory,
+        music_py_arguments,
+        jobs=arguments.jobs,
+    )
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+#! /usr/bin/env python
+import os
+import pathlib
+
+import baca
+
+
+def main():
+    directory = pathlib.Path(os.getcwd())
+    if directory.parent.name != "sections":
+        directory = baca.path.get_sections_directory(str(directory))
+    baca.build.clear_build_cache(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ from . import (
     select,
     sequence,
     spanners,
+    timing,
     tweak,
     typings,
 )
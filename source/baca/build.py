@@ -2,10 +2,21 @@
 Build.
 """
 
+import atexit
+import cProfile
+import concurrent.futures
+import contextlib
 import dataclasses
+import datetime
 import functools
+import hashlib
+import io
+import json
+import multiprocessing
 import os
 import pathlib
+import runpy
+import shlex
 import shutil
 import signal
 import subprocess
@@ -18,66 +29,248 @@ import abjad
 
 import baca
 
+from . import timing as _timing
 
-class TimeoutException(Exception):
-    pass
+Stage = _timing.Stage
+Timing = _timing.Timing
+active_timing = _timing.active_timing
+stage = _timing.stage
+staged = _timing.staged
 
+_mirror_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_mirror_futures: list[concurrent.futures.Future] = []
+_lilypond_semaphore = None
+_xelatex_semaphore = None
 
-def handler(signum, frame):
-    raise TimeoutException("Function call timed out")
 
+@dataclasses.dataclass(slots=True)
+class TagRule:
+    """
+    Tag rule.
+    """
 
-signal.signal(signal.SIGALRM, handler)
+    match: typing.Callable
+    name: str
+    prepend_empty_chord: bool = False
+    undo: bool = False
+    count: int = dataclasses.field(default=0, compare=False)
+    skipped: int = dataclasses.field(default=0, compare=False)
+
+    def __post_init__(self):
+        assert callable(self.match), repr(self.match)
+        assert isinstance(self.name, str), repr(self.name)
+        assert isinstance(self.prepend_empty_chord, bool), repr(
+            self.prepend_empty_chord
+        )
+        assert isinstance(self.undo, bool), repr(self.undo)
 
+    def messages(self) -> list[str]:
+        if self.undo:
+            adjective = "inactive"
+            gerund = "deactivating"
+        else:
+            adjective = "active"
+            gerund = "activating"
+        messages = []
+        total = self.count + self.skipped
+        if total == 0:
+            messages.append(f"found no {self.name} tags")
+        if 0 < total:
+            tags = abjad.string.pluralize("tag", total)
+            messages.append(f"found {total} {self.name} {tags}")
+            if 0 < self.count:
+                tags = abjad.string.pluralize("tag", self.count)
+                message = f"{gerund} {self.count} {self.name} {tags}"
+                messages.append(message)
+            if 0 < self.skipped:
+                tags = abjad.string.pluralize("tag", self.skipped)
+                message = f"skipping {self.skipped} ({adjective}) {self.name} {tags}"
+                messages.append(message)
+        return [abjad.string.capitalize_start(_) + " ..." for _ in messages]
+
+    def treat(self, line: str, previous_line_was_tweak: bool) -> tuple[str, bool]:
+        """
+        Treats line exactly as abjad.activate() or abjad.deactivate() would.
+
+        Returns (line, treated) pair; treated is false when line is already active
+        (or already inactive).
+        """
+        start_column = len(line) - len(line.lstrip())
+        if not self.undo:
+            if line[start_column : start_column + 4] not in ("%%% ", "%@% "):
+                return line, False
+            if "%@% " in line:
+                line = line.replace("%@% ", "")
+                suffix = " %@%"
+            else:
+                line = line.replace("%%%", "   ")
+                suffix = None
+            assert line.endswith("\n"), repr(line)
+            if suffix:
+                line = line.strip("\n") + suffix + "\n"
+            return line, True
+        if line[start_column] == "%":
+            return line, False
+        if " %@%" in line:
+            prefix = "    " + "%@% "
+            line = line.replace(" %@%", "")
+        else:
+            prefix = "%%% "
+        if self.prepend_empty_chord and not previous_line_was_tweak:
+            prefix += "<> "
+        target = line[start_column - 4 : start_column]
+        assert target == "    ", repr((line, target, start_column, self.name))
+        characters = list(line)
+        characters[start_column - 4 : start_column] = list(prefix)
+        line = "".join(characters)
+        return line, True
+
+
+class TagRules:
+    """
+    Tag rules.
 
-def _activate_tags(
-    text: str,
-    match: typing.Callable,
-    name: str,
-    messages: list,
-    *,
-    prepend_empty_chord: bool = False,
-    undo: bool = False,
-):
-    assert isinstance(text, str), repr(text)
-    assert callable(match), repr(match)
-    assert isinstance(messages, list), repr(messages)
-    assert isinstance(name, str), repr(name)
-    if undo:
-        text, count, skipped = abjad.deactivate(
-            text,
-            match,
-            prepend_empty_chord=prepend_empty_chord,
-        )
-    else:
-        text, count, skipped = abjad.activate(text, match)
-    if undo:
-        adjective = "inactive"
-        gerund = "deactivating"
-    else:
-        adjective = "active"
-        gerund = "activating"
-    new_messages = []
-    total = count + skipped
-    if total == 0:
-        new_messages.append(f"found no {name} tags")
-    if 0 < total:
-        tags = abjad.string.pluralize("tag", total)
-        new_messages.append(f"found {total} {name} {tags}")
-        if 0 < count:
-            tags = abjad.string.pluralize("tag", count)
-            message = f"{gerund} {count} {name} {tags}"
-            new_messages.append(message)
-        if 0 < skipped:
-            tags = abjad.string.pluralize("tag", skipped)
-            message = f"skipping {skipped} ({adjective}) {name} {tags}"
-            new_messages.append(message)
-    new_messages = [abjad.string.capitalize_start(_) + " ..." for _ in new_messages]
-    if messages is not None:
-        messages.extend(new_messages)
-    return text
+    Ordered table of tag activations, tag deactivations and messages. Applies all
+    rules in one line-by-line pass over text; text and per-rule counts are the same
+    as calling abjad.activate() or abjad.deactivate() once per rule, in order.
+
+    Match functions must depend only on the tags passed to them.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self):
+        self._items: list[str | TagRule] = []
+
+    def activate(self, match: typing.Callable, name: str) -> None:
+        self._items.append(TagRule(match, name))
+
+    def apply(self, text: str, messages: list[str]) -> str:
+        assert isinstance(text, str), repr(text)
+        assert isinstance(messages, list), repr(messages)
+        rules = [_ for _ in self._items if isinstance(_, TagRule)]
+        for rule in rules:
+            rule.count, rule.skipped = 0, 0
+        untagged_indices = [i for i, _ in enumerate(rules) if _.match([])]
+        indices_by_tags: dict[tuple[str, ...], list[int]] = {}
+        previous_line_was_tweak = [False] * len(rules)
+        previous_treated: dict[int, bool] = {}
+        text_lines = text.split("\n")
+        text_lines = [_ + "\n" for _ in text_lines[:-1]] + text_lines[-1:]
+        lines, current_tags = [], []
+        for line in text_lines:
+            if line.lstrip().startswith("%! "):
+                lines.append(line)
+                current_tags.append(line.strip()[3:])
+                continue
+            if current_tags:
+                key = tuple(current_tags)
+                indices = indices_by_tags.get(key)
+                if indices is None:
+                    tags = [abjad.Tag(_) for _ in current_tags]
+                    indices = [i for i, _ in enumerate(rules) if _.match(tags)]
+                    indices_by_tags[key] = indices
+                current_tags = []
+            else:
+                indices = untagged_indices
+            treated_by_index = {}
+            for i in indices:
+                rule = rules[i]
+                line, treated = rule.treat(line, previous_line_was_tweak[i])
+                if treated and previous_treated.get(i) is not True:
+                    rule.count += 1
+                if not treated and previous_treated.get(i) is not False:
+                    rule.skipped += 1
+                treated_by_index[i] = treated
+                previous_line_was_tweak[i] = "tweak" in line
+            previous_treated = treated_by_index
+            lines.append(line)
+        for item in self._items:
+            if isinstance(item, TagRule):
+                messages.extend(item.messages())
+            else:
+                messages.append(item)
+        return "".join(lines)
+
+    def deactivate(
+        self, match: typing.Callable, name: str, *, prepend_empty_chord: bool = False
+    ) -> None:
+        rule = TagRule(match, name, prepend_empty_chord=prepend_empty_chord, undo=True)
+        self._items.append(rule)
+
+    def message(self, string: str) -> None:
+        assert isinstance(string, str), repr(string)
+        self._items.append(string)
+
+    def show_tag(
+        self,
+        tag: abjad.Tag | str,
+        *,
+        match: typing.Callable | None = None,
+        prepend_empty_chord: bool = False,
+        undo: bool = False,
+    ) -> None:
+        if match is not None:
+            assert callable(match)
+        if isinstance(tag, str):
+            assert match is not None, repr(match)
+            name = tag
+        else:
+            assert isinstance(tag, abjad.Tag), repr(tag)
+            name = tag.string
 
+        if match is None:
 
+            def match(tags):
+                tags_ = [tag]
+                return bool(set(tags) & set(tags_))
+
+        if not undo:
+            self.message(f"Showing {name} tags ...")
+            self.activate(match, name)
+        else:
+            self.message(f"Hiding {name} tags ...")
+            self.deactivate(match, name, prepend_empty_chord=prepend_empty_chord)
+        self.message("")
+
+
+def _build_part(part_directory: pathlib.Path, keep_temporary_files: bool) -> int:
+    build_log = part_directory / ".build.log"
+    with build_log.open("w") as pointer:
+        with contextlib.redirect_stdout(pointer), contextlib.redirect_stderr(pointer):
+            try:
+                build_part(part_directory, keep_temporary_files=keep_temporary_files)
+            except SystemExit as e:
+                return _get_exit_code(e)
+            finally:
+                wait_for_mirror_writes()
+    return 0
+
+
+def _build_section(music_py: str, arguments: list[str]) -> int:
+    section_directory = pathlib.Path(music_py).parent
+    os.chdir(section_directory)
+    sys.argv = [music_py, *arguments]
+    build_log = section_directory / ".build.log"
+    with build_log.open("w") as pointer:
+        with contextlib.redirect_stdout(pointer), contextlib.redirect_stderr(pointer):
+            try:
+                arguments_ = baca.build.arguments(sys.argv)
+                if not arguments_.ignore_cache and build_cache_is_current(
+                    section_directory, arguments_
+                ):
+                    string = baca.path.trim(section_directory)
+                    print_success(f"Using cached build of {string} ...")
+                    return 0
+                runpy.run_path(music_py, run_name="__main__")
+            except SystemExit as e:
+                return _get_exit_code(e)
+            finally:
+                wait_for_mirror_writes()
+    return 0
+
+
+@staged
 def _call_lilypond_on_music_ly_in_section(
     music_ly, music_pdf_mtime, lilypond_timeout=0
 ):
@@ -101,9 +294,9 @@ def _call_lilypond_on_music_ly_in_section(
 
 
 def _color_persistent_indicators(
-    text: str, messages: list[str], build: bool, *, undo: bool = False
-) -> str:
-    assert isinstance(text, str), repr(text)
+    rules: TagRules, build: bool, *, undo: bool = False
+) -> None:
+    assert isinstance(rules, TagRules), repr(rules)
     name = "persistent indicator"
 
     def _activate(tags):
@@ -115,41 +308,14 @@ def _color_persistent_indicators(
         return bool(set(tags) & set(tags_))
 
     if undo:
-        messages.append(f"Uncoloring {name}s ...")
-        text = _activate_tags(
-            text, _deactivate, "persistent indicator color suppression", messages
-        )
-        text = _deactivate_tags(
-            text, _activate, "persistent indicator color expression", messages
-        )
+        rules.message(f"Uncoloring {name}s ...")
+        rules.activate(_deactivate, "persistent indicator color suppression")
+        rules.deactivate(_activate, "persistent indicator color expression")
     else:
-        messages.append(f"Coloring {name}s ...")
-        text = _activate_tags(
-            text, _activate, "persistent indicator color expression", messages
-        )
-        text = _deactivate_tags(
-            text, _deactivate, "persistent indicator color suppression", messages
-        )
-    messages.append("")
-    return text
-
-
-def _deactivate_tags(
-    text: str,
-    match: typing.Callable,
-    name: str,
-    messages: list,
-    *,
-    prepend_empty_chord: bool = False,
-):
-    return _activate_tags(
-        text,
-        match,
-        name,
-        messages=messages,
-        prepend_empty_chord=prepend_empty_chord,
-        undo=True,
-    )
+        rules.message(f"Coloring {name}s ...")
+        rules.activate(_activate, "persistent indicator color expression")
+        rules.deactivate(_deactivate, "persistent indicator color suppression")
+    rules.message("")
 
 
 def _display_lilypond_log_errors(lilypond_log_file_path: pathlib.Path):
@@ -184,145 +350,114 @@ def _externalize(
         path_ily = path.with_suffix(".ily")
     else:
         path_ily = path.with_name(file_name)
+    include_name = None
     if path_ily is not None:
         assert path_ily.suffix == ".ily", repr(path_ily)
+        if path_ily.parent == path.parent:
+            include_name = path_ily.name
+        else:
+            include_name = str(path_ily)
+    with path.open() as pointer:
+        text, text_ily = _externalize_lines(pointer, include_name=include_name)
+    path.write_text(text)
+    if path_ily is not None:
+        assert text_ily is not None
+        path_ily.write_text(text_ily)
+    return path_ily
+
+
+def _externalize_string(
+    string: str, *, include_name: str | None = None
+) -> tuple[str, str | None]:
+    return _externalize_lines(io.StringIO(string), include_name=include_name)
+
+
+def _externalize_lines(
+    lines: typing.Iterable[str], *, include_name: str | None = None
+) -> tuple[str, str | None]:
+    in_place = include_name is None
     preamble_lines: list[str] = []
     score_lines: list[str] = []
-    stack: dict[str, list[str]] = {}
-    finished_variables = {}
+    variable_lines: list[str] = []
+    stack: list[tuple[str, list[str]]] = []
+    open_names: set[str] = set()
     found_score = False
-    with open(path) as pointer:
-        readlines = pointer.readlines()
-    for line in readlines:
-        if (
-            line.startswith(r"\score")
-            or line.startswith(r"\context Score")
-            or line.startswith("{")
-        ):
+    for line in lines:
+        if not found_score and line.startswith((r"\score", r"\context Score", "{")):
             found_score = True
         if not found_score:
             preamble_lines.append(line)
         elif " %*% " in line:
             words = line.split()
-            index = words.index("%*%")
-            name = words[index + 1]
-            # first line in expression:
-            if name not in stack:
-                stack[name] = []
-                stack[name].append(line)
-            # last line in expression
+            name = words[words.index("%*%") + 1]
+            if name not in open_names:
+                open_names.add(name)
+                stack.append((name, [line]))
+                continue
+            name_, lines_ = stack.pop()
+            assert name_ == name, repr((name_, name))
+            open_names.remove(name)
+            lines_.append(line)
+            if variable_lines:
+                variable_lines.extend(["\n", "\n"])
+            variable_lines.extend(_externalize_variable(name, lines_))
+            indent = (len(line) - len(line.lstrip())) * " "
+            dereference = [f"{indent}{{\n", f"{indent}    \\{name}\n", f"{indent}}}\n"]
+            if stack:
+                stack[-1][1].extend(dereference)
             else:
-                stack[name].append(line)
-                finished_variables[name] = stack[name]
-                del stack[name]
-                count = len(line) - len(line.lstrip())
-                indent = count * " "
-                first_line = finished_variables[name][0]
-                dereference = []
-                dereference.append(indent + "{")
-                local_indent = 4 * " "
-                dereference.append(indent + local_indent + "\\" + name)
-                dereference.append(indent + "}")
-                dereference = [_ + "\n" for _ in dereference]
-                if bool(stack):
-                    items = list(stack.items())
-                    items[-1][-1].extend(dereference)
-                else:
-                    score_lines.extend(dereference)
-        elif bool(stack):
-            items = list(stack.items())
-            items[-1][-1].append(line)
+                score_lines.extend(dereference)
+        elif stack:
+            stack[-1][1].append(line)
         else:
             score_lines.append(line)
     if in_place is False:
-        assert path_ily is not None
-        if path_ily.parent == path.parent:
-            include_name = path_ily.name
-        else:
-            include_name = str(path_ily)
-        include_line = f'\\include "{include_name}"'
-        include_lines = [include_line]
-        include_lines = [_ + "\n" for _ in include_lines]
         last_include = 0
         for i, line in enumerate(preamble_lines):
             if line.startswith(r"\include"):
                 last_include = i
-        preamble_lines[last_include + 1 : last_include + 1] = include_lines
+        preamble_lines.insert(last_include + 1, f'\\include "{include_name}"\n')
     if preamble_lines[-2] == "\n":
         del preamble_lines[-2]
-    lines = []
-    lines.extend(preamble_lines)
-    lines.extend(score_lines)
-    lines_ = []
-    for line in lines:
-        lines_.append(line)
-    text = "".join(lines_)
-    path.write_text(text)
-    lines = []
     if in_place is False:
         string = abjad.configuration.Configuration().lilypond_version_string()
-        string = rf'\version "{string}"'
-        lines.append(string + "\n")
-        lines.append("\n")
-    items = list(finished_variables.items())
-    total = len(items)
-    for i, item in enumerate(items):
-        name, variable_lines = item
-        first_line = variable_lines[0]
-        count = len(first_line) - len(first_line.lstrip())
-        first_line = first_line[count:]
-        first_line = f"{name} = {first_line}"
-        words = first_line.split()
-        index = words.index("%*%")
-        first_line = " ".join(words[:index])
-        words = first_line.split(" = ")
-        assert len(words) == 2, repr(words)
-        first_lines = []
-        first_lines.append(words[0] + " =")
-        first_lines.extend(words[1:])
-        first_lines = [_ + "\n" for _ in first_lines]
-        lines.extend(first_lines)
-        for variable_line in variable_lines[1:]:
-            assert variable_line[:count].isspace(), repr(line)
-            variable_line = variable_line[count:]
-            if variable_line == "":
-                variable_line = "\n"
-            assert variable_line.endswith("\n"), repr(variable_line)
-            lines.append(variable_line)
-        not_topmost_index = None
-        for j, line in enumerate(reversed(lines)):
-            if line.strip() == f"%! {baca.tags.NOT_TOPMOST.string}":
-                not_topmost_index = j
-                break
-            if line.isspace():
-                break
-        if not_topmost_index is not None:
-            assert 0 < not_topmost_index
-            index = -(not_topmost_index + 1)
-            del lines[index]
-        last_line = lines[-1]
-        assert last_line.startswith("} ") or last_line.startswith(">> ")
-        words = last_line.split()
-        index = words.index("%*%")
-        last_line = " ".join(words[:index])
-        last_lines = [last_line]
-        last_lines = [_ + "\n" for _ in last_lines]
-        lines[-1:] = last_lines
-        if i < total - 1:
-            lines.append("\n")
-            lines.append("\n")
-    if in_place is False:
-        assert path_ily is not None
-        text = "".join(lines)
-        path_ily.write_text(text)
-        return path_ily
+        header = [rf'\version "{string}"' + "\n", "\n"]
+        text = "".join(preamble_lines) + "".join(score_lines)
+        return text, "".join(header) + "".join(variable_lines)
     else:
         assert "context Score" in score_lines[0]
         score_lines[0] = "page-layout-score = " + score_lines[0]
-        lines_ = preamble_lines + lines + ["\n\n"] + score_lines
-        text = "".join(lines_)
-        path.write_text(text)
-        return None
+        lines_ = preamble_lines + variable_lines + ["\n\n"] + score_lines
+        return "".join(lines_), None
+
+
+def _externalize_variable(name: str, lines: list[str]) -> list[str]:
+    first_line = lines[0]
+    count = len(first_line) - len(first_line.lstrip())
+    words = f"{name} = {first_line[count:]}".split()
+    words = " ".join(words[: words.index("%*%")]).split(" = ")
+    assert len(words) == 2, repr(words)
+    result = [words[0] + " =\n", words[1] + "\n"]
+    not_topmost_index = None
+    not_topmost_line = f"%! {baca.tags.NOT_TOPMOST.string}"
+    for line in lines[1:-1]:
+        assert line[:count].isspace(), repr(line)
+        line = line[count:] or "\n"
+        assert line.endswith("\n"), repr(line)
+        if line.isspace():
+            not_topmost_index = None
+        elif line.strip() == not_topmost_line:
+            not_topmost_index = len(result)
+        result.append(line)
+    if not_topmost_index is not None:
+        del result[not_topmost_index]
+    last_line = lines[-1]
+    assert last_line[:count].isspace(), repr(last_line)
+    last_line = last_line[count:]
+    assert last_line.startswith("} ") or last_line.startswith(">> ")
+    words = last_line.split()
+    result.append(" ".join(words[: words.index("%*%")]) + "\n")
+    return result
 
 
 def _externalize_layout_ily_path(layout_ily_path):
@@ -330,27 +465,100 @@ def _externalize_layout_ily_path(layout_ily_path):
     _externalize(layout_ily_path, in_place=True)
 
 
-def _externalize_music_ly_path(music_ly):
+@staged
+def _externalize_music_ly_path(music_ly, texts, tags):
     print_file_handling(f"Externalizing {baca.path.trim(music_ly)} ...")
     assert "sections" in music_ly.parts, repr(music_ly)
-    music_ily = _externalize(music_ly)
-    for file in (music_ly, music_ily):
-        text = file.read_text()
-        messages = []
-        text = _not_topmost(text, messages)
-        file.write_text(text)
+    texts["music.ly"], texts["music.ily"] = _externalize_string(
+        texts["music.ly"], include_name="music.ily"
+    )
+    rules = TagRules()
+    _not_topmost(rules)
+    for name in ("music.ly", "music.ily"):
+        messages: list[str] = []
+        texts[name] = rules.apply(texts[name], messages)
         if messages:
             message = "Appending not-topmost tags messages ..."
             print_file_handling(message, log_only=True)
-            messages = "\n".join(messages) + "\n"
-            _tags_file = file.with_name(f".{file.name}.tags")
-            with _tags_file.open("a") as pointer:
-                pointer.write(messages)
+            tags[name] = tags.get(name, "") + "\n".join(messages) + "\n"
+
+
+@staged
+def _format_music_ly(lilypond_file):
+    string = abjad.lilypond(lilypond_file, site_comments=True, tags=True)
+    return string + "\n"
+
+
+def _get_build_cache_key(section_directory, arguments):
+    music_py = section_directory / "music.py"
+    paths = [music_py, section_directory / "layout.ily"]
+    previous_section = baca.path._get_previous_section(music_py)
+    if previous_section:
+        paths.append(previous_section / ".metadata")
+    contents_directory = section_directory.parent.parent
+    paths.append(contents_directory / "library.py")
+    paths.extend(sorted((contents_directory / "library").glob("**/*.py")))
+    paths.extend(sorted((contents_directory / "stylesheets").glob("*.ily")))
+    hash_ = hashlib.sha256()
+    for package in (abjad, baca):
+        directory = str(pathlib.Path(package.__file__).parent)
+        hash_.update(f"{directory} {_get_package_source_hash(directory)}\n".encode())
+    for name, value in sorted(vars(arguments).items()):
+        if name != "ignore_cache":
+            hash_.update(f"{name} {value!r}\n".encode())
+    for path in paths:
+        hash_.update(f"{path}\n".encode())
+        if path.is_file():
+            hash_.update(path.read_bytes())
+    return hash_.hexdigest()
+
+
+def _get_build_cache_outputs(section_directory, arguments):
+    names = [".metadata"]
+    if arguments.pdf:
+        names.append("music.ly")
+        if not arguments.do_not_call_lilypond:
+            names.append("music.pdf")
+    if arguments.clicktrack:
+        names.append("clicktrack.midi")
+    if arguments.midi:
+        names.append("music.midi")
+    return [section_directory / _ for _ in names]
+
+
+def _get_exit_code(exception: SystemExit) -> int:
+    if isinstance(exception.code, int):
+        return exception.code
+    return 0 if exception.code is None else 1
+
+
+@functools.lru_cache
+def _get_package_source_hash(directory: str) -> str:
+    hash_ = hashlib.sha256()
+    root = pathlib.Path(directory)
+    for path in sorted(root.rglob("*")):
+        if "__pycache__" in path.parts or not path.is_file():
+            continue
+        hash_.update(f"{path.relative_to(root)}\n".encode())
+        hash_.update(path.read_bytes())
+    return hash_.hexdigest()
+
+
+def _get_regression_path(path, name):
+    parts = []
+    for part in path.parts:
+        if part == os.path.sep:
+            pass
+        elif part == "Scores":
+            parts.extend(["Regression", name])
+        else:
+            parts.append(part)
+    return pathlib.Path("/" + os.path.sep.join(parts))
 
 
 def _handle_edition_tags(
-    text: str, messages: list[str], build_identifier: str, build_type: str
-) -> str:
+    rules: TagRules, build_identifier: str, build_type: str
+) -> None:
     """
     Handles edition tags.
 
@@ -385,11 +593,11 @@ def _handle_edition_tags(
             LETTER_PARTS_TRUMPET_3
 
     """
-    assert isinstance(text, str), repr(text)
+    assert isinstance(rules, TagRules), repr(rules)
     assert abjad.string.is_shout_case(build_identifier), repr(build_identifier)
     assert not build_identifier.endswith("_PARTS"), repr(build_identifier)
     assert build_type in ("SECTION", "SCORE", "PARTS"), repr(build_type)
-    messages.append("Handling edition tags ...")
+    rules.message("Handling edition tags ...")
     this_edition = abjad.Tag(f"+{build_type}")
     not_this_edition = abjad.Tag(f"-{build_type}")
     this_directory = abjad.Tag(f"+{build_identifier}")
@@ -405,7 +613,7 @@ def _handle_edition_tags(
                 return True
         return False
 
-    text = _deactivate_tags(text, _deactivate, "other-edition", messages)
+    rules.deactivate(_deactivate, "other-edition")
 
     def _activate(tags):
         for tag in tags:
@@ -416,24 +624,22 @@ def _handle_edition_tags(
                 return True
         return bool(set(tags) & set([this_edition, this_directory]))
 
-    text = _activate_tags(text, _activate, "this-edition", messages)
-    messages.append("")
-    return text
+    rules.activate(_activate, "this-edition")
+    rules.message("")
 
 
 def _handle_fermata_bar_lines(
-    text: str,
-    messages: list[str],
+    rules: TagRules,
     bol_measure_numbers: list | None,
     final_measure_number: int | None,
-) -> str:
-    messages.append("Handling fermata bar lines ...")
+) -> None:
+    rules.message("Handling fermata bar lines ...")
 
     def _activate(tags):
         return bool(set(tags) & set([baca.tags.FERMATA_MEASURE]))
 
     # activate fermata measure bar line adjustment tags ...
-    text = _activate_tags(text, _activate, "bar line adjustment", messages)
+    rules.activate(_activate, "bar line adjustment")
     # ... then deactivate non-EOL tags
     if bol_measure_numbers:
         eol_measure_numbers = [_ - 1 for _ in bol_measure_numbers[1:]]
@@ -447,25 +653,23 @@ def _handle_fermata_bar_lines(
                     return True
             return False
 
-        text = _deactivate_tags(text, _deactivate, "EOL fermata bar line", messages)
-    messages.append("")
-    return text
+        rules.deactivate(_deactivate, "EOL fermata bar line")
+    rules.message("")
 
 
 def _handle_mol_tags(
-    text: str,
-    messages: list[str],
+    rules: TagRules,
     bol_measure_numbers: list | None,
     final_measure_number: int | None,
-) -> str:
-    messages.append("Handling MOL tags ...")
+) -> None:
+    rules.message("Handling MOL tags ...")
 
     # activate all middle-of-line tags ...
     def _activate(tags):
         tags_ = set([baca.tags.NOT_MOL, baca.tags.ONLY_MOL])
         return bool(set(tags) & tags_)
 
-    text = _activate_tags(text, _activate, "MOL", messages)
+    rules.activate(_activate, "MOL")
     # ... then deactivate conflicting middle-of-line tags
     if bol_measure_numbers:
         nonmol_measure_numbers = bol_measure_numbers[:]
@@ -484,58 +688,43 @@ def _handle_mol_tags(
                     return True
             return False
 
-        text = _deactivate_tags(text, _deactivate, "conflicting MOL", messages)
-    messages.append("")
-    return text
+        rules.deactivate(_deactivate, "conflicting MOL")
+    rules.message("")
 
 
-def _handle_section_tags(section_directory):
+@staged
+def _handle_section_tags(section_directory, texts, tags):
     assert section_directory.is_dir()
     print_file_handling("Writing section tag files ...")
-    music_ly = section_directory / "music.ly"
-    text = music_ly.read_text()
-    text = abjad.tag.left_shift_tags(text)
-    music_ly.write_text(text)
+    texts["music.ly"] = abjad.tag.left_shift_tags(texts["music.ly"])
+    metadata = baca.path.get_metadata(section_directory)
+    bol_measure_numbers = metadata.get("bol_measure_numbers")
+    final_measure_number = metadata.get("final_measure_number")
+    rules = TagRules()
+    _handle_edition_tags(rules, "SECTION", "SECTION")
+    _handle_fermata_bar_lines(rules, bol_measure_numbers, final_measure_number)
+    _handle_shifted_clefs(rules, bol_measure_numbers)
+    _handle_mol_tags(rules, bol_measure_numbers, final_measure_number)
     for name in ("layout.ily", "music.ily", "music.ly"):
-        path = music_ly.with_name(name)
-        if not path.exists():
+        if name not in texts:
             continue
-        bol_measure_numbers = baca.path.get_metadata(section_directory).get(
-            "bol_measure_numbers"
-        )
-        final_measure_number = baca.path.get_metadata(section_directory).get(
-            "final_measure_number"
-        )
-        _tags_file = music_ly.with_name(f".{name}.tags")
-        messages = []
-        text = path.read_text()
-        text = _handle_edition_tags(text, messages, "SECTION", "SECTION")
-        text = _handle_fermata_bar_lines(
-            text, messages, bol_measure_numbers, final_measure_number
-        )
-        text = _handle_shifted_clefs(text, messages, bol_measure_numbers)
-        text = _handle_mol_tags(
-            text, messages, bol_measure_numbers, final_measure_number
-        )
-        path.write_text(text)
+        _tags_file = section_directory / f".{name}.tags"
+        messages: list[str] = []
+        texts[name] = rules.apply(texts[name], messages)
         print_file_handling(
             f"Appending {baca.path.trim(_tags_file)} ...", log_only=True
         )
-        text = "\n".join(messages) + "\n"
-        with _tags_file.open("a") as pointer:
-            pointer.write(text)
+        tags[name] = tags.get(name, "") + "\n".join(messages) + "\n"
 
 
-def _handle_shifted_clefs(
-    text: str, messages: list[str], bol_measure_numbers: list | None
-) -> str:
-    messages.append("Handling shifted clefs ...")
+def _handle_shifted_clefs(rules: TagRules, bol_measure_numbers: list | None) -> None:
+    rules.message("Handling shifted clefs ...")
 
     def _activate(tags):
         return baca.tags.SHIFTED_CLEF in tags
 
     # set X-extent to false and left-shift measure-initial clefs ...
-    text = _activate_tags(text, _activate, "shifted clef", messages)
+    rules.activate(_activate, "shifted clef")
     # ... then unshift clefs at beginning-of-line
     if bol_measure_numbers:
         bol_measure_numbers = [abjad.Tag(f"MEASURE_{_}") for _ in bol_measure_numbers]
@@ -547,13 +736,12 @@ def _handle_shifted_clefs(
                 return True
             return False
 
-        text = _deactivate_tags(text, _deactivate, "BOL clef", messages)
-    messages.append("")
-    return text
+        rules.deactivate(_deactivate, "BOL clef")
+    rules.message("")
 
 
-def _join_broken_spanners(text: str, messages: list[str]) -> str:
-    messages.append("Joining broken spanners ...")
+def _join_broken_spanners(rules: TagRules) -> None:
+    rules.message("Joining broken spanners ...")
 
     def _activate(tags):
         tags_ = [baca.tags.SHOW_TO_JOIN_BROKEN_SPANNERS]
@@ -563,10 +751,9 @@ def _join_broken_spanners(text: str, messages: list[str]) -> str:
         tags_ = [baca.tags.HIDE_TO_JOIN_BROKEN_SPANNERS]
         return bool(set(tags) & set(tags_))
 
-    text = _activate_tags(text, _activate, "broken spanner expression", messages)
-    text = _deactivate_tags(text, _deactivate, "broken spanner suppression", messages)
-    messages.append("")
-    return text
+    rules.activate(_activate, "broken spanner expression")
+    rules.deactivate(_deactivate, "broken spanner suppression")
+    rules.message("")
 
 
 def _log_timing(section_directory, timing):
@@ -608,6 +795,7 @@ def _log_timing(section_directory, timing):
         pointer.write(line)
 
 
+@staged
 def _make_section_clicktrack(lilypond_file, mtime, section_directory):
     metadata = baca.path.get_metadata(section_directory)
     if metadata.get("first_metronome_mark") is False:
@@ -691,6 +879,7 @@ def _make_section_clicktrack(lilypond_file, mtime, section_directory):
         print_error(f"Can not find {baca.path.trim(clicktrack_path)} ...")
 
 
+@staged
 def _make_section_midi(lilypond_file, mtime, section_directory):
     metadata = baca.path.get_metadata(section_directory)
     if metadata.get("first_metronome_mark") is False:
@@ -736,29 +925,21 @@ def _make_section_pdf(
     print_main_task("Making PDF ...")
     music_ly = section_directory / "music.ly"
     music_pdf = section_directory / "music.pdf"
-    music_ly_mtime = os.path.getmtime(music_ly) if music_ly.is_file() else 0
-    abjad.persist.as_ly(lilypond_file, music_ly, tags=True)
-    if music_ly.is_file() and music_ly_mtime < os.path.getmtime(music_ly):
-        print_file_handling(f"Writing {baca.path.trim(music_ly)} ...")
-    print_file_handling("Removing section tag files ...")
-    _layout_ily_tags = music_ly.with_name(".layout.ily.tags")
-    if _layout_ily_tags.exists():
-        _layout_ily_tags.unlink()
-    _music_ily_tags = music_ly.with_name(".music.ily.tags")
-    if _music_ily_tags.exists():
-        _music_ily_tags.unlink()
-    _music_ly_tags = music_ly.with_name(".music.ly.tags")
-    if _music_ly_tags.exists():
-        _music_ly_tags.unlink()
-    _externalize_music_ly_path(music_ly)
-    _handle_section_tags(section_directory)
+    texts = {"music.ly": _format_music_ly(lilypond_file)}
+    layout_ily = section_directory / "layout.ily"
+    if layout_ily.exists():
+        texts["layout.ily"] = layout_ily.read_text()
+    tags: dict[str, str] = {}
+    _externalize_music_ly_path(music_ly, texts, tags)
+    _handle_section_tags(section_directory, texts, tags)
     contents_directory = baca.path.get_contents_directory(section_directory)
     metadata = baca.path.get_metadata(contents_directory)
     do_not_populate_remote_repos = metadata.get("do_not_populate_remote_repos")
     if not do_not_populate_remote_repos:
-        _populate_verbose_repository(section_directory)
-    _remove_site_comments(section_directory)
-    _remove_function_name_comments(section_directory)
+        _populate_verbose_repository(section_directory, texts)
+    _remove_site_comments(section_directory, texts)
+    _remove_function_name_comments(section_directory, texts)
+    _write_section_files(section_directory, texts, tags)
     if music_pdf.is_file():
         print_file_handling(f"Existing {baca.path.trim(music_pdf)} ...", log_only=True)
     if do_not_call_lilypond is True:
@@ -774,7 +955,7 @@ def _make_section_pdf(
     if log_timing:
         _log_timing(section_directory, timing)
     if also_untagged is True and not do_not_populate_remote_repos:
-        _populate_untagged_repository(section_directory)
+        _populate_untagged_repository(section_directory, texts)
 
 
 def _metronome_mark_color_suppression_tags():
@@ -800,16 +981,15 @@ def _music_annotation_tags():
     ]
 
 
-def _not_topmost(text: str, messages: list[str]) -> str:
-    messages.append(f"Deactivating {baca.tags.NOT_TOPMOST.string} ...")
+def _not_topmost(rules: TagRules) -> None:
+    rules.message(f"Deactivating {baca.tags.NOT_TOPMOST.string} ...")
 
     def _deactivate(tags):
         tags_ = [baca.tags.NOT_TOPMOST]
         return bool(set(tags) & set(tags_))
 
-    text = _deactivate_tags(text, _deactivate, "not topmost", messages)
-    messages.append("")
-    return text
+    rules.deactivate(_deactivate, "not topmost")
+    rules.message("")
 
 
 def _persistent_indicator_color_expression_tags(*, build=False):
@@ -872,132 +1052,83 @@ def _persistent_indicator_color_suppression_tags():
     return tags
 
 
-def _populate_verbose_repository(section_directory):
+def _persist_lilypond_file(
+    arguments,
+    section_directory,
+    timing,
+    lilypond_file,
+    metadata,
+    *,
+    lilypond_timeout=0,
+):
+    dictionary = dict(metadata)
+    baca.section.sort_dictionary(dictionary)
+    metadata = types.MappingProxyType(dictionary)
+    metadata_file = section_directory / ".metadata"
+    print_file_handling(f"Writing {baca.path.trim(metadata_file)} ...")
+    with stage("write_metadata_py"):
+        baca.path.write_metadata_py(section_directory, metadata)
+    if arguments.clicktrack:
+        path = section_directory / "clicktrack.midi"
+        mtime = os.path.getmtime(path) if path.is_file() else None
+        _make_section_clicktrack(lilypond_file, mtime, section_directory)
+    if arguments.midi:
+        path = section_directory / "music.midi"
+        mtime = os.path.getmtime(path) if path.is_file() else None
+        _make_section_midi(lilypond_file, mtime, section_directory)
+    if arguments.pdf:
+        path = section_directory / "music.pdf"
+        mtime = os.path.getmtime(path) if path.is_file() else None
+        _make_section_pdf(
+            lilypond_file,
+            mtime,
+            section_directory,
+            timing,
+            also_untagged=arguments.also_untagged,
+            do_not_call_lilypond=arguments.do_not_call_lilypond,
+            lilypond_timeout=lilypond_timeout,
+            log_timing=arguments.log_timing,
+            print_timing=arguments.print_timing,
+        )
+
+
+@staged
+def _populate_verbose_repository(section_directory, texts):
     if os.environ.get("GITHUB_WORKSPACE"):
         return
     print_main_task("Populating $REGRESSION/verbose repository ...")
+    items = []
     for name in ("music.ly", "music.ily", "layout.ily"):
-        path = section_directory / name
-        if not path.exists():
+        if name not in texts:
             continue
-        with path.open() as pointer:
-            lines = pointer.readlines()
-        string = "".join(lines)
-        parts = []
-        for part in path.parts:
-            if part == os.path.sep:
-                pass
-            elif part == "Scores":
-                parts.extend(["Regression", "verbose"])
-            else:
-                parts.append(part)
-        _untagged = "/" + os.path.sep.join(parts)
-        _untagged = pathlib.Path(_untagged)
-        if not _untagged.parent.is_dir():
-            _untagged.parent.mkdir(parents=True)
-        _untagged.write_text(string)
+        path = _get_regression_path(section_directory / name, "verbose")
+        items.append((path, texts[name]))
+    _submit_mirror_job(_write_mirror_files, items)
 
 
-def _populate_untagged_repository(section_directory):
+@staged
+def _populate_untagged_repository(section_directory, texts):
     if os.environ.get("GITHUB_WORKSPACE"):
         return
     print_main_task("Populating $REGRESSION/untagged repository ...")
-    for name in ("music.ly", "music.ily", "layout.ily"):
-        path = section_directory / name
-        if not path.exists():
-            continue
-        with path.open() as pointer:
-            lines = pointer.readlines()
-        lines_ = []
-        for line in lines:
-            if line.strip().startswith("% "):
-                if line.strip().endswith(":"):
-                    continue
-            lines_.append(line)
-        lines = lines_
-        string = "".join(lines)
-        string = abjad.tag.remove_tags(string)
-        parts = []
-        for part in path.parts:
-            if part == os.path.sep:
-                pass
-            elif part == "Scores":
-                parts.extend(["Regression", "untagged"])
-            else:
-                parts.append(part)
-        _untagged = "/" + os.path.sep.join(parts)
-        _untagged = pathlib.Path(_untagged)
-        if not _untagged.parent.is_dir():
-            _untagged.parent.mkdir(parents=True)
-        _untagged.write_text(string)
-    for name in ("music.ly", "music.ily", "layout.ily"):
-        path = section_directory / name
-        if not path.exists():
-            continue
-        safekeeping = section_directory / f"{name}.original"
-        shutil.copyfile(path, safekeeping)
-        color_persistent_indicators(path, undo=True)
-        show_annotations(path, undo=True)
     print_main_task("Populating $REGRESSION/bw repository ...")
-    for name in ("music.ly", "music.ily", "layout.ily"):
-        path = section_directory / name
-        if not path.exists():
-            continue
-        with path.open() as pointer:
-            lines = pointer.readlines()
-        lines_ = []
-        for line in lines:
-            if line.strip().startswith("%! "):
-                continue
-            if line.strip().startswith("%%% "):
-                continue
-            if line.strip().startswith("%@% "):
-                continue
-            if line.strip().startswith("% ") and line.strip().endswith(":"):
-                continue
-            if line.endswith(" %@%\n"):
-                line = line.replace(" %@%", "")
-            lines_.append(line)
-        lines = lines_
-        string = "".join(lines)
-        parts = []
-        for part in path.parts:
-            if part == os.path.sep:
-                pass
-            elif part == "Scores":
-                parts.extend(["Regression", "bw"])
-            else:
-                parts.append(part)
-        _bw = "/" + os.path.sep.join(parts)
-        _bw = pathlib.Path(_bw)
-        if not _bw.parent.is_dir():
-            _bw.parent.mkdir(parents=True)
-        _bw.write_text(string)
-    for name in ("music.ly", "music.ily", "layout.ily"):
-        path = section_directory / name
-        if not path.exists():
-            continue
-        safekeeping = section_directory / f"{name}.original"
-        shutil.move(safekeeping, path)
+    texts = {_: texts[_] for _ in ("music.ly", "music.ily", "layout.ily") if _ in texts}
+    _submit_mirror_job(_write_untagged_and_bw_mirrors, section_directory, texts)
 
 
-def _remove_function_name_comments(section_directory):
+@staged
+def _remove_function_name_comments(section_directory, texts):
     print_file_handling("Removing function name comments ...")
     for name in ("music.ly", "music.ily", "layout.ily"):
-        path = section_directory / name
-        if not path.exists():
+        if name not in texts:
             continue
-        with path.open() as pointer:
-            lines = pointer.readlines()
         lines_ = []
-        for line in lines:
+        for line in io.StringIO(texts[name]):
             if line.strip().startswith("%! "):
                 if line.strip().endswith(")"):
                     continue
             lines_.append(line)
-        lines = lines_
-        string = "".join(lines)
-        path.write_text(string)
+        texts[name] = "".join(lines_)
 
 
 def _remove_lilypond_warnings(
@@ -1029,18 +1160,94 @@ def _remove_lilypond_warnings(
     path.write_text(text)
 
 
-def _remove_site_comments(section_directory):
+@staged
+def _remove_site_comments(section_directory, texts):
     print_file_handling("Removing site comments ...")
     for name in ("music.ly", "music.ily", "layout.ily"):
-        path = section_directory / name
-        if not path.exists():
+        if name not in texts:
             continue
-        remove_site_comments(path)
+        texts[name] = abjad.format.remove_site_comments(texts[name])
 
 
-def _show_music_annotations(
-    text: str, messages: list[str], *, undo: bool = False
-) -> str:
+def _run_lilypond_job(
+    ly_file_path: pathlib.Path,
+    lilypond_log_file_path: pathlib.Path,
+    timeout: int,
+) -> int:
+    lilypond_path = abjad.io.configuration["lilypond_path"]
+    if not lilypond_path:
+        lilypond_paths = abjad.io.find_executable("lilypond")
+        if lilypond_paths:
+            lilypond_path = str(lilypond_paths[0])
+        else:
+            lilypond_path = "lilypond"
+    command = [lilypond_path, *shlex.split(get_includes())]
+    command.append("-dno-point-and-click")
+    command.append(f"--output={ly_file_path.with_suffix('')}")
+    command.append(str(ly_file_path))
+    process = subprocess.Popen(
+        command,
+        cwd=ly_file_path.parent,
+        start_new_session=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    try:
+        output, _ = process.communicate(timeout=timeout or None)
+        exit_code = process.returncode
+        message = None
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        output, _ = process.communicate()
+        exit_code = 1
+        message = f"LilyPond failed: timed out after {timeout} seconds"
+    date = datetime.datetime.now().strftime("%c")
+    with lilypond_log_file_path.open("w") as pointer:
+        print(date, file=pointer)
+        print(output.decode(errors="ignore"), file=pointer)
+        if message is not None:
+            print(message, file=pointer)
+    postscript_path = ly_file_path.with_suffix(".ps")
+    if postscript_path.is_file():
+        postscript_path.unlink()
+    return exit_code
+
+
+def _set_semaphores(lilypond_semaphore, xelatex_semaphore):
+    global _lilypond_semaphore, _xelatex_semaphore
+    _lilypond_semaphore = lilypond_semaphore
+    _xelatex_semaphore = xelatex_semaphore
+
+
+def _show_annotations(rules: TagRules, *, undo: bool = False) -> None:
+    def _annotation_spanners(tags):
+        tags_ = (
+            baca.tags.MATERIAL_ANNOTATION_SPANNER,
+            baca.tags.MOMENT_ANNOTATION_SPANNER,
+            baca.tags.STAFF_HIGHLIGHT,
+        )
+        return bool(set(tags) & set(tags_))
+
+    rules.show_tag("annotation spanners", match=_annotation_spanners, undo=undo)
+
+    def _spacing(tags):
+        tags_ = (baca.tags.SPACING,)
+        return bool(set(tags) & set(tags_))
+
+    rules.show_tag(baca.tags.CLOCK_TIME, undo=undo)
+    rules.show_tag(baca.tags.FIGURE_LABEL, undo=undo)
+    rules.show_tag(baca.tags.INVISIBLE_MUSIC_COMMAND, undo=not undo)
+    rules.show_tag(baca.tags.INVISIBLE_MUSIC_COLORING, undo=undo)
+    rules.show_tag(baca.tags.LOCAL_MEASURE_NUMBER, undo=undo)
+    rules.show_tag(baca.tags.MEASURE_NUMBER, undo=undo)
+    rules.show_tag(baca.tags.MOCK_COLORING, undo=undo)
+    _show_music_annotations(rules, undo=undo)
+    rules.show_tag(baca.tags.NOT_YET_PITCHED_COLORING, undo=undo)
+    rules.show_tag("spacing", match=_spacing, undo=undo)
+    rules.show_tag(baca.tags.STAGE_NUMBER, undo=undo)
+
+
+def _show_music_annotations(rules: TagRules, *, undo: bool = False) -> None:
     name = "music annotation"
 
     def match(tags):
@@ -1052,15 +1259,23 @@ def _show_music_annotations(
         return bool(set(tags) & set(tags_))
 
     if not undo:
-        messages.append(f"Showing {name}s ...")
-        text = _activate_tags(text, match, name, messages)
-        text = _deactivate_tags(text, match_2, name, messages)
+        rules.message(f"Showing {name}s ...")
+        rules.activate(match, name)
+        rules.deactivate(match_2, name)
     else:
-        messages.append(f"Hiding {name}s ...")
-        text = _activate_tags(text, match_2, name, messages)
-        text = _deactivate_tags(text, match, name, messages)
-    messages.append("")
-    return text
+        rules.message(f"Hiding {name}s ...")
+        rules.activate(match_2, name)
+        rules.deactivate(match, name)
+    rules.message("")
+
+
+def _submit_mirror_job(function, *arguments) -> None:
+    global _mirror_executor
+    if _mirror_executor is None:
+        _mirror_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        atexit.register(wait_for_mirror_writes)
+    future = _mirror_executor.submit(function, *arguments)
+    _mirror_futures.append(future)
 
 
 def _trim_music_ly(ly):
@@ -1087,19 +1302,102 @@ def _trim_music_ly(ly):
     return lines
 
 
-def _write_music_ly(lilypond_file, music_ly):
-    abjad.persist.as_ly(lilypond_file, music_ly, tags=True)
+def _write_mirror_files(items):
+    for path, data in items:
+        if isinstance(data, str):
+            data = data.encode()
+        if path.is_file():
+            digest = hashlib.sha256(path.read_bytes()).digest()
+            if digest == hashlib.sha256(data).digest():
+                continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
 
 
-def _make_empty_mapping_proxy():
-    return types.MappingProxyType({})
+def _write_mirror_copies(items):
+    for path, data, status in items:
+        _write_mirror_files([(path, data)])
+        os.chmod(path, status.st_mode & 0o7777)
+        os.utime(path, ns=(status.st_atime_ns, status.st_mtime_ns))
+
+
+def _write_section_files(section_directory, texts, tags):
+    for name in ("music.ly", "music.ily", "layout.ily"):
+        if name not in texts:
+            continue
+        path = section_directory / name
+        if name == "music.ly":
+            print_file_handling(f"Writing {baca.path.trim(path)} ...")
+        _write_text_atomically(path, texts[name])
+    for name in ("layout.ily", "music.ily", "music.ly"):
+        _tags_file = section_directory / f".{name}.tags"
+        if name in tags:
+            _write_text_atomically(_tags_file, tags[name])
+        elif _tags_file.exists():
+            _tags_file.unlink()
+
+
+def _write_text_atomically(path, text):
+    temporary_path = path.with_name(f".{path.name}.tmp")
+    temporary_path.write_text(text)
+    os.replace(temporary_path, path)
+
+
+def _write_timing_json(section_directory, timing):
+    _timing_json = section_directory / ".timing.json"
+    print_file_handling(f"Writing {baca.path.trim(_timing_json)} ...", log_only=True)
+    dictionary = {
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "make_score": timing.make_score,
+        "postprocess": timing.postprocess,
+        "lilypond": timing.lilypond,
+        "stages": [dataclasses.asdict(_) for _ in timing.stages],
+    }
+    string = json.dumps(dictionary, indent=4) + "\n"
+    _timing_json.write_text(string)
+    for name, profile in timing.profiles.items():
+        _prof = section_directory / f".{name}.prof"
+        print_file_handling(f"Writing {baca.path.trim(_prof)} ...", log_only=True)
+        profile.dump_stats(str(_prof))
+
+
+def _write_untagged_and_bw_mirrors(section_directory, texts):
+    items = []
+    for name, text in texts.items():
+        lines = []
+        for line in io.StringIO(text):
+            if line.strip().startswith("% "):
+                if line.strip().endswith(":"):
+                    continue
+            lines.append(line)
+        string = abjad.tag.remove_tags("".join(lines))
+        path = _get_regression_path(section_directory / name, "untagged")
+        items.append((path, string))
+    rules = TagRules()
+    build = "builds" in section_directory.parts
+    _color_persistent_indicators(rules, build, undo=True)
+    _show_annotations(rules, undo=True)
+    for name, text in texts.items():
+        lines = []
+        for line in io.StringIO(rules.apply(text, [])):
+            if line.strip().startswith("%! "):
+                continue
+            if line.strip().startswith("%%% "):
+                continue
+            if line.strip().startswith("%@% "):
+                continue
+            if line.strip().startswith("% ") and line.strip().endswith(":"):
+                continue
+            if line.endswith(" %@%\n"):
+                line = line.replace(" %@%", "")
+            lines.append(line)
+        path = _get_regression_path(section_directory / name, "bw")
+        items.append((path, "".join(lines)))
+    _write_mirror_files(items)
 
 
-@dataclasses.dataclass(slots=True, order=True, unsafe_hash=True)
-class Timing:
-    lilypond: int | None = None
-    make_score: int | None = None
-    postprocess: int | None = None
+def _make_empty_mapping_proxy():
+    return types.MappingProxyType({})
 
 
 @dataclasses.dataclass(frozen=True, slots=True, order=True, unsafe_hash=True)
@@ -1183,12 +1481,15 @@ def arguments(arguments):
     known_arguments = (
         "--also-untagged",
         "--clicktrack",
+        "--cprofile",
         "--do-not-call-lilypond",
+        "--ignore-cache",
         "--layout",
         "--log-timing",
         "--midi",
         "--pdf",
         "--print-timing",
+        "--profile",
     )
     namespace = types.SimpleNamespace()
     for argument in known_arguments:
@@ -1218,6 +1519,25 @@ def argv():
     return list(sys.argv)
 
 
+def build_cache_is_current(
+    section_directory: pathlib.Path, arguments: types.SimpleNamespace
+) -> bool:
+    """
+    Is true when ``section_directory`` has a build cache matching ``arguments``.
+
+    Only build_sections() skips sections with a current build cache; running
+    music.py directly always builds the section.
+    """
+    _build_cache = section_directory / ".build_cache"
+    if section_directory.parent.name != "sections" or not _build_cache.is_file():
+        return False
+    outputs = _get_build_cache_outputs(section_directory, arguments)
+    if not all(_.is_file() for _ in outputs):
+        return False
+    key = _get_build_cache_key(section_directory, arguments)
+    return _build_cache.read_text().strip() == key
+
+
 def build_part(part_directory, keep_temporary_files=False):
     assert part_directory.parent.name.endswith("-parts"), repr(part_directory)
     part_pdf = part_directory / "part.pdf"
@@ -1236,6 +1556,67 @@ def build_part(part_directory, keep_temporary_files=False):
     run_xelatex(part_tex)
 
 
+def build_parts(
+    parts_directory: pathlib.Path,
+    *,
+    jobs: int | None = None,
+    keep_temporary_files: bool = False,
+    lilypond_jobs: int | None = None,
+    xelatex_jobs: int | None = None,
+) -> int:
+    """
+    Builds every part in ``parts_directory`` in a process pool.
+
+    At most ``lilypond_jobs`` LilyPond processes and ``xelatex_jobs`` xelatex
+    processes run at once, across all parts.
+
+    Each part runs in a fresh worker process, so module-level state and the
+    working directory never carry over from one part to the next.
+
+    Writes each part's output to ``.build.log``; returns the number of parts
+    that failed.
+    """
+    assert parts_directory.name.endswith("-parts"), repr(parts_directory)
+    part_directories = []
+    for path in sorted(parts_directory.glob("*")):
+        if path.name.startswith(".") or not path.is_dir():
+            continue
+        if (path / "layout.py").is_file():
+            part_directories.append(path)
+    context = multiprocessing.get_context("spawn")
+    lilypond_semaphore = context.Semaphore(lilypond_jobs or os.cpu_count())
+    xelatex_semaphore = context.Semaphore(xelatex_jobs or os.cpu_count())
+    failures = 0
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=context,
+        max_tasks_per_child=1,
+        initializer=_set_semaphores,
+        initargs=(lilypond_semaphore, xelatex_semaphore),
+    ) as executor:
+        future_to_part_directory = {}
+        for part_directory in part_directories:
+            print_main_task(f"Building {baca.path.trim(part_directory)} ...")
+            future = executor.submit(_build_part, part_directory, keep_temporary_files)
+            future_to_part_directory[future] = part_directory
+        for future in concurrent.futures.as_completed(future_to_part_directory):
+            part_directory = future_to_part_directory[future]
+            string = baca.path.trim(part_directory)
+            try:
+                exit_code = future.result()
+            except Exception as e:
+                print_error(f"{string}: {e!r}")
+                exit_code = 1
+            if exit_code == 0:
+                print_success(f"Built {string} ...")
+            else:
+                failures += 1
+                _build_log = part_directory / ".build.log"
+                print_error(f"Can not build {string} ...")
+                print_error(f"See {baca.path.trim(_build_log)} ...")
+    return failures
+
+
 def build_score(score_directory, keep_temporary_files=False):
     assert score_directory.name.endswith("-score"), repr(score_directory)
     assert score_directory.parent.name == "builds", repr(score_directory)
@@ -1265,6 +1646,104 @@ def build_score(score_directory, keep_temporary_files=False):
         sys.exit(1)
 
 
+def build_sections(
+    sections_directory: pathlib.Path,
+    arguments: list[str],
+    *,
+    jobs: int | None = None,
+    poll_interval: float = 0.1,
+) -> int:
+    """
+    Builds every section in ``sections_directory`` by running each ``music.py``
+    in a process pool.
+
+    A section reads its predecessor's ``.metadata`` in ``read_environment()``.
+    So each section is submitted as soon as its predecessor has rewritten
+    ``.metadata`` in ``persist_lilypond_file()``, which overlaps one section's
+    Python with the LilyPond and file handling of the sections before it.
+
+    Each section runs in a fresh worker process, so module-level state and the
+    working directory never carry over from one section to the next.
+
+    Writes each section's output to ``.build.log``; returns the number of
+    sections that failed or were not built.
+    """
+    assert sections_directory.name == "sections", repr(sections_directory)
+    section_directories = []
+    for path in sorted(sections_directory.glob("*")):
+        if path.name.startswith(".") or not path.is_dir():
+            continue
+        if (path / "music.py").is_file():
+            section_directories.append(path)
+
+    def get_mtime(section_directory):
+        path = section_directory / ".metadata"
+        return path.stat().st_mtime_ns if path.is_file() else None
+
+    initial_mtimes = [get_mtime(_) for _ in section_directories]
+    metadata_written = [False for _ in section_directories]
+    exit_codes: list[int | None] = [None for _ in section_directories]
+    future_to_index = {}
+    next_index = 0
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as executor:
+        while True:
+            while next_index < len(section_directories):
+                if 0 < next_index and not metadata_written[next_index - 1]:
+                    break
+                section_directory = section_directories[next_index]
+                print_main_task(f"Building {baca.path.trim(section_directory)} ...")
+                music_py = str(section_directory / "music.py")
+                future = executor.submit(_build_section, music_py, arguments)
+                future_to_index[future] = next_index
+                next_index += 1
+            if not future_to_index:
+                break
+            done, _ = concurrent.futures.wait(
+                future_to_index,
+                timeout=poll_interval,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done:
+                index = future_to_index.pop(future)
+                section_directory = section_directories[index]
+                string = baca.path.trim(section_directory)
+                try:
+                    exit_code = future.result()
+                except Exception as e:
+                    print_error(f"{string}: {e!r}")
+                    exit_code = 1
+                exit_codes[index] = exit_code
+                if exit_code == 0:
+                    metadata_written[index] = True
+                    print_success(f"Built {string} ...")
+                else:
+                    _build_log = section_directory / ".build.log"
+                    print_error(f"Can not build {string} ...")
+                    print_error(f"See {baca.path.trim(_build_log)} ...")
+            for index in future_to_index.values():
+                if get_mtime(section_directories[index]) != initial_mtimes[index]:
+                    metadata_written[index] = True
+    return sum(1 for _ in exit_codes if _ != 0)
+
+
+def clear_build_cache(directory: pathlib.Path) -> list[pathlib.Path]:
+    if directory.name == "sections":
+        paths = sorted(directory.glob("*/.build_cache"))
+    else:
+        paths = [directory / ".build_cache"]
+    removed = []
+    for path in paths:
+        if path.is_file():
+            print_file_remove(f"Removing {baca.path.trim(path)} ...")
+            path.unlink()
+            removed.append(path)
+    return removed
+
+
 def collect_temporary_files(_sections_directory):
     contents_directory = baca.path.get_contents_directory(_sections_directory)
     sections_directory = contents_directory / "sections"
@@ -1300,9 +1779,10 @@ def color_persistent_indicators(file, *, undo=False):
         print_always("Must call on file in section directory ...")
         sys.exit(1)
     messages = []
-    text = file.read_text()
     build = "builds" in file.parts
-    text = _color_persistent_indicators(text, messages, build, undo=undo)
+    rules = TagRules()
+    _color_persistent_indicators(rules, build, undo=undo)
+    text = rules.apply(file.read_text(), messages)
     file.write_text(text)
     return messages
 
@@ -1377,13 +1857,10 @@ def handle_build_tags(_sections_directory):
         assert build_directory.parent.parent.name == "builds", repr(build_directory)
         build_identifier = build_directory.parent.name + "_" + build_directory.name
         build_identifier = abjad.string.to_shout_case(build_identifier)
+    metadata = baca.path.get_metadata(build_directory)
+    bol_measure_numbers = metadata.get("bol_measure_numbers")
+    final_measure_number = metadata.get("final_measure_number")
     for file in sorted(_sections_directory.glob("*ly")):
-        bol_measure_numbers = baca.path.get_metadata(build_directory).get(
-            "bol_measure_numbers"
-        )
-        final_measure_number = baca.path.get_metadata(build_directory).get(
-            "final_measure_number"
-        )
         messages = []
         assert "sections" not in file.parts
         assert "builds" in file.parts
@@ -1392,73 +1869,38 @@ def handle_build_tags(_sections_directory):
         else:
             assert "-parts" in str(file)
             build_type = "PARTS"
-        text = file.read_text()
-        text = _handle_edition_tags(text, messages, build_identifier, build_type)
-        text = _handle_fermata_bar_lines(
-            text, messages, bol_measure_numbers, final_measure_number
-        )
-        text = _handle_shifted_clefs(text, messages, bol_measure_numbers)
-        text = _handle_mol_tags(
-            text, messages, bol_measure_numbers, final_measure_number
-        )
+        rules = TagRules()
+        _handle_edition_tags(rules, build_identifier, build_type)
+        _handle_fermata_bar_lines(rules, bol_measure_numbers, final_measure_number)
+        _handle_shifted_clefs(rules, bol_measure_numbers)
+        _handle_mol_tags(rules, bol_measure_numbers, final_measure_number)
         build = "builds" in file.parts
-        text = _color_persistent_indicators(text, messages, build, undo=True)
-        text = _show_music_annotations(text, messages, undo=True)
-        text = _join_broken_spanners(text, messages)
-        text = show_tag(
-            text,
+        _color_persistent_indicators(rules, build, undo=True)
+        _show_music_annotations(rules, undo=True)
+        _join_broken_spanners(rules)
+        rules.show_tag(
             "left-broken-should-deactivate",
-            messages,
             match=match_left_broken_should_deactivate,
             undo=True,
         )
         if file.name != final_ily_name:
-            text = show_tag(text, baca.tags.ANCHOR_NOTE, messages)
-            text = show_tag(text, baca.tags.ANCHOR_SKIP, messages)
-            text = show_tag(
-                text,
-                baca.tags.ANCHOR_NOTE,
-                messages,
-                prepend_empty_chord=True,
-                undo=True,
-            )
-            text = show_tag(
-                text,
-                baca.tags.ANCHOR_SKIP,
-                messages,
-                prepend_empty_chord=True,
-                undo=True,
-            )
-            text = show_tag(
-                text,
+            rules.show_tag(baca.tags.ANCHOR_NOTE)
+            rules.show_tag(baca.tags.ANCHOR_SKIP)
+            rules.show_tag(baca.tags.ANCHOR_NOTE, prepend_empty_chord=True, undo=True)
+            rules.show_tag(baca.tags.ANCHOR_SKIP, prepend_empty_chord=True, undo=True)
+            rules.show_tag(
                 "anchor-should-activate",
-                messages,
                 match=match_anchor_should_activate,
             )
-            text = show_tag(
-                text,
+            rules.show_tag(
                 "anchor-should-deactivate",
-                messages,
                 match=match_anchor_should_deactivate,
                 undo=True,
             )
-            text = show_tag(
-                text,
-                baca.tags.EOS_STOP_MM_SPANNER,
-                messages,
-            )
-        text = show_tag(
-            text,
-            baca.tags.METRIC_MODULATION_IS_STRIPPED,
-            messages,
-            undo=True,
-        )
-        text = show_tag(
-            text,
-            baca.tags.METRIC_MODULATION_IS_SCALED,
-            messages,
-            undo=True,
-        )
+            rules.show_tag(baca.tags.EOS_STOP_MM_SPANNER)
+        rules.show_tag(baca.tags.METRIC_MODULATION_IS_STRIPPED, undo=True)
+        rules.show_tag(baca.tags.METRIC_MODULATION_IS_SCALED, undo=True)
+        text = rules.apply(file.read_text(), messages)
         file.write_text(text)
         _tags = _sections_directory / f".{file.name}.tags"
         print_file_handling(f"Writing {baca.path.trim(_tags)} ...", log_only=True)
@@ -1471,95 +1913,36 @@ def handle_part_tags(_sections_directory, part_identifier=None):
     if not _sections_directory.parent.parent.name.endswith("-parts"):
         print_always("Must call in part directory ...")
         sys.exit(1)
+    rules = TagRules()
+    rules.show_tag(baca.tags.ONLY_PARTS)
+    rules.show_tag(baca.tags.NOT_PARTS, undo=True)
+    rules.show_tag(baca.tags.HIDE_IN_PARTS, undo=True)
+    if part_identifier is not None:
+        parts_directory = _sections_directory.parent
+        parts_directory_name = abjad.string.to_shout_case(parts_directory.name)
+        name = f"{parts_directory_name}_{part_identifier}"
+        rules.show_tag(abjad.Tag(f"+{name}"))
+        rules.show_tag(abjad.Tag(f"-{name}"), undo=True)
+    rules.show_tag(baca.tags.METRIC_MODULATION_IS_SCALED, undo=True)
+    rules.show_tag(baca.tags.METRIC_MODULATION_IS_NOT_SCALED, undo=True)
+    rules.show_tag(baca.tags.METRIC_MODULATION_IS_STRIPPED)
+    # HACK TO HIDE ALL POST-FERMATA-MEASURE TRANSPARENT BAR LINES;
+    # this only works if parts contain no EOL fermata measure:
+    rules.show_tag(baca.tags.FERMATA_MEASURE, undo=True)
+    rules.show_tag(baca.tags.NOT_TOPMOST)
+    rules.show_tag(baca.tags.FERMATA_MEASURE_EMPTY_BAR_EXTENT, undo=True)
+    rules.show_tag(baca.tags.FERMATA_MEASURE_NEXT_BAR_EXTENT, undo=True)
+    rules.show_tag(baca.tags.FERMATA_MEASURE_RESUME_BAR_EXTENT, undo=True)
+    rules.show_tag(baca.tags.EXPLICIT_BAR_EXTENT, undo=True)
     for file in sorted(_sections_directory.glob("*ily")):
         messages = []
-        text = file.read_text()
-        text = show_tag(
-            text,
-            baca.tags.ONLY_PARTS,
-            messages,
-        )
-        text = show_tag(
-            text,
-            baca.tags.NOT_PARTS,
-            messages,
-            undo=True,
-        )
-        text = show_tag(
-            text,
-            baca.tags.HIDE_IN_PARTS,
-            messages,
-            undo=True,
-        )
-        if part_identifier is not None:
-            parts_directory = _sections_directory.parent
-            parts_directory_name = abjad.string.to_shout_case(parts_directory.name)
-            name = f"{parts_directory_name}_{part_identifier}"
-            text = show_tag(
-                text,
-                f"+{name}",
-                messages,
-            )
-            text = show_tag(
-                text,
-                f"-{name}",
-                messages,
-                undo=True,
-            )
-        text = show_tag(
-            text,
-            baca.tags.METRIC_MODULATION_IS_SCALED,
-            messages,
-            undo=True,
-        )
-        text = show_tag(
-            text,
-            baca.tags.METRIC_MODULATION_IS_NOT_SCALED,
-            messages,
-            undo=True,
-        )
-        text = show_tag(
-            text,
-            baca.tags.METRIC_MODULATION_IS_STRIPPED,
-            messages,
-        )
-        # HACK TO HIDE ALL POST-FERMATA-MEASURE TRANSPARENT BAR LINES;
-        # this only works if parts contain no EOL fermata measure:
-        text = show_tag(
-            text,
-            baca.tags.FERMATA_MEASURE,
-            messages,
-            undo=True,
-        )
-        text = show_tag(
-            text,
-            baca.tags.NOT_TOPMOST,
-            messages,
-        )
-        text = show_tag(
-            text,
-            baca.tags.FERMATA_MEASURE_EMPTY_BAR_EXTENT,
-            messages,
-            undo=True,
-        )
-        text = show_tag(
-            text,
-            baca.tags.FERMATA_MEASURE_NEXT_BAR_EXTENT,
-            messages,
-            undo=True,
-        )
-        text = show_tag(
-            text,
-            baca.tags.FERMATA_MEASURE_RESUME_BAR_EXTENT,
-            messages,
-            undo=True,
-        )
-        text = show_tag(
-            text,
-            baca.tags.EXPLICIT_BAR_EXTENT,
-            messages,
-            undo=True,
-        )
+        text = rules.apply(file.read_text(), messages)
+        file.write_text(text)
+        _tags = _sections_directory / f".{file.name}.tags"
+        print_file_handling(f"Writing {baca.path.trim(_tags)} ...", log_only=True)
+        text = "\n".join(messages) + "\n"
+        with _tags.open("a") as pointer:
+            pointer.write(text)
 
 
 def interpret_build_music(
@@ -1602,10 +1985,15 @@ def interpret_build_music(
         parts = list(_sections_directory.parts)
         assert parts[4] == "Scores"
         parts[4:5] = ["Regression", "scorebuilds"]
-        _builds_sections_directory = os.sep + os.sep.join(parts[1:])
-        shutil.copytree(
-            _sections_directory, _builds_sections_directory, dirs_exist_ok=True
-        )
+        _builds_sections_directory = pathlib.Path(os.sep + os.sep.join(parts[1:]))
+        items = []
+        for path in sorted(_sections_directory.rglob("*")):
+            if path.is_file():
+                path_ = _builds_sections_directory / path.relative_to(
+                    _sections_directory
+                )
+                items.append((path_, path.read_bytes(), path.stat()))
+        _submit_mirror_job(_write_mirror_copies, items)
     remove = None
     if _sections_directory.is_dir() and not keep_temporary_files:
         remove = _sections_directory
@@ -1665,34 +2053,30 @@ def persist_lilypond_file(
     assert isinstance(timing, Timing), repr(timing)
     assert isinstance(lilypond_file, abjad.LilyPondFile), repr(lilypond_file)
     assert isinstance(metadata, types.MappingProxyType), repr(metadata)
-    dictionary = dict(metadata)
-    baca.section.sort_dictionary(dictionary)
-    metadata = types.MappingProxyType(dictionary)
-    metadata_file = section_directory / ".metadata"
-    print_file_handling(f"Writing {baca.path.trim(metadata_file)} ...")
-    baca.path.write_metadata_py(section_directory, metadata)
-    if arguments.clicktrack:
-        path = section_directory / "clicktrack.midi"
-        mtime = os.path.getmtime(path) if path.is_file() else None
-        _make_section_clicktrack(lilypond_file, mtime, section_directory)
-    if arguments.midi:
-        path = section_directory / "music.midi"
-        mtime = os.path.getmtime(path) if path.is_file() else None
-        _make_section_midi(lilypond_file, mtime, section_directory)
-    if arguments.pdf:
-        path = section_directory / "music.pdf"
-        mtime = os.path.getmtime(path) if path.is_file() else None
-        _make_section_pdf(
-            lilypond_file,
-            mtime,
+    start_time = int(time.time())
+    _build_cache = section_directory / ".build_cache"
+    if _build_cache.exists():
+        _build_cache.unlink()
+    with _timing.activate(timing):
+        _persist_lilypond_file(
+            arguments,
             section_directory,
             timing,
-            also_untagged=arguments.also_untagged,
-            do_not_call_lilypond=arguments.do_not_call_lilypond,
+            lilypond_file,
+            metadata,
             lilypond_timeout=lilypond_timeout,
-            log_timing=arguments.log_timing,
-            print_timing=arguments.print_timing,
         )
+    if arguments.log_timing or timing.profile or timing.cprofile:
+        _write_timing_json(section_directory, timing)
+    outputs = _get_build_cache_outputs(section_directory, arguments)
+    if section_directory.parent.name == "sections" and all(
+        _.is_file() and start_time <= os.path.getmtime(_) for _ in outputs
+    ):
+        print_file_handling(
+            f"Writing {baca.path.trim(_build_cache)} ...", log_only=True
+        )
+        key = _get_build_cache_key(section_directory, arguments)
+        _build_cache.write_text(key + "\n")
 
 
 def print_all_timing(timing):
@@ -1774,7 +2158,10 @@ def read_environment(
         section_directory=section_directory,
         section_not_included_in_score=section_not_included_in_score,
         section_number=section_directory.name,
-        timing=Timing(),
+        timing=Timing(
+            cprofile=bool(arguments_.cprofile),
+            profile=bool(arguments_.profile),
+        ),
     )
     return environment
 
@@ -1794,6 +2181,12 @@ def run_lilypond(
     pdf_mtime: float | None = None,
     remove: pathlib.Path | None = None,
 ):
+    """
+    Runs LilyPond on ``ly_file_path`` in its own process group.
+
+    Kills the process group when ``lilypond_timeout`` is nonzero and LilyPond runs
+    longer; no signals are used, so any thread may call this.
+    """
     assert isinstance(ly_file_path, pathlib.Path), repr(ly_file_path)
     assert ly_file_path.exists(), repr(ly_file_path)
     if pdf_mtime is not None:
@@ -1802,43 +2195,41 @@ def run_lilypond(
         assert isinstance(remove, pathlib.Path), repr(remove)
     string = f"Calling LilyPond (with includes) on {baca.path.trim(ly_file_path)} ..."
     print_file_handling(string)
-    directory = ly_file_path.parent
+    ly_file_path = ly_file_path.resolve()
     pdf = ly_file_path.with_suffix(".pdf")
     lilypond_log_file_name = "." + ly_file_path.name + ".log"
-    lilypond_log_file_path = directory / lilypond_log_file_name
-    exit_code = 0
-    with abjad.contextmanagers.temporary_directory_change(directory=directory):
-        flags = get_includes()
-        try:
-            signal.alarm(lilypond_timeout)
-            exit_code = abjad.io.run_lilypond(
-                str(ly_file_path),
-                flags=flags,
-                lilypond_log_file_path=lilypond_log_file_path,
-            )
-            signal.alarm(0)
-        except TimeoutException as e:
-            print(e)
-        _remove_lilypond_warnings(
-            lilypond_log_file_path,
-            crescendo_too_small=True,
-            decrescendo_too_small=True,
-            overwriting_glissando=True,
+    lilypond_log_file_path = ly_file_path.parent / lilypond_log_file_name
+    with _lilypond_semaphore or contextlib.nullcontext():
+        exit_code = _run_lilypond_job(
+            ly_file_path, lilypond_log_file_path, lilypond_timeout
         )
-        _display_lilypond_log_errors(lilypond_log_file_path)
-        if remove is not None:
-            print_file_remove(f"Removing {baca.path.trim(remove)} ...")
-            shutil.rmtree(str(remove))
-        if exit_code == 0 and pdf.is_file():
-            if pdf_mtime is not None and pdf_mtime < os.path.getmtime(pdf):
-                print_success(f"Modified {baca.path.trim(pdf)} ...")
-            else:
-                print_success(f"Found {baca.path.trim(pdf)} ...")
-        assert lilypond_log_file_path.exists()
+    _remove_lilypond_warnings(
+        lilypond_log_file_path,
+        crescendo_too_small=True,
+        decrescendo_too_small=True,
+        overwriting_glissando=True,
+    )
+    _display_lilypond_log_errors(lilypond_log_file_path)
+    if remove is not None:
+        print_file_remove(f"Removing {baca.path.trim(remove)} ...")
+        shutil.rmtree(str(remove))
+    if exit_code == 0 and pdf.is_file():
+        if pdf_mtime is not None and pdf_mtime < os.path.getmtime(pdf):
+            print_success(f"Modified {baca.path.trim(pdf)} ...")
+        else:
+            print_success(f"Found {baca.path.trim(pdf)} ...")
+    assert lilypond_log_file_path.exists()
     return exit_code
 
 
-def run_xelatex(tex_file_path):
+def run_xelatex(tex_file_path, *, maximum_runs=2):
+    """
+    Runs xelatex until ``.aux`` output converges, at most ``maximum_runs`` times.
+
+    Keeps ``.aux`` output as ``.<stem>.aux`` between builds; unchanged sources
+    then converge after a single run.
+    """
+    assert 1 <= maximum_runs, repr(maximum_runs)
     if not tex_file_path.is_file():
         print_error(f"Can not find {baca.path.trim(tex_file_path)} ...")
         return
@@ -1856,17 +2247,33 @@ def run_xelatex(tex_file_path):
     command += f" --jobname={tex_file_path.stem}"
     command += f" -output-directory={tex_file_path.parent} {tex_file_path}"
     command += f" 1>{tex_file_path.stem}.log 2>&1"
-    command_called_twice = f"{command}; {command}"
+    aux = tex_file_path.with_suffix(".aux")
+    _aux = tex_file_path.parent / f".{aux.name}"
     with abjad.contextmanagers.temporary_directory_change(
         directory=tex_file_path.parent
     ):
-        subprocess.call(command_called_twice, shell=True)
+        if _aux.is_file():
+            shutil.copyfile(str(_aux), str(aux))
+        with _xelatex_semaphore or contextlib.nullcontext():
+            for run in range(1, maximum_runs + 1):
+                previous = aux.read_bytes() if aux.is_file() else None
+                subprocess.call(command, shell=True)
+                current = aux.read_bytes() if aux.is_file() else None
+                if current == previous:
+                    break
+        string = abjad.string.pluralize("run", run)
+        print_file_handling(
+            f"Called {executable_name} {run} {string} ...", log_only=True
+        )
         source = tex_file_path.with_suffix(".log")
         name = "." + tex_file_path.stem + ".tex_file_path.log"
         target = tex_file_path.parent / name
         shutil.move(str(source), str(target))
+        if aux.is_file():
+            shutil.move(str(aux), str(_aux))
         for path in sorted(tex_file_path.parent.glob("*.aux")):
-            path.unlink()
+            if not path.name.startswith("."):
+                path.unlink()
     pdf = tex_file_path.with_suffix(".pdf")
     if pdf.is_file():
         print_success(f"Found {baca.path.trim(pdf)} ...")
@@ -1881,39 +2288,9 @@ def show_annotations(file, *, undo=False):
         print_always("Must call on file in section directory ...")
         sys.exit(1)
     messages = []
-
-    def _annotation_spanners(tags):
-        tags_ = (
-            baca.tags.MATERIAL_ANNOTATION_SPANNER,
-            baca.tags.MOMENT_ANNOTATION_SPANNER,
-            baca.tags.STAFF_HIGHLIGHT,
-        )
-        return bool(set(tags) & set(tags_))
-
-    text = file.read_text()
-    text = show_tag(
-        text,
-        "annotation spanners",
-        messages,
-        match=_annotation_spanners,
-        undo=undo,
-    )
-
-    def _spacing(tags):
-        tags_ = (baca.tags.SPACING,)
-        return bool(set(tags) & set(tags_))
-
-    text = show_tag(text, baca.tags.CLOCK_TIME, messages, undo=undo)
-    text = show_tag(text, baca.tags.FIGURE_LABEL, messages, undo=undo)
-    text = show_tag(text, baca.tags.INVISIBLE_MUSIC_COMMAND, messages, undo=not undo)
-    text = show_tag(text, baca.tags.INVISIBLE_MUSIC_COLORING, messages, undo=undo)
-    text = show_tag(text, baca.tags.LOCAL_MEASURE_NUMBER, messages, undo=undo)
-    text = show_tag(text, baca.tags.MEASURE_NUMBER, messages, undo=undo)
-    text = show_tag(text, baca.tags.MOCK_COLORING, messages, undo=undo)
-    text = text = _show_music_annotations(text, messages, undo=undo)
-    text = show_tag(text, baca.tags.NOT_YET_PITCHED_COLORING, messages, undo=undo)
-    text = show_tag(text, "spacing", messages, match=_spacing, undo=undo)
-    text = show_tag(text, baca.tags.STAGE_NUMBER, messages, undo=undo)
+    rules = TagRules()
+    _show_annotations(rules, undo=undo)
+    text = rules.apply(file.read_text(), messages)
     file.write_text(text)
     return messages
 
@@ -1927,35 +2304,9 @@ def show_tag(
     prepend_empty_chord: bool = False,
     undo: bool = False,
 ) -> str:
-    if match is not None:
-        assert callable(match)
-    if isinstance(tag, str):
-        assert match is not None, repr(match)
-        name = tag
-    else:
-        assert isinstance(tag, abjad.Tag), repr(tag)
-        name = tag.string
-
-    if match is None:
-
-        def match(tags):
-            tags_ = [tag]
-            return bool(set(tags) & set(tags_))
-
-    if not undo:
-        messages.append(f"Showing {name} tags ...")
-        text = _activate_tags(text, match, name, messages)
-    else:
-        messages.append(f"Hiding {name} tags ...")
-        text = _deactivate_tags(
-            text,
-            match,
-            name,
-            messages,
-            prepend_empty_chord=prepend_empty_chord,
-        )
-    messages.append("")
-    return text
+    rules = TagRules()
+    rules.show_tag(tag, match=match, prepend_empty_chord=prepend_empty_chord, undo=undo)
+    return rules.apply(text, messages)
 
 
 def timed(timing_attribute):
@@ -1974,10 +2325,25 @@ def timed(timing_attribute):
                 for argument in arguments:
                     if isinstance(argument, Environment):
                         timing = argument.timing
-            with abjad.contextmanagers.Timer() as timer:
-                result = function(*arguments, **keywords)
-            if timing is not None:
-                setattr(timing, timing_attribute, int(timer.elapsed_time()))
+            if timing is None:
+                with abjad.contextmanagers.Timer() as timer:
+                    result = function(*arguments, **keywords)
+                return result
+            profile = None
+            if timing.cprofile:
+                profile = cProfile.Profile()
+            with _timing.activate(timing):
+                with abjad.contextmanagers.Timer() as timer:
+                    if profile is not None:
+                        profile.enable()
+                    try:
+                        result = function(*arguments, **keywords)
+                    finally:
+                        if profile is not None:
+                            profile.disable()
+            setattr(timing, timing_attribute, int(timer.elapsed_time()))
+            if profile is not None:
+                timing.profiles[timing_attribute] = profile
             return result
 
         return wrapper
@@ -1985,6 +2351,21 @@ def timed(timing_attribute):
     return decorator
 
 
+def wait_for_mirror_writes() -> int:
+    """
+    Waits for queued $REGRESSION mirror writes; returns number of failed writes.
+    """
+    failures = 0
+    while _mirror_futures:
+        future = _mirror_futures.pop(0)
+        try:
+            future.result()
+        except Exception as e:
+            print_error(f"Can not populate $REGRESSION mirror: {e!r}")
+            failures += 1
+    return failures
+
+
 def write_bol_metadata(directory, bol_measure_numbers):
     _metadata_path = directory / ".metadata"
     message = f"Writing {baca.path.trim(_metadata_path)} BOL measure numbers ..."
@@ -1932,9 +1932,70 @@ Constellation.
 
 """
 
+import functools
+import itertools
+
 import abjad
 
 
+def _get_range_bounds(range_):
+    start_pitch, stop_pitch = range_.start_pitch(), range_.stop_pitch()
+    start = -1000 if start_pitch is None else start_pitch.number()
+    stop = 1000 if stop_pitch is None else stop_pitch.number()
+    return start, stop
+
+
+@functools.lru_cache(maxsize=256)
+def _get_transpositions(part, range_string):
+    """
+    Gets octave transpositions of ``part`` in range as sorted number tuples.
+
+    Only the lowest and highest pitch of each candidate is checked; pitches
+    more than two semitones inside the range bounds pass without spelling.
+    """
+    range_ = abjad.PitchRange(range_string)
+    start, stop = _get_range_bounds(range_)
+
+    def contains(number):
+        if start + 2 < number < stop - 2:
+            return True
+        if number < start - 2 or stop + 2 < number:
+            return False
+        return abjad.NamedPitch(number) in range_
+
+    lowest, highest = part[0], part[-1]
+    intervals = []
+    interval = -12
+    while contains(lowest + interval) and contains(highest + interval):
+        intervals.append(interval)
+        interval -= 12
+    intervals.reverse()
+    interval = 0
+    while contains(lowest + interval) and contains(highest + interval):
+        intervals.append(interval)
+        interval += 12
+    return tuple(tuple(_ + interval for _ in part) for interval in intervals)
+
+
+def _get_constellation_numbers(generator, range_):
+    assert isinstance(generator, list), repr(generator)
+    range_string = abjad.PitchRange(range_).range_string()
+    transpositions = []
+    for part in generator:
+        assert isinstance(part, list)
+        part = tuple(sorted({abjad.NumberedPitch(_).number() for _ in part}))
+        transpositions.append(_get_transpositions(part, range_string))
+    for sequence in itertools.product(*transpositions):
+        yield sorted(itertools.chain.from_iterable(sequence))
+
+
+@functools.lru_cache(maxsize=256)
+def _constellate(generator, range_string):
+    generator = [list(_) for _ in generator]
+    numbers = _get_constellation_numbers(generator, range_string)
+    return tuple(abjad.PitchSet(_) for _ in numbers)
+
+
 def constellate(generator, range_):
     """
     Constellates ``generator`` in ``range_``.
@@ -1968,40 +2029,13 @@ def constellate(generator, range_):
         PitchSet([7, 15, 17, 28, 32, 35])
         PitchSet([19, 27, 28, 29, 32, 35])
 
+    Caches sets per generator and range; use ``iterate_constellation()`` to
+    walk sets one at a time without materializing the constellation.
     """
     assert isinstance(generator, list), repr(generator)
-    range_ = abjad.PitchRange(range_)
-    transpositions = []
-    for part in generator:
-        assert isinstance(part, list)
-        part = abjad.PitchSet(part)
-        transpositions_ = []
-        interval = -12
-        while True:
-            candidate = type(part)(_.transpose(interval) for _ in part)
-            if all(abjad.NamedPitch(pitch) in range_ for pitch in candidate):
-                transpositions_.append(candidate)
-                interval -= 12
-            else:
-                break
-        transpositions_.reverse()
-        interval = 0
-        while True:
-            candidate = type(part)(_.transpose(interval) for _ in part)
-            if all(abjad.NamedPitch(pitch) in range_ for pitch in candidate):
-                transpositions_.append(candidate)
-                interval += 12
-            else:
-                break
-        transpositions_ = [[_.number() for _ in set_] for set_ in transpositions_]
-        transpositions.append(transpositions_)
-    sequences = abjad.enumerate.outer_product(transpositions)
-    sets = []
-    for sequence in sequences:
-        numbers = abjad.sequence.flatten(sequence)
-        set_ = abjad.PitchSet(numbers)
-        sets.append(set_)
-    return sets
+    key = tuple(tuple(_) for _ in generator)
+    range_string = abjad.PitchRange(range_).range_string()
+    return list(_constellate(key, range_string))
 
 
 def find_pivot(constellation_a, constellation_b):
@@ -2015,6 +2049,22 @@ def find_pivot(constellation_a, constellation_b):
             return set_
 
 
+def iterate_constellation(generator, range_):
+    """
+    Iterates sets of ``generator`` in ``range_`` without building them all.
+
+    ..  container:: example
+
+        >>> generator = [[4, 8, 11], [7, 15, 17]]
+        >>> sets = baca.constellation.iterate_constellation(generator, "[C4, C#7]")
+        >>> next(sets)
+        PitchSet([4, 7, 8, 11, 15, 17])
+
+    """
+    for numbers in _get_constellation_numbers(generator, range_):
+        yield abjad.PitchSet(numbers)
+
+
 class Constellation:
     """
     Constellation.
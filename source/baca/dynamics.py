@@ -1,3 +1,5 @@
+import functools
+
 import abjad
 
 
@@ -228,11 +230,10 @@ class SchemeManifest:
             'p'
 
         """
-        for dynamic_, steady_state in self._dynamics:
-            if dynamic_ == dynamic:
-                return steady_state
-            if dynamic_ == "baca-" + dynamic:
-                return steady_state
+        if dynamic in _dynamic_to_steady_state:
+            return _dynamic_to_steady_state[dynamic]
+        if "baca-" + dynamic in _dynamic_to_steady_state:
+            return _dynamic_to_steady_state["baca-" + dynamic]
         raise KeyError(dynamic)
 
 
@@ -281,9 +282,13 @@ def linear(bounds: str, *, effort: bool = False) -> str:
     return string
 
 
-def make_dynamic(string: str) -> abjad.Dynamic | abjad.StartHairpin | abjad.StopHairpin:
-    assert isinstance(string, str), repr(string)
-    scheme_manifest = SchemeManifest()
+_dynamic_to_steady_state = dict(SchemeManifest._dynamics)
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_dynamic(
+    string: str,
+) -> abjad.Dynamic | abjad.StartHairpin | abjad.StopHairpin:
     indicator: abjad.Dynamic | abjad.StartHairpin | abjad.StopHairpin
     if "_" in string:
         raise Exception(f"use hyphens instead of underscores ({string!r}).")
@@ -336,8 +341,8 @@ def make_dynamic(string: str) -> abjad.Dynamic | abjad.StartHairpin | abjad.Stop
         dynamic = string.split("-")[0]
         command = rf"\baca-{dynamic}-whiteout"
         indicator = abjad.Dynamic(dynamic, command=command)
-    elif "baca-" + string in scheme_manifest.dynamics():
-        name = scheme_manifest.dynamic_to_steady_state(string)
+    elif "baca-" + string in _dynamic_to_steady_state:
+        name = _dynamic_to_steady_state["baca-" + string]
         command = "\\baca-" + string
         pieces = string.split("-")
         if pieces[0] in ("sfz", "sffz", "sfffz"):
@@ -374,3 +379,8 @@ def make_dynamic(string: str) -> abjad.Dynamic | abjad.StartHairpin | abjad.Stop
     prototype = (abjad.Dynamic, abjad.StartHairpin, abjad.StopHairpin)
     assert isinstance(indicator, prototype), repr(indicator)
     return indicator
+
+
+def make_dynamic(string: str) -> abjad.Dynamic | abjad.StartHairpin | abjad.StopHairpin:
+    assert isinstance(string, str), repr(string)
+    return _make_dynamic(string)
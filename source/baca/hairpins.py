@@ -4,6 +4,7 @@ hairpins.py.
 
 import collections
 import dataclasses
+import functools
 from inspect import currentframe as _frame
 
 import abjad
@@ -111,6 +112,100 @@ def _bookend_final_cyclic_piece(
     return wrappers_
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_exact_hairpin_descriptor(
+    descriptor: str,
+) -> tuple[ExactHairpinSpecifier, ...]:
+    specifiers = []
+    for string in descriptor.split():
+        start_dynamic, spanner_start, stop_indicator = None, None, None
+        for shape in known_shapes:
+            if shape in string:
+                start_dynamic_string, stop_indicator_string = string.split(shape)
+                if start_dynamic_string:
+                    start_dynamic = _dynamics.make_dynamic(start_dynamic_string)
+                spanner_start = _dynamics.make_dynamic(shape)
+                if stop_indicator_string:
+                    stop_indicator = _dynamics.make_dynamic(stop_indicator_string)
+                break
+        else:
+            if "+" in string:
+                start_dynamic_string, stop_indicator_string = string.split("+")
+                if start_dynamic_string:
+                    start_dynamic = _dynamics.make_dynamic(start_dynamic_string)
+                if stop_indicator_string:
+                    stop_indicator = _dynamics.make_dynamic(stop_indicator_string)
+            elif string == "!":
+                stop_indicator = _dynamics.make_dynamic(string)
+            else:
+                start_dynamic = _dynamics.make_dynamic(string)
+        assert isinstance(start_dynamic, abjad.Dynamic | abjad.StopHairpin | type(None))
+        assert isinstance(spanner_start, abjad.StartHairpin | type(None))
+        assert isinstance(
+            stop_indicator, abjad.Dynamic | abjad.StopHairpin | type(None)
+        )
+        specifier = ExactHairpinSpecifier(
+            start_dynamic=start_dynamic,
+            spanner_start=spanner_start,
+            stop_indicator=stop_indicator,
+        )
+        specifiers.append(specifier)
+    return tuple(specifiers)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_hairpin_descriptor(descriptor: str) -> tuple[HairpinSpecifier, ...]:
+    indicators = []
+    specifiers = []
+    indicator: str | abjad.Dynamic | abjad.StartHairpin | abjad.StopHairpin
+    for string in descriptor.split():
+        if string == "-":
+            indicator = "-"
+        else:
+            indicator = _dynamics.make_dynamic(string)
+        indicators.append(indicator)
+    skip_next_start_hairpin = False
+    for left, right in abjad.sequence.nwise(indicators):
+        specifier = None
+        if isinstance(left, abjad.StartHairpin) and skip_next_start_hairpin is False:
+            specifier = HairpinSpecifier(spanner_start=left)
+        elif isinstance(left, abjad.Dynamic) and isinstance(right, abjad.Dynamic):
+            specifier = HairpinSpecifier(indicator=left)
+        elif isinstance(left, abjad.Dynamic) and right == "-":
+            specifier = HairpinSpecifier(indicator=left)
+        elif left == "-" and isinstance(right, abjad.StartHairpin):
+            specifier = HairpinSpecifier(spanner_start=right)
+            skip_next_start_hairpin = True
+        elif left == "-" and isinstance(right, abjad.StopHairpin):
+            specifier = HairpinSpecifier(spanner_stop=right)
+        elif isinstance(left, abjad.Dynamic) and isinstance(right, abjad.StartHairpin):
+            specifier = HairpinSpecifier(indicator=left, spanner_start=right)
+            skip_next_start_hairpin = True
+        elif isinstance(left, abjad.StopHairpin) and isinstance(
+            right, abjad.StartHairpin
+        ):
+            specifier = HairpinSpecifier(spanner_stop=left, spanner_start=right)
+            skip_next_start_hairpin = True
+        else:
+            skip_next_start_hairpin = False
+        if specifier is not None:
+            specifiers.append(specifier)
+    if indicators:
+        final_indicator = indicators[-1]
+        specifier = None
+        if isinstance(final_indicator, abjad.StopHairpin):
+            specifier = HairpinSpecifier(spanner_stop=final_indicator)
+        elif isinstance(final_indicator, abjad.Dynamic):
+            specifier = HairpinSpecifier(indicator=final_indicator)
+        else:
+            assert isinstance(final_indicator, abjad.StartHairpin)
+            if skip_next_start_hairpin is False:
+                specifier = HairpinSpecifier(spanner_start=final_indicator)
+        if specifier is not None:
+            specifiers.append(specifier)
+    return tuple(specifiers)
+
+
 def _iterate_cyclic_hairpin_pieces(
     pieces: list,
     *tweaks: abjad.Tweak,
@@ -239,7 +334,7 @@ def hairpin(
         assert descriptor[-1] == "!", repr(descriptor)
     if rleak is True:
         argument = _select.rleak_final_item_next_nonobgc_leaf(argument)
-    specifiers = parse_exact_hairpin_descriptor(descriptor)
+    specifiers = _compile_exact_hairpin_descriptor(descriptor)
     if len(specifiers) == 1:
         argument = [argument]
     elif extra_specifiers is True:
@@ -312,55 +407,7 @@ def hairpin(
 
 def parse_hairpin_descriptor(descriptor: str) -> list[HairpinSpecifier]:
     assert isinstance(descriptor, str), repr(descriptor)
-    indicators = []
-    specifiers = []
-    indicator: str | abjad.Dynamic | abjad.StartHairpin | abjad.StopHairpin
-    for string in descriptor.split():
-        if string == "-":
-            indicator = "-"
-        else:
-            indicator = _dynamics.make_dynamic(string)
-        indicators.append(indicator)
-    skip_next_start_hairpin = False
-    for left, right in abjad.sequence.nwise(indicators):
-        specifier = None
-        if isinstance(left, abjad.StartHairpin) and skip_next_start_hairpin is False:
-            specifier = HairpinSpecifier(spanner_start=left)
-        elif isinstance(left, abjad.Dynamic) and isinstance(right, abjad.Dynamic):
-            specifier = HairpinSpecifier(indicator=left)
-        elif isinstance(left, abjad.Dynamic) and right == "-":
-            specifier = HairpinSpecifier(indicator=left)
-        elif left == "-" and isinstance(right, abjad.StartHairpin):
-            specifier = HairpinSpecifier(spanner_start=right)
-            skip_next_start_hairpin = True
-        elif left == "-" and isinstance(right, abjad.StopHairpin):
-            specifier = HairpinSpecifier(spanner_stop=right)
-        elif isinstance(left, abjad.Dynamic) and isinstance(right, abjad.StartHairpin):
-            specifier = HairpinSpecifier(indicator=left, spanner_start=right)
-            skip_next_start_hairpin = True
-        elif isinstance(left, abjad.StopHairpin) and isinstance(
-            right, abjad.StartHairpin
-        ):
-            specifier = HairpinSpecifier(spanner_stop=left, spanner_start=right)
-            skip_next_start_hairpin = True
-        else:
-            skip_next_start_hairpin = False
-        if specifier is not None:
-            specifiers.append(specifier)
-    if indicators:
-        final_indicator = indicators[-1]
-        specifier = None
-        if isinstance(final_indicator, abjad.StopHairpin):
-            specifier = HairpinSpecifier(spanner_stop=final_indicator)
-        elif isinstance(final_indicator, abjad.Dynamic):
-            specifier = HairpinSpecifier(indicator=final_indicator)
-        else:
-            assert isinstance(final_indicator, abjad.StartHairpin)
-            if skip_next_start_hairpin is False:
-                specifier = HairpinSpecifier(spanner_start=final_indicator)
-        if specifier is not None:
-            specifiers.append(specifier)
-    return specifiers
+    return list(_compile_hairpin_descriptor(descriptor))
 
 
 known_shapes = ("o<|", "o<", "<|", "<", "|>o", ">o", "|>", ">", "--")
@@ -368,38 +415,4 @@ known_shapes = ("o<|", "o<", "<|", "<", "|>o", ">o", "|>", ">", "--")
 
 def parse_exact_hairpin_descriptor(descriptor: str) -> list[ExactHairpinSpecifier]:
     assert isinstance(descriptor, str), repr(descriptor)
-    specifiers = []
-    for string in descriptor.split():
-        start_dynamic, spanner_start, stop_indicator = None, None, None
-        for shape in known_shapes:
-            if shape in string:
-                start_dynamic_string, stop_indicator_string = string.split(shape)
-                if start_dynamic_string:
-                    start_dynamic = _dynamics.make_dynamic(start_dynamic_string)
-                spanner_start = _dynamics.make_dynamic(shape)
-                if stop_indicator_string:
-                    stop_indicator = _dynamics.make_dynamic(stop_indicator_string)
-                break
-        else:
-            if "+" in string:
-                start_dynamic_string, stop_indicator_string = string.split("+")
-                if start_dynamic_string:
-                    start_dynamic = _dynamics.make_dynamic(start_dynamic_string)
-                if stop_indicator_string:
-                    stop_indicator = _dynamics.make_dynamic(stop_indicator_string)
-            elif string == "!":
-                stop_indicator = _dynamics.make_dynamic(string)
-            else:
-                start_dynamic = _dynamics.make_dynamic(string)
-        assert isinstance(start_dynamic, abjad.Dynamic | abjad.StopHairpin | type(None))
-        assert isinstance(spanner_start, abjad.StartHairpin | type(None))
-        assert isinstance(
-            stop_indicator, abjad.Dynamic | abjad.StopHairpin | type(None)
-        )
-        specifier = ExactHairpinSpecifier(
-            start_dynamic=start_dynamic,
-            spanner_start=spanner_start,
-            stop_indicator=stop_indicator,
-        )
-        specifiers.append(specifier)
-    return specifiers
+    return list(_compile_exact_hairpin_descriptor(descriptor))
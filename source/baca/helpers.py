@@ -3,9 +3,27 @@ Other functions.
 """
 
 import os
+import sys
 
 import abjad
 
+_function_name_cache: dict[tuple, abjad.Tag] = {}
+_tag_cache: dict[tuple[str, str], abjad.Tag] = {}
+
+
+def append_tag(tag: abjad.Tag, word: abjad.Tag) -> abjad.Tag:
+    """
+    Appends ``word`` to ``tag``.
+
+    Memoized ``tag.append(word)``; returns the same tag each time.
+    """
+    key = (tag.string, word.string)
+    result = _tag_cache.get(key)
+    if result is None:
+        result = abjad.Tag(sys.intern(tag.append(word).string))
+        _tag_cache[key] = result
+    return result
+
 
 def bundle_tweaks(argument, tweaks, *, i=None, total=None, overwrite=False):
     if not tweaks:
@@ -38,9 +56,21 @@ def call(argument):
 def function_name(frame, *, n=None):
     """
     Gets function (and class) name from ``frame``.
+
+    Memoized on code object, class and ``n``; returns the same tag each time.
     """
+    code = frame.f_code
+    class_ = None
+    names = (code.co_varnames, code.co_cellvars, code.co_freevars)
+    if any("self" in _ for _ in names):
+        if "self" in frame.f_locals:
+            class_ = frame.f_locals["self"].__class__
+    key = (code, class_, n)
+    tag = _function_name_cache.get(key)
+    if tag is not None:
+        return tag
     parts = []
-    path = frame.f_code.co_filename.removesuffix(".py")
+    path = code.co_filename.removesuffix(".py")
     file_name = path.split(os.sep)[-1]
     found_library = False
     for part in reversed(path.split(os.sep)):
@@ -56,9 +86,10 @@ def function_name(frame, *, n=None):
     if parts[0] == "baca":
         parts.pop()
     parts.append(file_name)
-    if "self" in frame.f_locals:
-        class_name = frame.f_locals["self"].__class__.__name__
-        parts.append(class_name)
-    parts.append(frame.f_code.co_name)
+    if class_ is not None:
+        parts.append(class_.__name__)
+    parts.append(code.co_name)
     string = ".".join(parts) + ("()" if n is None else f"({n})")
-    return abjad.Tag(string)
+    tag = abjad.Tag(sys.intern(string))
+    _function_name_cache[key] = tag
+    return tag
@@ -32,15 +32,15 @@ def attach_persistent_indicator(
     manifests = manifests or {}
     assert isinstance(manifests, dict), repr(manifests)
     tag = tag or abjad.Tag()
-    tag = tag.append(_helpers.function_name(_frame()))
+    tag = _helpers.append_tag(tag, _helpers.function_name(_frame()))
     if getattr(unbundled_indicator, "spanner_start", False) is True:
-        tag = tag.append(_tags.SPANNER_START)
+        tag = _helpers.append_tag(tag, _tags.SPANNER_START)
     if getattr(unbundled_indicator, "spanner_stop", False) is True:
-        tag = tag.append(_tags.SPANNER_STOP)
+        tag = _helpers.append_tag(tag, _tags.SPANNER_STOP)
     if left_broken is True:
-        tag = tag.append(_tags.LEFT_BROKEN)
+        tag = _helpers.append_tag(tag, _tags.LEFT_BROKEN)
     if right_broken is True:
-        tag = tag.append(_tags.RIGHT_BROKEN)
+        tag = _helpers.append_tag(tag, _tags.RIGHT_BROKEN)
     reapplied_indicator = _treat.remove_reapplied_wrappers(leaf, indicator)
     assert not isinstance(reapplied_indicator, abjad.wrapper.Wrapper)
     abjad.attach(
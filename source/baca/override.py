@@ -2,6 +2,7 @@
 Overrides.
 """
 
+import functools
 from inspect import currentframe as _frame
 
 import abjad
@@ -9,29 +10,23 @@ import abjad
 from . import helpers as _helpers
 from . import tags as _tags
 
+_context_classes = {
+    name: class_
+    for name, class_ in vars(abjad).items()
+    if isinstance(class_, type) and issubclass(class_, abjad.Context)
+}
 
-def _override(
-    frame,
-    argument,
+
+def _attach_override(
+    leaves,
+    lilypond_type,
     grob,
     attribute,
     value,
-    *,
-    after=False,
-    context=None,
+    after,
+    first_tag,
+    final_tag,
 ) -> list[abjad.wrapper.Wrapper]:
-    leaves = abjad.select.leaves(argument)
-    first_tag = _helpers.function_name(frame, n=1)
-    final_tag = _helpers.function_name(frame, n=2)
-    lilypond_type = context
-    if lilypond_type is not None:
-        assert isinstance(lilypond_type, str), repr(lilypond_type)
-    if lilypond_type in dir(abjad):
-        context = getattr(abjad, lilypond_type)
-        assert issubclass(context, abjad.Context), repr(context)
-        context = abjad.get.parentage(leaves[0]).get(context) or context()
-        lilypond_type = context.lilypond_type()
-        assert isinstance(lilypond_type, str), repr(lilypond_type)
     assert isinstance(grob, str)
     assert isinstance(attribute, str)
     once = bool(len(leaves) == 1)
@@ -64,6 +59,55 @@ def _override(
     return [wrapper_1, wrapper_2]
 
 
+@functools.cache
+def _get_default_lilypond_type(class_) -> str:
+    lilypond_type = class_().lilypond_type()
+    assert isinstance(lilypond_type, str), repr(lilypond_type)
+    return lilypond_type
+
+
+def _get_lilypond_type(context, leaf) -> str | None:
+    if context is None:
+        return None
+    assert isinstance(context, str), repr(context)
+    class_ = _context_classes.get(context)
+    if class_ is None:
+        assert not hasattr(abjad, context), repr(context)
+        return context
+    context_ = abjad.get.parentage(leaf).get(class_)
+    if context_ is None:
+        return _get_default_lilypond_type(class_)
+    lilypond_type = context_.lilypond_type()
+    assert isinstance(lilypond_type, str), repr(lilypond_type)
+    return lilypond_type
+
+
+def _override(
+    frame,
+    argument,
+    grob,
+    attribute,
+    value,
+    *,
+    after=False,
+    context=None,
+) -> list[abjad.wrapper.Wrapper]:
+    leaves = abjad.select.leaves(argument)
+    first_tag = _helpers.function_name(frame, n=1)
+    final_tag = _helpers.function_name(frame, n=2)
+    lilypond_type = _get_lilypond_type(context, leaves[0])
+    return _attach_override(
+        leaves,
+        lilypond_type,
+        grob,
+        attribute,
+        value,
+        after,
+        first_tag,
+        final_tag,
+    )
+
+
 def accidental_extra_offset(
     argument,
     pair: tuple[int | float, int | float],
@@ -241,6 +285,50 @@ def bar_line_x_extent(
     )
 
 
+def batch(
+    frame,
+    requests: list[tuple],
+    *,
+    after: bool = False,
+    context: str | None = None,
+) -> list[abjad.wrapper.Wrapper]:
+    """
+    Overrides each ``(argument, grob, attribute, value)`` in ``requests``.
+
+    Requests with equal grob, attribute and value whose leaves follow one
+    another are merged into a single override/revert pair. Tags name the
+    function of the caller's ``frame``.
+    """
+    first_tag = _helpers.function_name(frame, n=1)
+    final_tag = _helpers.function_name(frame, n=2)
+    runs, key_to_leaves = [], {}
+    for argument, grob, attribute, value in requests:
+        leaves = abjad.select.leaves(argument)
+        lilypond_type = _get_lilypond_type(context, leaves[0])
+        key = (lilypond_type, grob, attribute, type(value), value)
+        run_leaves = key_to_leaves.get(key)
+        if run_leaves is not None and abjad.get.leaf(run_leaves[-1], 1) is leaves[0]:
+            run_leaves.extend(leaves)
+            continue
+        run_leaves = list(leaves)
+        key_to_leaves[key] = run_leaves
+        runs.append((run_leaves, lilypond_type, grob, attribute, value))
+    wrappers = []
+    for run_leaves, lilypond_type, grob, attribute, value in runs:
+        wrappers_ = _attach_override(
+            run_leaves,
+            lilypond_type,
+            grob,
+            attribute,
+            value,
+            after,
+            first_tag,
+            final_tag,
+        )
+        wrappers.extend(wrappers_)
+    return wrappers
+
+
 def beam_positions(argument, n: int | float) -> list[abjad.wrapper.Wrapper]:
     return _override(
         _frame(),
@@ -2,7 +2,11 @@
 Path.
 """
 
+import copy
+import dataclasses
+import fractions
 import importlib
+import json
 import os
 import pathlib
 import types
@@ -10,6 +14,74 @@ import types
 import abjad
 import black
 
+_metadata_cache: dict[pathlib.Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _decode_metadata(argument, baca):
+    if isinstance(argument, list):
+        return [_decode_metadata(_, baca) for _ in argument]
+    if not isinstance(argument, dict):
+        return argument
+    if "__tuple__" in argument:
+        return tuple(_decode_metadata(_, baca) for _ in argument["__tuple__"])
+    if "__items__" in argument:
+        pairs = [_decode_metadata(_, baca) for _ in argument["__items__"]]
+        return {key: value for key, value in pairs}
+    if "__class__" in argument:
+        module_name, class_name = argument["__class__"].split(".")
+        module = {"abjad": abjad, "baca": baca, "fractions": fractions}[module_name]
+        class_ = getattr(module, class_name)
+        fields = _decode_metadata(argument["fields"], baca)
+        return class_(**fields)
+    return {key: _decode_metadata(value, baca) for key, value in argument.items()}
+
+
+def _encode_metadata(argument, baca):
+    if argument is None or isinstance(argument, bool | int | float | str):
+        return argument
+    if isinstance(argument, list):
+        return [_encode_metadata(_, baca) for _ in argument]
+    if isinstance(argument, tuple):
+        return {"__tuple__": [_encode_metadata(_, baca) for _ in argument]}
+    if isinstance(argument, dict | types.MappingProxyType):
+        if all(isinstance(_, str) for _ in argument):
+            return {
+                key: _encode_metadata(value, baca) for key, value in argument.items()
+            }
+        items = [_encode_metadata(_, baca) for _ in argument.items()]
+        return {"__items__": items}
+    class_ = type(argument)
+    if class_ is fractions.Fraction:
+        class_name = "fractions.Fraction"
+        fields = {
+            "numerator": argument.numerator,
+            "denominator": argument.denominator,
+        }
+    elif class_ is baca.Memento:
+        class_name = "baca.Memento"
+        fields = {
+            "context": argument.get_context(),
+            "edition": argument.get_edition(),
+            "manifest": argument.get_manifest(),
+            "prototype": argument.get_prototype(),
+            "synthetic_offset": argument.get_synthetic_offset(),
+            "value": argument.get_value(),
+        }
+    elif dataclasses.is_dataclass(argument):
+        if getattr(abjad, class_.__name__, None) is class_:
+            class_name = f"abjad.{class_.__name__}"
+        elif getattr(baca, class_.__name__, None) is class_:
+            class_name = f"baca.{class_.__name__}"
+        else:
+            raise TypeError(f"can not encode {argument!r} in metadata.")
+        fields = {}
+        for field in dataclasses.fields(argument):
+            if field.init:
+                fields[field.name] = getattr(argument, field.name)
+    else:
+        raise TypeError(f"can not encode {argument!r} in metadata.")
+    return {"__class__": class_name, "fields": _encode_metadata(fields, baca)}
+
 
 def _get_previous_section(path: pathlib.Path):
     assert isinstance(path, pathlib.Path), repr(path)
@@ -72,12 +144,25 @@ def get_metadata(directory: pathlib.Path) -> types.MappingProxyType:
     metadata_py_path = directory / ".metadata"
     dictionary = {}
     if metadata_py_path.is_file():
-        file_contents_string = metadata_py_path.read_text()
-        baca = importlib.import_module("baca")
-        namespace = {"abjad": abjad, "baca": baca}
-        namespace.update(abjad.__dict__)
-        namespace.update(baca.__dict__)
-        dictionary = eval(file_contents_string, namespace)
+        stat = metadata_py_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = _metadata_cache.get(metadata_py_path)
+        if cached is not None and cached[0] == key:
+            dictionary = cached[1]
+        else:
+            file_contents_string = metadata_py_path.read_text()
+            baca = importlib.import_module("baca")
+            try:
+                dictionary = json.loads(file_contents_string)
+            except json.JSONDecodeError:
+                namespace = {"abjad": abjad, "baca": baca}
+                namespace.update(abjad.__dict__)
+                namespace.update(baca.__dict__)
+                dictionary = eval(file_contents_string, namespace)
+            else:
+                dictionary = _decode_metadata(dictionary, baca)
+            _metadata_cache[metadata_py_path] = (key, dictionary)
+        dictionary = copy.deepcopy(dictionary)
     metadata = types.MappingProxyType(dictionary)
     return metadata
 
@@ -123,7 +208,18 @@ def write_metadata_py(path: pathlib.Path, metadata: types.MappingProxyType):
     assert isinstance(path, pathlib.Path), repr(path)
     assert isinstance(metadata, types.MappingProxyType), repr(metadata)
     metadata = types.MappingProxyType(dict(sorted(metadata.items())))
-    string = str(metadata)
-    string = black.format_str(string, mode=black.mode.Mode())
+    baca = importlib.import_module("baca")
+    try:
+        dictionary = _encode_metadata(metadata, baca)
+    except TypeError:
+        string = str(metadata)
+        string = black.format_str(string, mode=black.mode.Mode())
+    else:
+        string = json.dumps(dictionary, indent=4) + "\n"
     metadata_py_path = path / ".metadata"
-    metadata_py_path.write_text(string)
+    temporary_path = path / ".metadata.tmp"
+    temporary_path.write_text(string)
+    os.replace(temporary_path, metadata_py_path)
+    stat = metadata_py_path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    _metadata_cache[metadata_py_path] = (key, copy.deepcopy(dict(metadata)))
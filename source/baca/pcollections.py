@@ -4,6 +4,7 @@ Pitch collections.
 
 import collections
 import dataclasses
+import functools
 import math
 import typing
 
@@ -188,6 +189,96 @@ class ArpeggiationSpacingSpecifier:
         return collections_
 
 
+def _get_transform_operators(
+    length, inversion, multiplication, retrograde, rotation, transposition
+):
+    lists = []
+    if transposition:
+        for n in range(12):
+            lists.append([f"T{n}"])
+    else:
+        lists.append(["T0"])
+    if inversion:
+        lists = lists + [_[:] + ["I"] for _ in lists]
+    if multiplication:
+        lists = (
+            [["M1"] + _[:] for _ in lists]
+            + [["M5"] + _[:] for _ in lists]
+            + [["M7"] + _[:] for _ in lists]
+            + [["M11"] + _[:] for _ in lists]
+        )
+    if retrograde:
+        lists = lists + [["R"] + _[:] for _ in lists]
+    if rotation:
+        lists_ = []
+        for n in range(length):
+            lists_.extend([f"r{n}"] + _[:] for _ in lists)
+        lists = lists_
+    return lists
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_transform_table(
+    units, inversion, multiplication, retrograde, rotation, transposition
+):
+    """
+    Gets operators, transforms and transform index of quarter-tone ``units``.
+
+    Pitch-classes are integers mod 24 so that quarter-tones stay exact. Each
+    operator list reads right to left (I, then T, then M, then R, then r);
+    the pitch-class operators collapse to one affine map per list and the
+    order operators to one index permutation.
+    """
+    length = len(units)
+    operators = _get_transform_operators(
+        length, inversion, multiplication, retrograde, rotation, transposition
+    )
+    images = {}
+    transforms = []
+    index = {}
+    for i, list_ in enumerate(operators):
+        sign, t, m, reverse, r = 1, 0, 1, False, 0
+        for string in list_:
+            if string == "I":
+                sign = -1
+            elif string == "R":
+                reverse = True
+            elif string.startswith("T"):
+                t = int(string.removeprefix("T"))
+            elif string.startswith("M"):
+                m = int(string.removeprefix("M"))
+            else:
+                assert string.startswith("r")
+                r = int(string.removeprefix("r"))
+        key = (sign, t, m)
+        image = images.get(key)
+        if image is None:
+            image = tuple((sign * _ + 2 * t) * m % 24 for _ in units)
+            images[key] = image
+        if reverse:
+            image = image[::-1]
+        if length and r % length:
+            n = r % length
+            image = image[-n:] + image[:-n]
+        transforms.append(image)
+        index.setdefault(image, []).append(i)
+    return operators, transforms, index
+
+
+def _pitch_classes_to_units(collection):
+    assert isinstance(collection, abjad.PitchClassSegment), repr(collection)
+    units = []
+    for pitch_class in collection:
+        unit = 2 * pitch_class.number()
+        assert unit == int(unit), repr(pitch_class)
+        units.append(int(unit) % 24)
+    return tuple(units)
+
+
+def _units_to_pitch_classes(units):
+    return [_ // 2 if _ % 2 == 0 else _ / 2 for _ in units]
+
+
 def _to_tightly_spaced_pitches_ascending(pitch_classes):
     pitches = []
     pitch_class = pitch_classes[0]
@@ -1510,17 +1601,19 @@ def get_matching_transforms(
     result = []
     if not len(collection) == len(segment_2):
         return result
-    transforms = get_transforms(
-        collection,
-        inversion=inversion,
-        multiplication=multiplication,
-        retrograde=retrograde,
-        rotation=rotation,
-        transposition=transposition,
+    if type(segment_2) is not type(collection):
+        return result
+    operators, _, index = _get_transform_table(
+        _pitch_classes_to_units(collection),
+        inversion,
+        multiplication,
+        retrograde,
+        rotation,
+        transposition,
     )
-    for operator, transform in transforms:
-        if transform == segment_2:
-            result.append((operator, transform))
+    for i in index.get(_pitch_classes_to_units(segment_2), []):
+        transform = type(collection)(segment_2.items)
+        result.append((operators[i][:], transform))
     return result
 
 
@@ -1750,48 +1843,19 @@ def get_transforms(
         192: RM11T11I(J): PC<8, 0, 8, 7, 0, 11>
 
     """
-    lists = []
-    if transposition:
-        for n in range(12):
-            lists.append([f"T{n}"])
-    else:
-        lists.append(["T0"])
-    if inversion:
-        lists = lists + [_[:] + ["I"] for _ in lists]
-
-    if multiplication:
-        lists = (
-            [["M1"] + _[:] for _ in lists]
-            + [["M5"] + _[:] for _ in lists]
-            + [["M7"] + _[:] for _ in lists]
-            + [["M11"] + _[:] for _ in lists]
-        )
-    if retrograde:
-        lists = lists + [["R"] + _[:] for _ in lists]
-    if rotation:
-        lists_ = []
-        for n in range(len(collection)):
-            lists_.extend([f"r{n}"] + _[:] for _ in lists)
-        lists = lists_
+    operators, transforms, _ = _get_transform_table(
+        _pitch_classes_to_units(collection),
+        inversion,
+        multiplication,
+        retrograde,
+        rotation,
+        transposition,
+    )
+    class_ = type(collection)
     pairs = []
-    for list_ in lists:
-        transform = collection
-        for string in reversed(list_):
-            if string == "I":
-                transform = transform.invert()
-            elif string.startswith("T"):
-                n = int(string.removeprefix("T"))
-                transform = transform.transpose(n=n)
-            elif string.startswith("M"):
-                n = int(string.removeprefix("M"))
-                transform = transform.multiply(n=n)
-            elif string == "R":
-                transform = transform.retrograde()
-            else:
-                assert string.startswith("r")
-                n = int(string.removeprefix("r"))
-                transform = transform.rotate(n=n)
-        pairs.append((list_, transform))
+    for list_, units in zip(operators, transforms, strict=True):
+        transform = class_(_units_to_pitch_classes(units))
+        pairs.append((list_[:], transform))
     return pairs
 
 
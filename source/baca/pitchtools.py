@@ -168,10 +168,14 @@ def _do_pitch_command(
         raise Exception(message)
     if strict is False and not isinstance(pitches, abjad.CyclicTuple | Loop):
         pitches = abjad.CyclicTuple(pitches)
+    if isinstance(pitches, Loop):
+        pitches = pitches.get_pitches(len(plts), start=previous_pitches_consumed)
+    else:
+        start = previous_pitches_consumed
+        pitches = [pitches[_] for _ in range(start, start + len(plts))]
     pitches_consumed = 0
     mutated_score = False
-    for i, plt in enumerate(plts):
-        pitch = pitches[i + previous_pitches_consumed]
+    for plt, pitch in zip(plts, pitches, strict=True):
         # TOOD: let <c' d'>8 ~ c' work
         new_plt = _set_lt_pitch(
             plt,
@@ -590,13 +594,22 @@ class Loop:
 
     pitches: collections.abc.Sequence[int]
     intervals: collections.abc.Sequence[int]
+    _interval_sums: tuple[int, ...] = dataclasses.field(
+        init=False, repr=False, compare=False, hash=False
+    )
 
     def __post_init__(self):
         assert all(isinstance(_, int) for _ in self.pitches), self.pitches
         assert all(isinstance(_, int) for _ in self.intervals), self.intervals
+        interval_sums = [0]
+        for interval in self.intervals:
+            interval_sums.append(interval_sums[-1] + interval)
+        object.__setattr__(self, "_interval_sums", tuple(interval_sums))
 
     def __getitem__(self, i: int) -> abjad.NamedPitch:
         assert isinstance(i, int), repr(i)
+        if 0 <= i and self.pitches:
+            return abjad.NamedPitch(self._number(i))
         intervals = abjad.CyclicTuple(self.intervals)
         pitches = abjad.CyclicTuple(self.pitches)
         iteration = i // len(pitches)
@@ -611,6 +624,40 @@ class Loop:
     def __iter__(self):
         return self.pitches.__iter__()
 
+    def _number(self, i: int) -> int:
+        iteration, j = divmod(i, len(self.pitches))
+        transposition = 0
+        if iteration:
+            if not self.intervals:
+                raise IndexError(f"cyclic tuple is empty: {self.intervals!r}.")
+            cycles, k = divmod(iteration, len(self.intervals))
+            transposition = cycles * self._interval_sums[-1] + self._interval_sums[k]
+        return self.pitches[j] + transposition
+
+    def get_pitches(self, n: int, *, start: int = 0) -> list[abjad.NamedPitch]:
+        """
+        Gets ``n`` pitches starting at index ``start``; same as
+        ``[loop[_] for _ in range(start, start + n)]``.
+
+        ..  container:: example
+
+            >>> baca.Loop([0, 2, 4], [1]).get_pitches(6, start=3)
+            [NamedPitch("cs'"), NamedPitch("ef'"), NamedPitch("f'"), NamedPitch("d'"), NamedPitch("e'"), NamedPitch("fs'")]
+
+        """
+        assert isinstance(n, int) and 0 <= n, repr(n)
+        assert isinstance(start, int) and 0 <= start, repr(start)
+        assert self.pitches, repr(self.pitches)
+        number_to_pitch: dict[int, abjad.NamedPitch] = {}
+        pitches = []
+        for i in range(start, start + n):
+            number = self._number(i)
+            pitch = number_to_pitch.get(number)
+            if pitch is None:
+                pitch = number_to_pitch[number] = abjad.NamedPitch(number)
+            pitches.append(pitch)
+        return pitches
+
 
 def bass_to_octave(argument, n: int) -> None:
     r"""
@@ -1153,9 +1153,9 @@ def make_mmrests(
         for i, time_signature in enumerate(time_signatures):
             if i == 0:
                 tag = _helpers.function_name(_frame(), n=2)
-                tag = tag.append(_tags.HIDDEN)
+                tag = _helpers.append_tag(tag, _tags.HIDDEN)
                 note_or_rest = _tags.NOTE
-                tag = tag.append(_tags.NOTE)
+                tag = _helpers.append_tag(tag, _tags.NOTE)
                 note = abjad.Note("c'1", dmp=time_signature.pair, tag=tag)
                 abjad.override(note).Accidental.stencil = False
                 abjad.override(note).NoteColumn.ignore_collision = True
@@ -1163,15 +1163,15 @@ def make_mmrests(
                 abjad.attach(_enums.NOT_YET_PITCHED, note)
                 abjad.attach(_enums.HIDDEN, note)
                 tag = _helpers.function_name(_frame(), n=3)
-                tag = tag.append(note_or_rest)
-                tag = tag.append(_tags.INVISIBLE_MUSIC_COLORING)
+                tag = _helpers.append_tag(tag, note_or_rest)
+                tag = _helpers.append_tag(tag, _tags.INVISIBLE_MUSIC_COLORING)
                 literal = abjad.LilyPondLiteral(
                     r"\abjad-invisible-music-coloring", site="before"
                 )
                 abjad.attach(literal, note, tag=tag)
                 tag = _helpers.function_name(_frame(), n=4)
-                tag = tag.append(note_or_rest)
-                tag = tag.append(_tags.INVISIBLE_MUSIC_COMMAND)
+                tag = _helpers.append_tag(tag, note_or_rest)
+                tag = _helpers.append_tag(tag, _tags.INVISIBLE_MUSIC_COMMAND)
                 literal = abjad.LilyPondLiteral(
                     r"\abjad-invisible-music", site="before"
                 )
@@ -1180,8 +1180,8 @@ def make_mmrests(
                 hidden_note_voice = abjad.Voice([note], name=voice_name, tag=tag)
                 abjad.attach(_enums.INTERMITTENT, hidden_note_voice)
                 tag = _helpers.function_name(_frame(), n=6)
-                tag = tag.append(_tags.REST_VOICE)
-                tag = tag.append(_tags.MULTIMEASURE_REST)
+                tag = _helpers.append_tag(tag, _tags.REST_VOICE)
+                tag = _helpers.append_tag(tag, _tags.MULTIMEASURE_REST)
                 rest = abjad.MultimeasureRest("R1", dmp=time_signature.pair, tag=tag)
                 abjad.attach(_enums.MULTIMEASURE_REST, rest)
                 abjad.attach(_enums.REST_VOICE, rest)
@@ -1366,12 +1366,10 @@ def make_rhythm(
             start=abjad.Duration(0),
         )
         if existing_duration < total_duration:
-            spacer_skip = None
             for i, component in enumerate(components):
                 if isinstance(component, abjad.Skip):
                     strings = abjad.get.indicators(component, str)
                     if "SPACER" in strings:
-                        spacer_skip = component
                         if "+" in strings:
                             spacer_pitch_list = [abjad.NamedPitch("c'")]
                         else:
@@ -1398,8 +1396,7 @@ def make_rhythm(
                                 pair = (timespan, original_item)
                             pairs.append(pair)
                         timespan_to_original_item = pairs
-                        index = components.index(spacer_skip)
-                        components[index : index + 1] = leaves
+                        components[i : i + 1] = leaves
                         break
         elif total_duration < existing_duration:
             components = [_ for _ in components if not isinstance(_, abjad.Skip)]
@@ -1420,6 +1417,10 @@ def make_rhythm(
             components = abjad.mutate.eject_contents(voice)
     voice = abjad.Voice(components, name=voice_name)
     if timespan_to_original_item:
+        # timespans are sorted and replacement preserves duration
+        components = list(voice)
+        timespans = [abjad.get.timespan(_) for _ in components]
+        cursor = 0
         for timespan, original_item in timespan_to_original_item:
             is_obgc_polyphony_container = False
             if (
@@ -1429,12 +1430,12 @@ def make_rhythm(
             ):
                 is_obgc_polyphony_container = True
             timespan_components = []
-            for component in voice:
-                timespan_ = abjad.get.timespan(component)
-                if timespan_ in timespan:
-                    timespan_components.append(component)
+            while cursor < len(components):
+                if timespans[cursor] in timespan:
+                    timespan_components.append(components[cursor])
                 elif timespan_components:
                     break
+                cursor += 1
             assert timespan_components, repr(timespan_components)
             if not is_obgc_polyphony_container:
                 leaves_ = abjad.select.leaves(timespan_components)
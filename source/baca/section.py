@@ -2,10 +2,12 @@
 Section.
 """
 
+import bisect
 import collections
 import copy
 import dataclasses
 import importlib
+import time
 import types
 import typing
 from inspect import currentframe as _frame
@@ -26,6 +28,7 @@ from . import pcollections as _pcollections
 from . import pitchtools as _pitchtools
 from . import select as _select
 from . import tags as _tags
+from . import timing as _timing
 from . import treat as _treat
 from .enums import enums as _enums
 
@@ -51,6 +54,7 @@ class CacheGetItemWrapper:
             self.abbreviation_to_voice_name[abbreviation] = voice_name
         self._score: abjad.Score
         self._measure_count: int
+        self._measure_index: MeasureIndex
         self._voice_abbreviations: dict
 
     def __getattr__(self, string):
@@ -106,13 +110,27 @@ class CacheGetItemWrapper:
                     result.append(result_)
         return result
 
-    def rebuild(self) -> None:
-        cache = cache_leaves(
-            self._score,
-            self._measure_count,
-            voice_abbreviations=self._voice_abbreviations,
-        )
-        self.voice_name_to_leaves_by_measure = cache.voice_name_to_leaves_by_measure
+    def rebuild(self, *voice_names: str) -> None:
+        if not voice_names:
+            cache = cache_leaves(
+                self._score,
+                self._measure_count,
+                voice_abbreviations=self._voice_abbreviations,
+                measure_index=self._measure_index,
+            )
+            self.voice_name_to_leaves_by_measure = cache.voice_name_to_leaves_by_measure
+            return
+        for voice_name in voice_names:
+            voice_name = self.abbreviation_to_voice_name.get(voice_name, voice_name)
+            voice = self._score[voice_name]
+            assert isinstance(voice, abjad.Voice), repr(voice)
+            for context in abjad.select.components(voice, abjad.Context):
+                self.voice_name_to_leaves_by_measure.pop(context.name(), None)
+            _cache_leaves(
+                abjad.select.leaves(voice),
+                self._measure_index,
+                self.voice_name_to_leaves_by_measure,
+            )
 
 
 @dataclasses.dataclass(frozen=True, order=True, slots=True, unsafe_hash=True)
@@ -123,6 +141,60 @@ class ClockTimes:
     stop_clock_time: str | None
 
 
+class ContextIndex:
+    """
+    Maps the name of every context in ``score`` to the contexts with that name,
+    collected by one walk of the score.
+
+    First leaves and first-leaf indicators are looked up on first request and
+    cached; call ``forget()`` after attaching to or detaching from a first leaf.
+    """
+
+    __slots__ = ("_first_leaves", "_indicators", "_name_to_contexts")
+
+    _unknown = object()
+
+    def __init__(self, score: abjad.Score) -> None:
+        assert isinstance(score, abjad.Score), repr(score)
+        self._name_to_contexts: dict[str, list[abjad.Context]] = {}
+        for context in abjad.select.components(score, abjad.Context):
+            name = context.name()
+            assert name is not None
+            self._name_to_contexts.setdefault(name, []).append(context)
+        self._first_leaves: dict[abjad.Context, abjad.Leaf | None] = {}
+        self._indicators: dict[abjad.Leaf, dict[type, typing.Any]] = {}
+
+    def context(self, name: str) -> abjad.Context | None:
+        contexts = self._name_to_contexts.get(name)
+        if not contexts:
+            return None
+        return contexts[0]
+
+    def contexts(self, name: str) -> list[abjad.Context]:
+        return list(self._name_to_contexts.get(name, []))
+
+    def first_leaf(self, context: abjad.Context) -> abjad.Leaf | None:
+        leaf = self._first_leaves.get(context, self._unknown)
+        if leaf is self._unknown:
+            leaf = abjad.get.leaf(context, 0)
+            self._first_leaves[context] = leaf
+        return leaf
+
+    def forget(self, leaf: abjad.Leaf) -> None:
+        self._indicators.pop(leaf, None)
+
+    def indicator(self, leaf: abjad.Leaf, prototype: type) -> typing.Any:
+        indicators = self._indicators.setdefault(leaf, {})
+        indicator = indicators.get(prototype, self._unknown)
+        if indicator is self._unknown:
+            indicator = abjad.get.indicator(leaf, prototype)
+            indicators[prototype] = indicator
+        return indicator
+
+    def names(self) -> list[str]:
+        return sorted(self._name_to_contexts)
+
+
 class DictionaryGetItemWrapper:
     def __init__(
         self,
@@ -178,6 +250,210 @@ class LabeledClockTimes:
     stop_clock_time: str | None
 
 
+class LeafIndex:
+    """
+    Records the voice, innermost context, start offset, measure number and
+    effective instrument of every leaf in ``score``, in parallel lists filled by
+    one walk of the score.
+
+    Effective instruments are looked up on first request. Leaves not in the index
+    (leaves that replace indexed leaves, or every leaf when ``score`` is none) fall
+    back to ``abjad.get``.
+    """
+
+    __slots__ = (
+        "_contexts",
+        "_instruments",
+        "_measure_numbers",
+        "_measure_start_offsets",
+        "_offset_to_measure_number",
+        "_positions",
+        "_start_offsets",
+        "_voices",
+    )
+
+    _unknown = object()
+
+    def __init__(
+        self,
+        score: abjad.Score | None = None,
+        offset_to_measure_number: dict[abjad.Offset, int] | None = None,
+    ) -> None:
+        if offset_to_measure_number is None:
+            offset_to_measure_number = {}
+        assert isinstance(offset_to_measure_number, dict)
+        self._offset_to_measure_number = offset_to_measure_number
+        self._measure_start_offsets = sorted(offset_to_measure_number)
+        self._positions: dict[abjad.Leaf, int] = {}
+        self._contexts: list[abjad.Context | None] = []
+        self._voices: list[abjad.Voice | None] = []
+        self._start_offsets: list[abjad.Offset] = []
+        self._measure_numbers: list[int | None] = []
+        self._instruments: list[typing.Any] = []
+        if score is None:
+            return
+        assert isinstance(score, abjad.Score), repr(score)
+        parent_to_contexts: dict[abjad.Component | None, tuple] = {}
+        for position, leaf in enumerate(abjad.iterate.leaves(score)):
+            self._positions[leaf] = position
+            parent = leaf._parent
+            contexts = parent_to_contexts.get(parent)
+            if contexts is None:
+                if parent is None:
+                    contexts = (None, None)
+                else:
+                    parentage = abjad.get.parentage(parent)
+                    contexts = (
+                        parentage.get(abjad.Context),
+                        parentage.get(abjad.Voice),
+                    )
+                parent_to_contexts[parent] = contexts
+            self._contexts.append(contexts[0])
+            self._voices.append(contexts[1])
+            start_offset = abjad.get.timespan(leaf).start_offset
+            self._start_offsets.append(start_offset)
+            self._measure_numbers.append(self._get_measure_number(start_offset))
+            self._instruments.append(self._unknown)
+
+    def _get_measure_number(self, start_offset: abjad.Offset) -> int | None:
+        index = bisect.bisect_right(self._measure_start_offsets, start_offset) - 1
+        if index < 0:
+            return None
+        return self._offset_to_measure_number[self._measure_start_offsets[index]]
+
+    def context(self, leaf: abjad.Leaf) -> abjad.Context | None:
+        position = self._positions.get(leaf)
+        if position is None:
+            return abjad.get.parentage(leaf).get(abjad.Context)
+        return self._contexts[position]
+
+    def instrument(self, leaf: abjad.Leaf) -> abjad.Instrument | None:
+        position = self._positions.get(leaf)
+        if position is None:
+            return abjad.get.effective_indicator(leaf, abjad.Instrument)
+        instrument = self._instruments[position]
+        if instrument is self._unknown:
+            instrument = abjad.get.effective_indicator(leaf, abjad.Instrument)
+            self._instruments[position] = instrument
+        return instrument
+
+    def is_measure_initial(self, leaf: abjad.Leaf) -> bool:
+        return self.start_offset(leaf) in self._offset_to_measure_number
+
+    def measure_number(self, leaf: abjad.Leaf) -> int | None:
+        position = self._positions.get(leaf)
+        if position is None:
+            return self._get_measure_number(self.start_offset(leaf))
+        return self._measure_numbers[position]
+
+    def start_offset(self, leaf: abjad.Leaf) -> abjad.Offset:
+        position = self._positions.get(leaf)
+        if position is None:
+            return abjad.get.timespan(leaf).start_offset
+        return self._start_offsets[position]
+
+    def voice(self, leaf: abjad.Leaf) -> abjad.Voice | None:
+        position = self._positions.get(leaf)
+        if position is None:
+            return abjad.get.parentage(leaf).get(abjad.Voice)
+        return self._voices[position]
+
+
+class LeafVisitor:
+    """
+    Walks the leaves of ``score`` once and calls every registered handler on each
+    leaf.
+
+    Handlers run in registration order, except that a handler runs after every
+    handler named in its ``after`` constraints. Constraints that name handlers
+    not registered in this visitor are ignored.
+    """
+
+    def __init__(self, score: abjad.Score) -> None:
+        assert isinstance(score, abjad.Score), repr(score)
+        self.score = score
+        self._handlers: list[tuple[str, typing.Callable, tuple[str, ...], bool]] = []
+
+    def _ordered_handlers(self) -> list[tuple[str, typing.Callable, bool]]:
+        names = [_[0] for _ in self._handlers]
+        assert len(names) == len(set(names)), repr(names)
+        remaining, ordered, placed = list(self._handlers), [], set()
+        while remaining:
+            for handler in remaining:
+                name, function, after, pitched = handler
+                if all(_ in placed or _ not in names for _ in after):
+                    break
+            else:
+                raise Exception(f"cyclic leaf handler constraints: {names!r}.")
+            remaining.remove(handler)
+            ordered.append((name, function, pitched))
+            placed.add(name)
+        return ordered
+
+    def _run_timed(self, handlers, prototype, timing) -> None:
+        seconds = [0.0 for _ in handlers]
+        leaves = [0 for _ in handlers]
+        wrappers = [0 for _ in handlers]
+        perf_counter = time.perf_counter
+        for leaf in abjad.iterate.leaves(self.score):
+            is_pitched = isinstance(leaf, prototype)
+            for i, (name, function, pitched) in enumerate(handlers):
+                if pitched and not is_pitched:
+                    continue
+                wrapper_count = len(leaf._wrappers)
+                start_time = perf_counter()
+                function(leaf)
+                seconds[i] += perf_counter() - start_time
+                leaves[i] += 1
+                wrappers[i] += len(leaf._wrappers) - wrapper_count
+        for i, (name, function, pitched) in enumerate(handlers):
+            stage = _timing.Stage(name, seconds[i], leaves[i], wrappers[i])
+            timing.stages.append(stage)
+
+    def register(
+        self,
+        name: str,
+        function: typing.Callable[[abjad.Leaf], None],
+        *,
+        after: tuple[str, ...] = (),
+        pitched: bool = False,
+    ) -> None:
+        assert isinstance(name, str), repr(name)
+        assert isinstance(after, tuple), repr(after)
+        self._handlers.append((name, function, after, pitched))
+
+    def run(self) -> None:
+        handlers = self._ordered_handlers()
+        self._handlers.clear()
+        if not handlers:
+            return
+        prototype = (abjad.Chord, abjad.Note)
+        timing = _timing.active_timing()
+        if timing is not None:
+            self._run_timed(handlers, prototype, timing)
+            return
+        for leaf in abjad.iterate.leaves(self.score):
+            is_pitched = isinstance(leaf, prototype)
+            for name, function, pitched in handlers:
+                if pitched and not is_pitched:
+                    continue
+                function(leaf)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MeasureIndex:
+    start_offsets: list[abjad.Offset]
+    stop_offset: abjad.Offset | None
+
+    def measure_number(self, offset: abjad.Offset) -> int | None:
+        if self.stop_offset is None or not offset < self.stop_offset:
+            return None
+        measure_index = bisect.bisect_right(self.start_offsets, offset) - 1
+        if measure_index < 0:
+            return None
+        return measure_index + 1
+
+
 @dataclasses.dataclass(frozen=True, order=True, slots=True, unsafe_hash=True)
 class TimeSignatureServer:
     time_signatures: list[abjad.TimeSignature]
@@ -216,6 +492,7 @@ class VoiceCache:
         return iter(self._voices)
 
 
+@_timing.staged
 def _add_container_identifiers(
     score: abjad.Score, section_number: str | None
 ) -> dict[str, tuple[_parts.PartAssignment, abjad.Timespan]]:
@@ -301,26 +578,25 @@ def _add_container_identifiers(
     return container_to_part_assignment
 
 
-def _analyze_memento(contexts, dictionary, memento) -> Analysis | None:
+def _analyze_memento(
+    context_index: ContextIndex, dictionary, memento
+) -> Analysis | None:
     previous_indicator = _memento_to_indicator(dictionary, memento)
     if previous_indicator is None:
         return None
     if isinstance(previous_indicator, _layout.SpacingSection):
         return None
-    for context in contexts:
-        if context.name() == memento.get_context():
-            memento_context = context
-            break
-    else:
+    memento_context = context_index.context(memento.get_context())
+    if memento_context is None:
         # context alive in previous section doesn't exist in this section
         return None
-    leaf = abjad.get.leaf(memento_context, 0)
+    leaf = context_index.first_leaf(memento_context)
     assert leaf is not None
     if isinstance(previous_indicator, abjad.Instrument):
         prototype = abjad.Instrument
     else:
         prototype = type(previous_indicator)
-    indicator = abjad.get.indicator(leaf, prototype)
+    indicator = context_index.indicator(leaf, prototype)
     status = None
     if indicator is None:
         status = "reapplied"
@@ -425,19 +701,28 @@ def _attach_measure_number_spanners(
 # LilyPond doesn't understand repeat-tied notes to be tied;
 # because of this LilyPond incorrectly prints accidentals in front of some
 # repeat-tied notes; this function works around LilyPond's behavior
-def _attach_shadow_tie_indicators(score: abjad.Score) -> None:
+@_timing.staged
+def _attach_shadow_tie_indicators(
+    score: abjad.Score, *, visitor: LeafVisitor | None = None
+) -> None:
     tag = _helpers.function_name(_frame())
-    for plt in _select.plts(score):
-        if len(plt) == 1:
-            continue
-        for pleaf in plt[:-1]:
-            if abjad.get.has_indicator(pleaf, abjad.Tie):
-                continue
-            tie = abjad.Tie()
-            bundle = abjad.bundle(tie, r"- \tweak stencil ##f")
-            abjad.attach(bundle, pleaf, tag=tag)
+
+    def handler(pleaf):
+        plt = abjad.get.logical_tie(pleaf)
+        if len(plt) == 1 or pleaf is plt[-1]:
+            return
+        if abjad.get.has_indicator(pleaf, abjad.Tie):
+            return
+        tie = abjad.Tie()
+        bundle = abjad.bundle(tie, r"- \tweak stencil ##f")
+        abjad.attach(bundle, pleaf, tag=tag)
+
+    _visit_leaves(
+        score, visitor, "_attach_shadow_tie_indicators", handler, pitched=True
+    )
 
 
+@_timing.staged
 def _attach_sounds_during(score: abjad.Score) -> None:
     for voice in abjad.iterate.components(score, abjad.Voice):
         pleaves = _select.pleaves(voice)
@@ -521,6 +806,27 @@ def _bracket_metric_modulation(
     return command
 
 
+def _cache_leaves(
+    leaves: list[abjad.Leaf],
+    measure_index: MeasureIndex,
+    voice_name_to_leaves_by_measure: dict[str, dict],
+) -> None:
+    for leaf in leaves:
+        parentage = abjad.get.parentage(leaf)
+        context = parentage.get(abjad.Context)
+        assert isinstance(context, abjad.Context)
+        context_name = context.name()
+        assert context_name is not None
+        measure_number_to_leaves = voice_name_to_leaves_by_measure.setdefault(
+            context_name, {}
+        )
+        leaf_start_offset = abjad.get.timespan(leaf).start_offset
+        measure_number = measure_index.measure_number(leaf_start_offset)
+        if measure_number is not None:
+            cached_leaves = measure_number_to_leaves.setdefault(measure_number, [])
+            cached_leaves.append(leaf)
+
+
 def _calculate_clock_times(
     clock_time_override: abjad.MetronomeMark | None,
     fermata_measure_numbers: list[int],
@@ -575,6 +881,7 @@ def _calculate_clock_times(
     )
 
 
+@_timing.staged
 def _check_all_music_in_part_containers(score: abjad.Score) -> None:
     indicator = _enums.MULTIMEASURE_REST_CONTAINER
     for voice in abjad.iterate.components(score, abjad.Voice):
@@ -596,6 +903,7 @@ def _check_all_music_in_part_containers(score: abjad.Score) -> None:
             raise Exception(message)
 
 
+@_timing.staged
 def _check_anchors_are_final(score: abjad.Score) -> None:
     anchor_count, violators = 0, []
     for leaf in abjad.iterate.leaves(score):
@@ -610,11 +918,20 @@ def _check_anchors_are_final(score: abjad.Score) -> None:
         raise Exception(message)
 
 
-def _check_doubled_dynamics(score: abjad.Score) -> None:
-    for leaf in abjad.iterate.leaves(score):
+@_timing.staged
+def _check_doubled_dynamics(
+    score: abjad.Score,
+    *,
+    index: LeafIndex | None = None,
+    visitor: LeafVisitor | None = None,
+) -> None:
+    if index is None:
+        index = LeafIndex()
+
+    def handler(leaf):
         dynamics = abjad.get.indicators(leaf, abjad.Dynamic)
         if 1 < len(dynamics):
-            voice = abjad.get.parentage(leaf).get(abjad.Voice)
+            voice = index.voice(leaf)
             assert isinstance(voice, abjad.Voice)
             assert voice.name() is not None
             message = f"leaf {str(leaf)} in {voice.name()} has"
@@ -623,7 +940,10 @@ def _check_doubled_dynamics(score: abjad.Score) -> None:
                 message += f"\n   {dynamic!s}"
             raise Exception(message)
 
+    _visit_leaves(score, visitor, "_check_doubled_dynamics", handler)
 
+
+@_timing.staged
 def _check_duplicate_part_assignments(
     dictionary: dict, part_manifest: tuple[_parts.Part, ...] | None
 ) -> None:
@@ -650,6 +970,7 @@ def _check_duplicate_part_assignments(
         raise Exception(message)
 
 
+@_timing.staged
 def _check_persistent_indicators(
     do_not_require_short_instrument_names: bool, score: abjad.Score
 ) -> None:
@@ -692,19 +1013,50 @@ def _check_persistent_indicators_for_leaf(
         raise Exception(f"{voice_name} leaf {i} ({leaf!s}) missing clef.")
 
 
-def _clean_up_laissez_vibrer_tie_direction(score: abjad.Score) -> None:
+@_timing.staged
+def _check_wellformedness(score: abjad.Score) -> None:
+    count, message = abjad.wf.tabulate_wellformedness(
+        score,
+        do_not_check_out_of_range_pitches=True,
+        do_not_check_unmatched_stop_text_spans=True,
+    )
+    if count:
+        raise Exception("\n" + message)
+    violators, total = abjad.wf.check_out_of_range_pitches(
+        score, allow_indicators=(_enums.ALLOW_OUT_OF_RANGE, _enums.HIDDEN)
+    )
+    if violators:
+        raise Exception(f"{len(violators)} /    {total} out of range pitches")
+
+
+@_timing.staged
+def _clean_up_laissez_vibrer_tie_direction(
+    score: abjad.Score, *, visitor: LeafVisitor | None = None
+) -> None:
     default = abjad.Clef("treble")
-    for note in abjad.iterate.leaves(score, abjad.Note):
+
+    def handler(note):
+        if not isinstance(note, abjad.Note):
+            return
         if note.written_duration() < abjad.Duration(1):
-            continue
+            return
         if not abjad.get.has_indicator(note, abjad.LaissezVibrer):
-            continue
+            return
         clef = abjad.get.effective_indicator(note, abjad.Clef, default=default)
         staff_position = clef.to_staff_position(note.written_pitch())
         if staff_position == abjad.StaffPosition(0):
             abjad.override(note).LaissezVibrerTie.direction = abjad.UP
 
+    _visit_leaves(
+        score,
+        visitor,
+        "_clean_up_laissez_vibrer_tie_direction",
+        handler,
+        pitched=True,
+    )
 
+
+@_timing.staged
 def _clean_up_obgcs(score: abjad.Score) -> None:
     for obgc in abjad.select.components(score, abjad.OnBeatGraceContainer):
         assert isinstance(obgc, abjad.OnBeatGraceContainer)
@@ -713,13 +1065,17 @@ def _clean_up_obgcs(score: abjad.Score) -> None:
         obgc.attach_lilypond_one_voice()
 
 
-def _clean_up_repeat_tie_direction(score: abjad.Score) -> None:
+@_timing.staged
+def _clean_up_repeat_tie_direction(
+    score: abjad.Score, *, visitor: LeafVisitor | None = None
+) -> None:
     default = abjad.Clef("treble")
-    for leaf in abjad.iterate.leaves(score, pitched=True):
+
+    def handler(leaf):
         if leaf.written_duration() < abjad.Duration(1):
-            continue
+            return
         if not abjad.get.has_indicator(leaf, abjad.RepeatTie):
-            continue
+            return
         clef = abjad.get.effective_indicator(leaf, abjad.Clef, default=default)
         if hasattr(leaf, "written_pitch"):
             note_heads = [leaf.note_head()]
@@ -734,7 +1090,12 @@ def _clean_up_repeat_tie_direction(score: abjad.Score) -> None:
                 abjad.attach(bundle, leaf, tag=wrapper.tag())
                 break
 
+    _visit_leaves(
+        score, visitor, "_clean_up_repeat_tie_direction", handler, pitched=True
+    )
+
 
+@_timing.staged
 def _clone_section_initial_short_instrument_name(score: abjad.Score) -> None:
     prototype = abjad.ShortInstrumentName
     for context in abjad.iterate.components(score, abjad.Context):
@@ -772,6 +1133,7 @@ def _collect_alive_during_section(score: abjad.Score) -> list[str]:
 
 # TODO: typehint arguments
 # TODO: maybe create PersistData, Metadata dataclasses?
+@_timing.staged
 def _collect_metadata(
     clock_time,
     container_to_part_assignment,
@@ -845,39 +1207,38 @@ def _collect_metadata(
     return new_metadata_proxy, new_persist_proxy
 
 
+@_timing.staged
 def _collect_persistent_indicators(
     manifests: dict,
     previous_persistent_indicators: dict,
     score: abjad.Score,
 ) -> dict[str, list[_memento.Memento]]:
+    context_index = ContextIndex(score)
     result: dict[str, list[_memento.Memento]] = {}
-    contexts = abjad.select.components(score, abjad.Context)
-    contexts.sort(key=lambda _: _.name() or "")
     name_to_wrappers: dict[str, list[abjad.wrapper.Wrapper]] = {}
-    for context in contexts:
-        context_name = context.name()
-        assert context_name is not None
-        if context_name not in name_to_wrappers:
-            name_to_wrappers[context_name] = []
-        wrappers = context._dependent_wrappers[:]
-        name_to_wrappers[context_name].extend(wrappers)
+    for context_name in context_index.names():
+        name_to_wrappers[context_name] = []
+        for context in context_index.contexts(context_name):
+            wrappers = context._dependent_wrappers[:]
+            name_to_wrappers[context_name].extend(wrappers)
     do_not_persist_on_anchor_leaf = (
         abjad.Instrument,
         abjad.MetronomeMark,
         abjad.ShortInstrumentName,
         abjad.TimeSignature,
     )
+    omissions: dict[abjad.Component, bool] = {}
     for name, dependent_wrappers in name_to_wrappers.items():
         mementos = []
         wrappers = []
-        dictionary = _get_persistent_wrappers(
-            dependent_wrappers=dependent_wrappers,
-            omit_with_indicator=(_enums.ANCHOR_NOTE, _enums.ANCHOR_SKIP),
+        unanchored, dictionary = _get_persistent_wrappers(
+            dependent_wrappers,
+            (_enums.ANCHOR_NOTE, _enums.ANCHOR_SKIP),
+            omissions,
         )
-        for wrapper in dictionary.values():
+        for wrapper in unanchored.values():
             if isinstance(wrapper.unbundle_indicator(), do_not_persist_on_anchor_leaf):
                 wrappers.append(wrapper)
-        dictionary = _get_persistent_wrappers(dependent_wrappers=dependent_wrappers)
         for wrapper in dictionary.values():
             if not isinstance(
                 wrapper.unbundle_indicator(),
@@ -967,19 +1328,31 @@ def _collect_persistent_indicators(
     return result
 
 
-def _color_mock_pitch(score: abjad.Score) -> None:
+@_timing.staged
+def _color_mock_pitch(
+    score: abjad.Score, *, visitor: LeafVisitor | None = None
+) -> None:
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.MOCK_COLORING)
-    leaves = []
-    for pleaf in abjad.iterate.leaves(score, pitched=True):
+
+    def handler(pleaf):
         if not abjad.get.has_indicator(pleaf, _enums.MOCK):
-            continue
+            return
         string = r"\baca-mock-coloring"
         literal = abjad.LilyPondLiteral(string, site="before")
         abjad.attach(literal, pleaf, tag=tag)
-        leaves.append(pleaf)
+
+    _visit_leaves(
+        score,
+        visitor,
+        "_color_mock_pitch",
+        handler,
+        after=("_color_not_yet_registered",),
+        pitched=True,
+    )
 
 
+@_timing.staged
 def _color_not_yet_pitched(score: abjad.Score) -> None:
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.NOT_YET_PITCHED_COLORING)
@@ -991,40 +1364,57 @@ def _color_not_yet_pitched(score: abjad.Score) -> None:
         literal = abjad.LilyPondLiteral(string, site="before")
         tag_ = tag
         if abjad.get.has_indicator(pleaf, _enums.HIDDEN):
-            tag_ = tag_.append(_tags.HIDDEN)
+            tag_ = _helpers.append_tag(tag_, _tags.HIDDEN)
         if abjad.get.has_indicator(pleaf, _enums.NOTE):
-            tag_ = tag_.append(_tags.NOTE)
+            tag_ = _helpers.append_tag(tag_, _tags.NOTE)
         abjad.attach(literal, pleaf, tag=tag_)
         leaves.append(pleaf)
 
 
-def _color_not_yet_registered(score: abjad.Score) -> None:
+@_timing.staged
+def _color_not_yet_registered(
+    score: abjad.Score, *, visitor: LeafVisitor | None = None
+) -> None:
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.NOT_YET_REGISTERED_COLORING)
-    for pleaf in abjad.iterate.leaves(score, pitched=True):
+
+    def handler(pleaf):
         if not abjad.get.has_indicator(pleaf, _enums.NOT_YET_REGISTERED):
-            continue
+            return
         string = r"\baca-not-yet-registered-coloring"
         literal = abjad.LilyPondLiteral(string, site="before")
         abjad.attach(literal, pleaf, tag=tag)
 
+    _visit_leaves(
+        score,
+        visitor,
+        "_color_not_yet_registered",
+        handler,
+        after=("transpose_score",),
+        pitched=True,
+    )
 
+
+@_timing.staged
 def _comment_measure_numbers(
     first_measure_number: int,
     offset_to_measure_number: dict[abjad.Offset, int],
     score: abjad.Score,
+    *,
+    index: LeafIndex | None = None,
 ) -> None:
     assert isinstance(offset_to_measure_number, dict)
     keys = offset_to_measure_number.keys()
     assert all(isinstance(_, abjad.Offset) for _ in keys)
+    if index is None:
+        index = LeafIndex(offset_to_measure_number=offset_to_measure_number)
     tag = _helpers.function_name(_frame())
     for leaf in abjad.iterate.leaves(score):
-        offset = abjad.get.timespan(leaf).start_offset
-        assert isinstance(offset, abjad.Offset), repr(offset)
-        measure_number = offset_to_measure_number.get(offset, None)
-        if measure_number is None:
+        if not index.is_measure_initial(leaf):
             continue
-        context = abjad.get.parentage(leaf).get(abjad.Context)
+        measure_number = index.measure_number(leaf)
+        assert measure_number is not None
+        context = index.context(leaf)
         assert isinstance(context, abjad.Context)
         if abjad.get.has_indicator(leaf, _enums.ANCHOR_SKIP):
             string = "% [anchor skip]"
@@ -1038,6 +1428,7 @@ def _comment_measure_numbers(
         abjad.attach(literal, leaf, tag=tag)
 
 
+@_timing.staged
 def _error_on_not_yet_pitched(score: abjad.Score) -> None:
     violators = []
     for voice in abjad.iterate.components(score, abjad.Voice):
@@ -1128,22 +1519,32 @@ def _find_repeat_pitch_classes(argument) -> list[list[abjad.Leaf]]:
     return violators
 
 
-def _force_nonnatural_accidentals(score: abjad.Score) -> None:
+@_timing.staged
+def _force_nonnatural_accidentals(
+    score: abjad.Score, *, visitor: LeafVisitor | None = None
+) -> None:
     natural = abjad.Accidental("natural")
-    for plt in _select.plts(score):
-        head = plt[0]
-        if isinstance(head, abjad.Note):
-            note_heads = [head.note_head()]
+
+    def handler(pleaf):
+        if abjad.get.logical_tie(pleaf)[0] is not pleaf:
+            return
+        if isinstance(pleaf, abjad.Note):
+            note_heads = [pleaf.note_head()]
         else:
-            assert isinstance(head, abjad.Chord)
-            note_heads = head.note_heads()
+            assert isinstance(pleaf, abjad.Chord)
+            note_heads = pleaf.note_heads()
         for note_head in note_heads:
             note_head_written_pitch = note_head.written_pitch()
             assert isinstance(note_head_written_pitch, abjad.NamedPitch)
             if note_head_written_pitch.accidental() != natural:
                 note_head.set_is_forced(True)
 
+    _visit_leaves(
+        score, visitor, "_force_nonnatural_accidentals", handler, pitched=True
+    )
+
 
+@_timing.staged
 def _get_fermata_measure_numbers(
     first_measure_number: int, score: abjad.Score
 ) -> FermataMeasureNumbers:
@@ -1173,14 +1574,9 @@ def _get_fermata_measure_numbers(
     )
 
 
-def _get_measure_number_tag(
-    leaf: abjad.Leaf, offset_to_measure_number: dict[abjad.Offset, int]
-) -> abjad.Tag | None:
-    start_offset = abjad.get.timespan(leaf).start_offset
-    assert isinstance(start_offset, abjad.Offset), repr(start_offset)
-    measure_number = offset_to_measure_number.get(start_offset)
-    if measure_number is not None:
-        return abjad.Tag(f"MEASURE_{measure_number}")
+def _get_measure_number_tag(leaf: abjad.Leaf, index: LeafIndex) -> abjad.Tag | None:
+    if index.is_measure_initial(leaf):
+        return abjad.Tag(f"MEASURE_{index.measure_number(leaf)}")
     return None
 
 
@@ -1199,6 +1595,20 @@ def _get_measure_offsets(
     return start_offset, stop_offset
 
 
+def _get_measure_index(score: abjad.Score, measure_count: int) -> MeasureIndex:
+    skips = _select.skips(score["Skips"])[:measure_count]
+    assert len(skips) == measure_count, repr((len(skips), measure_count))
+    start_offsets, stop_offset = [], None
+    for skip in skips:
+        assert isinstance(skip, abjad.Skip), skip
+        timespan = abjad.get.timespan(skip)
+        assert isinstance(timespan.start_offset, abjad.Offset)
+        assert isinstance(timespan.stop_offset, abjad.Offset)
+        start_offsets.append(timespan.start_offset)
+        stop_offset = timespan.stop_offset
+    return MeasureIndex(start_offsets, stop_offset)
+
+
 def _get_measure_timespan(measure_number: int, score: abjad.Score) -> abjad.Timespan:
     start_offset, stop_offset = _get_measure_offsets(
         score,
@@ -1208,50 +1618,86 @@ def _get_measure_timespan(measure_number: int, score: abjad.Score) -> abjad.Time
     return abjad.Timespan(start_offset, stop_offset)
 
 
-def _get_persistent_wrappers(*, dependent_wrappers=None, omit_with_indicator=None):
-    wrappers = {}
+def _get_persistent_wrappers(
+    dependent_wrappers: list[abjad.wrapper.Wrapper],
+    omit_with_indicator: tuple,
+    omissions: dict[abjad.Component, bool],
+) -> tuple[dict, dict]:
+    """
+    Gets the last persistent wrapper of each kind in ``dependent_wrappers`` in one
+    pass, first skipping wrappers with ``omit_with_indicator`` attached anywhere in
+    their parentage, then not skipping them.
+
+    ``omissions`` maps components to whether the component or any of its
+    parents carries ``omit_with_indicator``; pass the same dictionary for every
+    context of a score.
+    """
+
+    def is_omitted(component):
+        pending = []
+        while component is not None:
+            result = omissions.get(component)
+            if result is not None:
+                break
+            pending.append(component)
+            if component._has_indicator(omit_with_indicator):
+                result = True
+                break
+            if hasattr(component, "_main_leaf"):
+                if component._main_leaf is not None:
+                    component = component._main_leaf._parent
+                else:
+                    component = None
+            else:
+                component = component._parent
+        else:
+            result = False
+        for component_ in pending:
+            omissions[component_] = result
+        return result
+
+    def update(entries, key, wrapper, indicator, offset):
+        entry = entries.get(key)
+        if entry is None:
+            entries[key] = (wrapper, indicator, offset)
+            return
+        if entry[2] < offset:
+            entries[key] = (wrapper, indicator, offset)
+        elif entry[2] == offset:
+            if isinstance(entry[1], abjad.StartHairpin) and isinstance(
+                indicator, abjad.Dynamic
+            ):
+                pass
+            elif (
+                getattr(indicator, "spanner_start", False) is True
+                or getattr(indicator, "spanner_stop", False) is True
+                or getattr(indicator, "trend", False) is True
+            ):
+                entries[key] = (wrapper, indicator, offset)
+
+    kept: dict[str, tuple] = {}
+    all_: dict[str, tuple] = {}
     for wrapper in dependent_wrappers:
         if wrapper.annotation():
             continue
-        if not getattr(wrapper.unbundle_indicator(), "persistent", False):
+        indicator = wrapper.unbundle_indicator()
+        if not getattr(indicator, "persistent", False):
             continue
-        assert isinstance(wrapper.unbundle_indicator().persistent, bool)
-        should_omit = False
-        if omit_with_indicator is not None:
-            for component in wrapper.component()._get_parentage():
-                if component._has_indicator(omit_with_indicator):
-                    should_omit = True
-                    continue
-        if should_omit:
-            continue
-        if hasattr(wrapper.unbundle_indicator(), "parameter"):
-            key = wrapper.unbundle_indicator().parameter
-        elif isinstance(wrapper.unbundle_indicator(), abjad.Instrument):
+        assert isinstance(indicator.persistent, bool)
+        if hasattr(indicator, "parameter"):
+            key = indicator.parameter
+        elif isinstance(indicator, abjad.Instrument):
             key = "Instrument"
         else:
-            key = str(type(wrapper.unbundle_indicator()))
-        if key not in wrappers:
-            wrappers[key] = wrapper
-        elif (
-            wrappers[key].site_adjusted_start_offset()
-            < wrapper.site_adjusted_start_offset()
-        ):
-            wrappers[key] = wrapper
-        elif (
-            wrappers[key].site_adjusted_start_offset()
-            == wrapper.site_adjusted_start_offset()
-        ):
-            if isinstance(
-                wrappers[key].unbundle_indicator(), abjad.StartHairpin
-            ) and isinstance(wrapper.unbundle_indicator(), abjad.Dynamic):
-                pass
-            elif (
-                getattr(wrapper.unbundle_indicator(), "spanner_start", False) is True
-                or getattr(wrapper.unbundle_indicator(), "spanner_stop", False) is True
-                or getattr(wrapper.unbundle_indicator(), "trend", False) is True
-            ):
-                wrappers[key] = wrapper
-    return wrappers
+            key = str(type(indicator))
+        offset = wrapper.site_adjusted_start_offset()
+        if not is_omitted(wrapper.component()):
+            update(kept, key, wrapper, indicator, offset)
+        update(all_, key, wrapper, indicator, offset)
+    return (
+        {key: entry[0] for key, entry in kept.items()},
+        {key: entry[0] for key, entry in all_.items()},
+    )
 
 
 def _global_rests_are_meaningful(context: abjad.Context) -> bool:
@@ -1263,6 +1709,7 @@ def _global_rests_are_meaningful(context: abjad.Context) -> bool:
     return False
 
 
+@_timing.staged
 def _label_clock_time(
     clock_time_override: abjad.MetronomeMark | None,
     fermata_measure_numbers: list[int],
@@ -1366,33 +1813,41 @@ def _label_clock_time(
     )
 
 
-def _label_duration_multipliers(score: abjad.Score) -> None:
+@_timing.staged
+def _label_duration_multipliers(
+    score: abjad.Score,
+    *,
+    index: LeafIndex | None = None,
+    visitor: LeafVisitor | None = None,
+) -> None:
+    if index is None:
+        index = LeafIndex()
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.DURATION_MULTIPLIER)
-    already_labeled = set()
-    for voice in abjad.iterate.components(score, abjad.Voice):
-        for leaf in abjad.iterate.leaves(voice):
-            if isinstance(leaf, abjad.Skip):
-                continue
-            if leaf.dmp() is None:
-                continue
-            if leaf in already_labeled:
-                continue
-            n, d = leaf.dmp()
-            string = r"\baca-duration-multiplier-markup"
-            string += f' #"{n}" #"{d}"'
-            markup = abjad.Markup(string)
-            tag_ = tag
-            if abjad.get.has_indicator(leaf, _enums.HIDDEN):
-                tag_ = tag_.append(_tags.HIDDEN)
-            if abjad.get.has_indicator(leaf, _enums.MULTIMEASURE_REST):
-                tag_ = tag_.append(_tags.MULTIMEASURE_REST)
-            if abjad.get.has_indicator(leaf, _enums.NOTE):
-                tag_ = tag_.append(_tags.NOTE)
-            if abjad.get.has_indicator(leaf, _enums.REST_VOICE):
-                tag_ = tag_.append(_tags.REST_VOICE)
-            abjad.attach(markup, leaf, deactivate=True, direction=abjad.UP, tag=tag_)
-            already_labeled.add(leaf)
+
+    def handler(leaf):
+        if isinstance(leaf, abjad.Skip):
+            return
+        if leaf.dmp() is None:
+            return
+        if index.voice(leaf) is None:
+            return
+        n, d = leaf.dmp()
+        string = r"\baca-duration-multiplier-markup"
+        string += f' #"{n}" #"{d}"'
+        markup = abjad.Markup(string)
+        tag_ = tag
+        if abjad.get.has_indicator(leaf, _enums.HIDDEN):
+            tag_ = _helpers.append_tag(tag_, _tags.HIDDEN)
+        if abjad.get.has_indicator(leaf, _enums.MULTIMEASURE_REST):
+            tag_ = _helpers.append_tag(tag_, _tags.MULTIMEASURE_REST)
+        if abjad.get.has_indicator(leaf, _enums.NOTE):
+            tag_ = _helpers.append_tag(tag_, _tags.NOTE)
+        if abjad.get.has_indicator(leaf, _enums.REST_VOICE):
+            tag_ = _helpers.append_tag(tag_, _tags.REST_VOICE)
+        abjad.attach(markup, leaf, deactivate=True, direction=abjad.UP, tag=tag_)
+
+    _visit_leaves(score, visitor, "_label_duration_multipliers", handler)
 
 
 def _layout_removal_tags() -> list[abjad.Tag]:
@@ -1406,6 +1861,7 @@ def _layout_removal_tags() -> list[abjad.Tag]:
     ]
 
 
+@_timing.staged
 def _magnify_staves(
     magnify_staves: float | tuple[float, str] | None, score: abjad.Score
 ) -> None:
@@ -1528,6 +1984,7 @@ def _memento_to_indicator(dictionary: dict, memento: _memento.Memento) -> typing
     return indicator
 
 
+@_timing.staged
 def _move_global_rests(
     global_rests_in_every_staff: bool,
     global_rests_in_topmost_staff: bool,
@@ -1600,6 +2057,7 @@ def _persistent_indicator_tags() -> list[abjad.Tag]:
     ]
 
 
+@_timing.staged
 def _pitch_unpitched_anchor_notes(score: abjad.Score) -> None:
     pleaves = []
     for pleaf in abjad.iterate.leaves(score, pitched=True):
@@ -1637,13 +2095,13 @@ def _prototype_string(class_) -> str:
 
 
 def _reapply_persistent_indicators(
-    contexts: list[abjad.Context],
+    context_index: ContextIndex,
     manifests: dict,
     mementos: list[_memento.Memento],
     *,
     deactivate: bool = False,
 ) -> None:
-    assert all(isinstance(_, abjad.Context) for _ in contexts)
+    assert isinstance(context_index, ContextIndex), repr(context_index)
     for memento in mementos:
         if memento.get_manifest() is not None:
             if memento.get_manifest() == "instruments":
@@ -1656,7 +2114,7 @@ def _reapply_persistent_indicators(
                 raise Exception(memento.get_manifest())
         else:
             dictionary = None
-        result = _analyze_memento(contexts, dictionary, memento)
+        result = _analyze_memento(context_index, dictionary, memento)
         if result is None:
             continue
         if isinstance(result.previous_indicator, abjad.TimeSignature):
@@ -1686,6 +2144,7 @@ def _reapply_persistent_indicators(
                     deactivate=deactivate,
                     tag=result.edition.append(function_name),
                 )
+                context_index.forget(result.leaf)
                 wrapper = abjad.get.wrappers(result.leaf, result.previous_indicator)[-1]
                 _treat.treat_persistent_wrapper(manifests, wrapper, result.status)
             else:
@@ -1723,10 +2182,12 @@ def _reapply_persistent_indicators(
         except abjad.PersistentIndicatorError:
             pass
         if attached:
+            context_index.forget(result.leaf)
             wrapper = abjad.get.wrappers(result.leaf, result.previous_indicator)[-1]
             _treat.treat_persistent_wrapper(manifests, wrapper, result.status)
 
 
+@_timing.staged
 def _reanalyze_reapplied_synthetic_wrappers(score: abjad.Score) -> None:
     function_name = _helpers.function_name(_frame())
     for leaf in abjad.iterate.leaves(score):
@@ -1753,6 +2214,7 @@ def _reanalyze_reapplied_synthetic_wrappers(score: abjad.Score) -> None:
                 wrapper._synthetic_offset = None
 
 
+@_timing.staged
 def _reanalyze_trending_dynamics(manifests: dict, score: abjad.Score) -> None:
     for leaf in abjad.iterate.leaves(score):
         for wrapper in abjad.get.wrappers(leaf):
@@ -1774,6 +2236,7 @@ def _remove_layout_tags(score: abjad.Score) -> None:
                     break
 
 
+@_timing.staged
 def _replace_rests_with_multimeasure_rests(
     offset_to_measure_number: dict[abjad.Offset, int],
     score: abjad.Score,
@@ -1814,6 +2277,7 @@ def _replace_rests_with_multimeasure_rests(
             abjad.mutate.replace(group[1:], [])
 
 
+@_timing.staged
 def _set_intermittent_to_staff_position_zero(score: abjad.Score) -> None:
     pleaves = []
     for voice in abjad.iterate.components(score, abjad.Voice):
@@ -1829,6 +2293,7 @@ def _set_intermittent_to_staff_position_zero(score: abjad.Score) -> None:
     )
 
 
+@_timing.staged
 def _set_not_yet_pitched_to_staff_position_zero(score: abjad.Score) -> None:
     pleaves = []
     for pleaf in abjad.iterate.leaves(score, pitched=True):
@@ -1843,27 +2308,30 @@ def _set_not_yet_pitched_to_staff_position_zero(score: abjad.Score) -> None:
     )
 
 
+@_timing.staged
 def _shift_measure_initial_clefs(
     first_measure_number: int,
     offset_to_measure_number: dict[abjad.Offset, int],
     score: abjad.Score,
+    *,
+    index: LeafIndex | None = None,
 ) -> None:
+    if index is None:
+        index = LeafIndex(offset_to_measure_number=offset_to_measure_number)
     for staff in abjad.iterate.components(score, abjad.Staff):
         for leaf in abjad.iterate.leaves(staff):
-            start_offset = abjad.get.timespan(leaf).start_offset
-            assert isinstance(start_offset, abjad.Offset), repr(start_offset)
             wrapper = abjad.get.wrapper(leaf, abjad.Clef)
             if wrapper is None or not wrapper.tag():
                 continue
             if _tags.EXPLICIT_CLEF.string not in wrapper.tag().words():
                 continue
-            measure_number = offset_to_measure_number.get(start_offset)
-            if measure_number is None:
+            if not index.is_measure_initial(leaf):
                 continue
             clef = wrapper.unbundle_indicator()
             _override.clef_shift(leaf, clef, first_measure_number)
 
 
+@_timing.staged
 def _style_anchor_notes(score: abjad.Score) -> None:
     for note in abjad.select.components(score, abjad.Note):
         if not abjad.get.has_indicator(note, _enums.ANCHOR_NOTE):
@@ -1872,6 +2340,7 @@ def _style_anchor_notes(score: abjad.Score) -> None:
         _append_tag_to_wrappers(note, _tags.ANCHOR_NOTE)
 
 
+@_timing.staged
 def _style_fermata_measures(
     fermata_extra_offset_y: float,
     fermata_measure_empty_overrides: list[int],
@@ -1879,11 +2348,15 @@ def _style_fermata_measures(
     final_section: bool,
     offset_to_measure_number: dict[abjad.Offset, int],
     score: abjad.Score,
+    *,
+    index: LeafIndex | None = None,
 ) -> None:
     if not fermata_measure_empty_overrides:
         return
     if not fermata_start_offsets:
         return
+    if index is None:
+        index = LeafIndex(offset_to_measure_number=offset_to_measure_number)
     bar_lines_already_styled = []
     empty_fermata_measure_start_offsets = []
     for measure_number in fermata_measure_empty_overrides or []:
@@ -1893,10 +2366,10 @@ def _style_fermata_measures(
         for leaf in abjad.iterate.leaves(staff):
             if abjad.get.has_indicator(leaf, (_enums.ANCHOR_NOTE, _enums.ANCHOR_SKIP)):
                 continue
-            start_offset = abjad.get.timespan(leaf).start_offset
+            start_offset = index.start_offset(leaf)
             if start_offset not in fermata_start_offsets:
                 continue
-            voice = abjad.get.parentage(leaf).get(abjad.Voice)
+            voice = index.voice(leaf)
             assert voice is not None
             assert isinstance(voice, abjad.Voice)
             voice_name = voice.name()
@@ -1952,7 +2425,7 @@ def _style_fermata_measures(
                 else:
                     next_bar_extent_ = next_bar_extent
                 wrapper = abjad.get.effective_wrapper(next_leaf, _classes.StaffLines)
-                next_leaf_start_offset = abjad.get.timespan(next_leaf).start_offset
+                next_leaf_start_offset = index.start_offset(next_leaf)
                 if wrapper is None or (
                     wrapper.start_offset() != next_leaf_start_offset
                 ):
@@ -2014,10 +2487,7 @@ def _style_fermata_measures(
             strings.append(string)
             literal = abjad.LilyPondLiteral(strings, site="after")
             tag = _tags.FERMATA_MEASURE
-            measure_number_tag = _get_measure_number_tag(
-                rest,
-                offset_to_measure_number,
-            )
+            measure_number_tag = _get_measure_number_tag(rest, index)
             if measure_number_tag is not None:
                 tag = tag.append(measure_number_tag)
             abjad.attach(
@@ -2027,6 +2497,7 @@ def _style_fermata_measures(
             )
 
 
+@_timing.staged
 def _style_first_measure(global_skips: abjad.Context, section_number: str) -> None:
     skip = _select.skip(global_skips, 0)
     abjad.attach(
@@ -2051,10 +2522,14 @@ def _style_first_measure(global_skips: abjad.Context, section_number: str) -> No
     )
 
 
-def _style_framed_notes(score: abjad.Score) -> None:
+@_timing.staged
+def _style_framed_notes(
+    score: abjad.Score, *, visitor: LeafVisitor | None = None
+) -> None:
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.FRAMED_LEAF)
-    for leaf in abjad.iterate.leaves(score):
+
+    def handler(leaf):
         if abjad.get.indicator(leaf, _enums.FRAMED_LEAF):
             duration = abjad.get.duration(leaf)
             leaf.set_written_duration(abjad.Duration(1, 4))
@@ -2065,6 +2540,14 @@ def _style_framed_notes(score: abjad.Score) -> None:
             literal = abjad.LilyPondLiteral(r"\once \override Stem.thickness = 6")
             abjad.attach(literal, leaf, tag=tag)
 
+    _visit_leaves(
+        score,
+        visitor,
+        "_style_framed_notes",
+        handler,
+        after=("_label_duration_multipliers",),
+    )
+
 
 def _update_score_one_time(score: abjad.Score) -> None:
     is_forbidden_to_update = score._is_forbidden_to_update
@@ -2073,6 +2556,25 @@ def _update_score_one_time(score: abjad.Score) -> None:
     score._is_forbidden_to_update = is_forbidden_to_update
 
 
+def _visit_leaves(
+    score: abjad.Score,
+    visitor: LeafVisitor | None,
+    name: str,
+    function: typing.Callable[[abjad.Leaf], None],
+    *,
+    after: tuple[str, ...] = (),
+    pitched: bool = False,
+) -> None:
+    if visitor is None:
+        visitor = LeafVisitor(score)
+        visitor.register(name, function, after=after, pitched=pitched)
+        visitor.run()
+    else:
+        assert visitor.score is score, repr(visitor.score)
+        visitor.register(name, function, after=after, pitched=pitched)
+
+
+@_timing.staged
 def _whitespace_leaves(score: abjad.Score) -> None:
     for leaf in abjad.iterate.leaves(score):
         literal = abjad.LilyPondLiteral("", site="absolute_before")
@@ -2162,42 +2664,31 @@ def append_anchor_note(argument, *, runtime=None) -> None:
     voice.append(note)
 
 
+@_timing.staged
 def cache_leaves(
-    score: abjad.Score, measure_count: int, voice_abbreviations: dict | None = None
+    score: abjad.Score,
+    measure_count: int,
+    voice_abbreviations: dict | None = None,
+    *,
+    measure_index: MeasureIndex | None = None,
 ) -> CacheGetItemWrapper:
-    measure_timespans = []
-    for measure_index in range(measure_count):
-        measure_number = measure_index + 1
-        measure_timespan = _get_measure_timespan(measure_number, score)
-        measure_timespans.append(measure_timespan)
+    if measure_index is None:
+        measure_index = _get_measure_index(score, measure_count)
     voice_name_to_leaves_by_measure_dict: dict[str, dict] = {}
-    for leaf in abjad.select.leaves(score):
-        parentage = abjad.get.parentage(leaf)
-        context = parentage.get(abjad.Context)
-        assert isinstance(context, abjad.Context)
-        context_name = context.name()
-        assert context_name is not None
-        measure_number_to_leaves = voice_name_to_leaves_by_measure_dict.setdefault(
-            context_name, {}
-        )
-        leaf_timespan = abjad.get.timespan(leaf)
-        # TODO: replace loop with bisection:
-        for i, measure_timespan in enumerate(measure_timespans):
-            measure_number = i + 1
-            if (
-                measure_timespan.start_offset <= leaf_timespan.start_offset
-                and leaf_timespan.start_offset < measure_timespan.stop_offset
-            ):
-                cached_leaves = measure_number_to_leaves.setdefault(measure_number, [])
-                cached_leaves.append(leaf)
-    if voice_abbreviations:
-        voice_name_to_leaves_by_measure = CacheGetItemWrapper(
-            voice_name_to_leaves_by_measure_dict,
-            voice_abbreviations,
-        )
-        voice_name_to_leaves_by_measure._score = score
-        voice_name_to_leaves_by_measure._measure_count = measure_count
-        voice_name_to_leaves_by_measure._voice_abbreviations = voice_abbreviations
+    _cache_leaves(
+        abjad.select.leaves(score),
+        measure_index,
+        voice_name_to_leaves_by_measure_dict,
+    )
+    voice_abbreviations = voice_abbreviations or {}
+    voice_name_to_leaves_by_measure = CacheGetItemWrapper(
+        voice_name_to_leaves_by_measure_dict,
+        voice_abbreviations,
+    )
+    voice_name_to_leaves_by_measure._score = score
+    voice_name_to_leaves_by_measure._measure_count = measure_count
+    voice_name_to_leaves_by_measure._measure_index = measure_index
+    voice_name_to_leaves_by_measure._voice_abbreviations = voice_abbreviations
     return voice_name_to_leaves_by_measure
 
 
@@ -2222,6 +2713,7 @@ def cache_voices(
     return VoiceCache(score, voice_abbreviations)
 
 
+@_timing.staged
 def color_octaves(score: abjad.Score) -> None:
     vertical_moments = abjad.iterate_vertical_moments(score)
     markup = abjad.Markup(r"\markup OCTAVE")
@@ -2266,27 +2758,51 @@ def color_octaves(score: abjad.Score) -> None:
 _color_octaves_alias = color_octaves
 
 
-def color_out_of_range_pitches(score: abjad.Score) -> None:
+@_timing.staged
+def color_out_of_range_pitches(
+    score: abjad.Score,
+    *,
+    index: LeafIndex | None = None,
+    visitor: LeafVisitor | None = None,
+) -> None:
+    if index is None:
+        index = LeafIndex()
     indicator = _enums.ALLOW_OUT_OF_RANGE
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.OUT_OF_RANGE_COLORING)
-    for voice in abjad.iterate.components(score, abjad.Voice):
-        for pleaf in abjad.iterate.leaves(voice, pitched=True):
-            if abjad.get.has_indicator(pleaf, _enums.HIDDEN):
-                continue
-            if abjad.get.has_indicator(pleaf, indicator):
-                continue
-            instrument = abjad.get.effective_indicator(pleaf, abjad.Instrument)
-            if instrument is None:
-                continue
-            if not abjad.iterpitches.sounding_pitches_are_in_range(
-                pleaf, instrument.pitch_range
-            ):
+
+    def handler(pleaf):
+        if abjad.get.has_indicator(pleaf, _enums.HIDDEN):
+            return
+        if abjad.get.has_indicator(pleaf, indicator):
+            return
+        instrument = index.instrument(pleaf)
+        if instrument is None:
+            return
+        if index.voice(pleaf) is None:
+            return
+        if not abjad.iterpitches.sounding_pitches_are_in_range(
+            pleaf, instrument.pitch_range
+        ):
+            # colored once per enclosing voice, like the per-voice loop this replaces
+            for component in abjad.get.parentage(pleaf):
+                if not isinstance(component, abjad.Voice):
+                    continue
                 string = r"\baca-out-of-range-coloring"
                 literal = abjad.LilyPondLiteral(string, site="before")
                 abjad.attach(literal, pleaf, tag=tag)
 
+    _visit_leaves(
+        score,
+        visitor,
+        "color_out_of_range_pitches",
+        handler,
+        after=("transpose_score",),
+        pitched=True,
+    )
+
 
+@_timing.staged
 def color_repeat_pitch_classes(score: abjad.Score) -> None:
     tag = _helpers.function_name(_frame())
     tag = tag.append(_tags.REPEAT_PITCH_CLASS_COLORING)
@@ -2298,6 +2814,7 @@ def color_repeat_pitch_classes(score: abjad.Score) -> None:
             abjad.attach(literal, leaf, tag=tag)
 
 
+@_timing.staged
 def deactivate_tags(score: abjad.Score, *tags: abjad.Tag) -> None:
     assert all(isinstance(_, abjad.Tag) for _ in tags), repr(tags)
     for leaf in abjad.iterate.leaves(score):
@@ -2311,6 +2828,7 @@ def deactivate_tags(score: abjad.Score, *tags: abjad.Tag) -> None:
                     break
 
 
+@_timing.staged
 def extend_beams(score: abjad.Score) -> None:
     for leaf in abjad.iterate.leaves(score):
         if abjad.get.indicator(leaf, _enums.RIGHT_OPEN_BEAM):
@@ -2583,6 +3101,8 @@ def postprocess(
     if doctest is False:
         assert isinstance(environment, _build.Environment), repr(environment)
         assert isinstance(manifests, dict), repr(manifests)
+    if manifests is not None:
+        manifests = _treat.index_manifests(manifests)
     assert isinstance(all_music_in_part_containers, bool)
     if clock_time_override is not None:
         assert isinstance(clock_time_override, abjad.MetronomeMark)
@@ -2639,6 +3159,10 @@ def postprocess(
                 time_signatures,
             )
     with abjad.contextmanagers.ForbidUpdate(component=score, update_on_exit=True):
+        if doctest is False:
+            index = LeafIndex(score, offset_to_measure_number)
+        else:
+            index = LeafIndex(score)
         abjad.makers.tweak_tuplet_bracket_edge_height(score)
         tuplets = abjad.select.tuplets(score)
         rmakers.tweak_tuplet_number_text_calc_fraction_text(tuplets)
@@ -2675,11 +3199,13 @@ def postprocess(
             )
         _reanalyze_trending_dynamics(manifests, score)
         _reanalyze_reapplied_synthetic_wrappers(score)
+        visitor = LeafVisitor(score)
         if do_not_transpose_score is False:
-            transpose_score(score)
+            transpose_score(score, visitor=visitor)
         if do_not_color_not_yet_registered is False:
-            _color_not_yet_registered(score)
-        _color_mock_pitch(score)
+            _color_not_yet_registered(score, visitor=visitor)
+        _color_mock_pitch(score, visitor=visitor)
+        visitor.run()
         _set_intermittent_to_staff_position_zero(score)
         _pitch_unpitched_anchor_notes(score)
         if not do_not_error_on_not_yet_pitched:
@@ -2687,10 +3213,11 @@ def postprocess(
         if do_not_color_not_yet_pitched is False:
             _color_not_yet_pitched(score)
         _set_not_yet_pitched_to_staff_position_zero(score)
-        _clean_up_repeat_tie_direction(score)
-        _clean_up_laissez_vibrer_tie_direction(score)
-        _check_doubled_dynamics(score)
-        color_out_of_range_pitches(score)
+        _clean_up_repeat_tie_direction(score, visitor=visitor)
+        _clean_up_laissez_vibrer_tie_direction(score, visitor=visitor)
+        _check_doubled_dynamics(score, index=index, visitor=visitor)
+        color_out_of_range_pitches(score, index=index, visitor=visitor)
+        visitor.run()
         if doctest is False:
             _check_persistent_indicators(
                 do_not_require_short_instrument_names,
@@ -2700,11 +3227,12 @@ def postprocess(
             color_repeat_pitch_classes(score)
         if color_octaves:
             _color_octaves_alias(score)
-        _attach_shadow_tie_indicators(score)
+        _attach_shadow_tie_indicators(score, visitor=visitor)
         if do_not_force_nonnatural_accidentals is False:
-            _force_nonnatural_accidentals(score)
-        _label_duration_multipliers(score)
-        _style_framed_notes(score)
+            _force_nonnatural_accidentals(score, visitor=visitor)
+        _label_duration_multipliers(score, index=index, visitor=visitor)
+        _style_framed_notes(score, visitor=visitor)
+        visitor.run()
         _magnify_staves(magnify_staves, score)
         if doctest is False:
             _whitespace_leaves(score)
@@ -2712,6 +3240,7 @@ def postprocess(
                 first_measure_number,
                 offset_to_measure_number,
                 score,
+                index=index,
             )
             if first_section is False:
                 context = score["Skips"]
@@ -2728,11 +3257,13 @@ def postprocess(
                 final_section,
                 offset_to_measure_number,
                 score,
+                index=index,
             )
             _shift_measure_initial_clefs(
                 first_measure_number,
                 offset_to_measure_number,
                 score,
+                index=index,
             )
             container_to_part_assignment = _add_container_identifiers(
                 score,
@@ -2756,18 +3287,7 @@ def postprocess(
         if not _global_rests_are_meaningful(context_):
             del score["Rests"]
     if do_not_check_wellformedness is False:
-        count, message = abjad.wf.tabulate_wellformedness(
-            score,
-            do_not_check_out_of_range_pitches=True,
-            do_not_check_unmatched_stop_text_spans=True,
-        )
-        if count:
-            raise Exception("\n" + message)
-        violators, total = abjad.wf.check_out_of_range_pitches(
-            score, allow_indicators=(_enums.ALLOW_OUT_OF_RANGE, _enums.HIDDEN)
-        )
-        if violators:
-            raise Exception(f"{len(violators)} /    {total} out of range pitches")
+        _check_wellformedness(score)
     if doctest is False:
         previous_stop_clock_time: str | None
         if environment.section_not_included_in_score:
@@ -2833,6 +3353,7 @@ def proxy(mapping) -> types.MappingProxyType:
     return types.MappingProxyType(mapping)
 
 
+@_timing.staged
 def reapply_persistent_indicators(
     voices: VoiceCache,
     previous_persistent_indicators: dict,
@@ -2842,7 +3363,7 @@ def reapply_persistent_indicators(
 ) -> None:
     if deactivate_contexts is None:
         deactivate_contexts = []
-    manifests = manifests or {}
+    manifests = _treat.index_manifests(manifests or {})
     already_reapplied_contexts = {"Score"}
     previous_persistent_indicators = dict(previous_persistent_indicators)
     if "Score" in previous_persistent_indicators:
@@ -2852,7 +3373,7 @@ def reapply_persistent_indicators(
         break
     score = abjad.get.parentage(leaf).get(abjad.Score)
     assert score is not None
-    contexts = abjad.select.components(score, abjad.Context)
+    context_index = ContextIndex(score)
     for voice in voices:
         leaf = abjad.select.leaf(voice, 0)
         for component in abjad.get.parentage(leaf):
@@ -2863,7 +3384,7 @@ def reapply_persistent_indicators(
                 if component_name not in already_reapplied_contexts:
                     mementos = previous_persistent_indicators.get(component_name, [])
                     _reapply_persistent_indicators(
-                        contexts,
+                        context_index,
                         manifests,
                         mementos,
                         deactivate=deactivate,
@@ -2871,6 +3392,7 @@ def reapply_persistent_indicators(
                     already_reapplied_contexts.add(component_name)
 
 
+@_timing.staged
 def remove_redundant_time_signatures(global_skips: abjad.Context) -> list[str]:
     previous_time_signature = None
     cached_time_signatures = []
@@ -2888,6 +3410,7 @@ def remove_redundant_time_signatures(global_skips: abjad.Context) -> list[str]:
     return cached_time_signatures
 
 
+@_timing.staged
 def set_up_score(
     score: abjad.Score,
     time_signatures: list[abjad.TimeSignature],
@@ -2901,9 +3424,8 @@ def set_up_score(
     score_persistent_indicators: list[_memento.Memento] | None = None,
 ) -> None:
     assert all(isinstance(_, abjad.TimeSignature) for _ in time_signatures)
-    manifests = manifests or {}
+    manifests = _treat.index_manifests(manifests or {})
     measure_initial_grace_notes = measure_initial_grace_notes or {}
-    assert isinstance(manifests, dict), repr(manifests)
     if "TimeSignatures" in score:
         context = score["TimeSignatures"]
         assert isinstance(context, abjad.Context)
@@ -2962,8 +3484,10 @@ def set_up_score(
         assert isinstance(context, abjad.Context)
         _make_global_rests(context, time_signatures)
     if score_persistent_indicators:
-        contexts = abjad.select.components(score, abjad.Context)
-        _reapply_persistent_indicators(contexts, manifests, score_persistent_indicators)
+        context_index = ContextIndex(score)
+        _reapply_persistent_indicators(
+            context_index, manifests, score_persistent_indicators
+        )
 
 
 def short_instrument_name_color_tags() -> list[abjad.Tag]:
@@ -2992,6 +3516,7 @@ def sort_dictionary(dictionary: dict) -> None:
         dictionary[key] = value
 
 
+@_timing.staged
 def span_metronome_marks(
     global_skips: abjad.Context,
     *,
@@ -3345,6 +3870,7 @@ def span_metronome_marks(
         )
 
 
+@_timing.staged
 def style_anchor_skip(score: abjad.Score) -> None:
     anchor_skips = []
     for context in abjad.select.components(score, abjad.Context):
@@ -3383,19 +3909,23 @@ def style_anchor_skip(score: abjad.Score) -> None:
         )
 
 
-def transpose_score(score: abjad.Score) -> None:
-    for pleaf in _select.pleaves(score):
+@_timing.staged
+def transpose_score(score: abjad.Score, *, visitor: LeafVisitor | None = None) -> None:
+    def handler(pleaf):
         if abjad.get.has_indicator(pleaf, _enums.DO_NOT_TRANSPOSE):
-            continue
+            return
         if abjad.get.has_indicator(pleaf, _enums.STAFF_POSITION):
-            continue
+            return
         abjad.iterpitches.transpose_from_sounding_pitch(pleaf)
 
+    _visit_leaves(score, visitor, "transpose_score", handler, pitched=True)
 
+
+@_timing.staged
 def treat_untreated_persistent_wrappers(
     score: abjad.Score, *, manifests: dict | None = None
 ) -> None:
-    manifests = manifests or {}
+    manifests = _treat.index_manifests(manifests or {})
     dynamic_prototype = (abjad.Dynamic, abjad.StartHairpin)
     tempo_prototype = (
         _classes.Accelerando,
@@ -3403,12 +3933,13 @@ def treat_untreated_persistent_wrappers(
         _classes.Ritardando,
     )
 
+    persistent_indicator_words = frozenset(
+        _.string for _ in _persistent_indicator_tags()
+    )
+
     def has_persistence_tag(tag):
-        tags = _persistent_indicator_tags()
-        for word in tag.words():
-            if type(tag)(word) in tags:
-                return True
-        return False
+        words = _treat._get_tag_words(tag)
+        return not persistent_indicator_words.isdisjoint(words)
 
     for leaf in abjad.iterate.leaves(score):
         for wrapper in abjad.get.wrappers(leaf):
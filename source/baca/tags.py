@@ -4,6 +4,8 @@ Tags.
 
 import abjad
 
+from . import helpers as _helpers
+
 # BAR EXTENT
 
 EXPLICIT_BAR_EXTENT = abjad.Tag("EXPLICIT_BAR_EXTENT")
@@ -258,5 +260,5 @@ REDUNDANT_TIME_SIGNATURE_COLOR = abjad.Tag("REDUNDANT_TIME_SIGNATURE_COLOR")
 def tag(wrappers: list[abjad.wrapper.Wrapper], *tags: abjad.Tag):
     for wrapper in wrappers:
         for tag in tags:
-            tag_ = wrapper.tag().append(tag)
+            tag_ = _helpers.append_tag(wrapper.tag(), tag)
             wrapper.set_tag(tag_)
@@ -0,0 +1,98 @@
+"""
+Timing.
+"""
+
+import cProfile
+import contextlib
+import dataclasses
+import functools
+import time
+
+import abjad
+
+_active_timings: list = []
+
+
+def _census(component: abjad.Component) -> tuple[int, int]:
+    leaves, wrappers = 0, 0
+    for component_ in abjad.iterate.components(component):
+        if isinstance(component_, abjad.Leaf):
+            leaves += 1
+        wrappers += len(component_._wrappers)
+    return leaves, wrappers
+
+
+@dataclasses.dataclass(slots=True)
+class Stage:
+    name: str
+    seconds: float
+    leaves: int | None = None
+    wrappers: int | None = None
+
+
+@dataclasses.dataclass(slots=True, order=True, unsafe_hash=True)
+class Timing:
+    lilypond: int | None = None
+    make_score: int | None = None
+    postprocess: int | None = None
+    cprofile: bool = dataclasses.field(default=False, compare=False, hash=False)
+    profile: bool = dataclasses.field(default=False, compare=False, hash=False)
+    profiles: dict[str, cProfile.Profile] = dataclasses.field(
+        default_factory=dict, compare=False, hash=False
+    )
+    stages: list[Stage] = dataclasses.field(
+        default_factory=list, compare=False, hash=False
+    )
+
+
+@contextlib.contextmanager
+def activate(timing: Timing):
+    assert isinstance(timing, Timing), repr(timing)
+    _active_timings.append(timing)
+    try:
+        yield timing
+    finally:
+        _active_timings.pop()
+
+
+def active_timing() -> Timing | None:
+    if _active_timings:
+        return _active_timings[-1]
+    return None
+
+
+@contextlib.contextmanager
+def stage(name: str, component: abjad.Component | None = None):
+    timing = active_timing()
+    if timing is None:
+        yield
+        return
+    census = None
+    if timing.profile and component is not None:
+        census = _census(component)
+    start_time = time.perf_counter()
+    yield
+    stage_ = Stage(name, time.perf_counter() - start_time)
+    if census is not None:
+        assert component is not None
+        leaves, wrappers = _census(component)
+        stage_.leaves = leaves
+        stage_.wrappers = wrappers - census[1]
+    timing.stages.append(stage_)
+
+
+def staged(function):
+    @functools.wraps(function)
+    def wrapper(*arguments, **keywords):
+        if not _active_timings or keywords.get("visitor") is not None:
+            return function(*arguments, **keywords)
+        component = None
+        for argument in arguments:
+            if isinstance(argument, abjad.Context):
+                component = argument
+                break
+        with stage(function.__name__, component):
+            result = function(*arguments, **keywords)
+        return result
+
+    return wrapper
@@ -2,6 +2,7 @@
 Treat.
 """
 
+import functools
 import typing
 from inspect import currentframe as _frame
 
@@ -14,6 +15,30 @@ from . import memento as _memento
 from . import tags as _tags
 
 
+class IndexedManifests(dict):
+    """
+    Manifests with a value-to-key index of each manifest, built once on
+    construction; later changes to the manifests are not indexed.
+    """
+
+    __slots__ = ("indices",)
+
+    def __init__(self, manifests: dict) -> None:
+        assert isinstance(manifests, dict), repr(manifests)
+        super().__init__(manifests)
+        self.indices: dict[str, dict] = {}
+        for name, manifest in self.items():
+            if not isinstance(manifest, dict):
+                continue
+            index: dict = {}
+            for key, value in manifest.items():
+                try:
+                    index.setdefault(value, key)
+                except TypeError:
+                    pass
+            self.indices[name] = index
+
+
 def _attach_color_literal(
     wrapper: abjad.wrapper.Wrapper,
     status: str,
@@ -86,11 +111,11 @@ def _attach_color_literal(
         literal = abjad.LilyPondLiteral(string, site="before")
     if cancelation is True:
         tag = _helpers.function_name(_frame(), n=1)
-        tag = tag.append(status_tag)
+        tag = _helpers.append_tag(tag, status_tag)
         abjad.attach(literal, component, deactivate=True, tag=tag)
     else:
         tag = _helpers.function_name(_frame(), n=2)
-        tag = tag.append(status_tag)
+        tag = _helpers.append_tag(tag, status_tag)
         abjad.attach(
             literal,
             component,
@@ -182,13 +207,24 @@ def _attach_latent_indicator_alert(
         )
 
 
-def _get_key(dictionary, value):
-    if dictionary is not None:
-        for key, value_ in dictionary.items():
-            if value_ == value:
-                return key
+def _get_key(manifests, name, value):
+    dictionary = manifests[name]
+    if dictionary is None:
+        return None
+    if isinstance(manifests, IndexedManifests):
+        try:
+            key = manifests.indices[name].get(value)
+        except TypeError:
+            key = None
+        if key is not None:
+            return key
+    for key, value_ in dictionary.items():
+        if value_ == value:
+            return key
+    return None
 
 
+@functools.lru_cache(maxsize=1024)
 def _get_tag(
     status: str, stem: str, prefix: str | None = None, suffix: str | None = None
 ) -> abjad.Tag:
@@ -204,6 +240,11 @@ def _get_tag(
     return tag
 
 
+@functools.lru_cache(maxsize=4096)
+def _get_tag_words(tag: abjad.Tag) -> frozenset[str]:
+    return frozenset(tag.words())
+
+
 def _indicator_to_grob(indicator) -> str:
     if isinstance(indicator, abjad.Dynamic):
         return "DynamicText"
@@ -237,11 +278,11 @@ def _indicator_to_key(
     elif isinstance(indicator, abjad.StartHairpin):
         key = indicator.shape
     elif isinstance(indicator, abjad.Instrument):
-        key = _get_key(manifests["abjad.Instrument"], indicator)
+        key = _get_key(manifests, "abjad.Instrument", indicator)
     elif isinstance(indicator, abjad.MetronomeMark):
-        key = _get_key(manifests["abjad.MetronomeMark"], indicator)
+        key = _get_key(manifests, "abjad.MetronomeMark", indicator)
     elif isinstance(indicator, abjad.ShortInstrumentName):
-        key = _get_key(manifests["abjad.ShortInstrumentName"], indicator)
+        key = _get_key(manifests, "abjad.ShortInstrumentName", indicator)
     elif isinstance(indicator, abjad.TimeSignature):
         key = f"{indicator.numerator}/{indicator.denominator}"
     elif isinstance(indicator, abjad.VoiceNumber):
@@ -278,10 +319,10 @@ def _set_status_tag(
     tag = wrapper.tag()
     tag_ = _helpers.function_name(_frame())
     if tag_.string not in tag.string:
-        tag = tag.append(tag_)
+        tag = _helpers.append_tag(tag, tag_)
     status_tag = _get_tag(status, stem, prefix=prefix)
     if status_tag.string not in tag.string:
-        tag = tag.append(status_tag)
+        tag = _helpers.append_tag(tag, status_tag)
     wrapper.set_tag(tag)
 
 
@@ -376,6 +417,12 @@ def _to_indicator_stem(indicator: typing.Any) -> str:
     return abjad.string.to_shout_case(stem)
 
 
+def index_manifests(manifests: dict) -> IndexedManifests:
+    if isinstance(manifests, IndexedManifests):
+        return manifests
+    return IndexedManifests(manifests)
+
+
 def remove_reapplied_wrappers(leaf: abjad.Leaf, item: typing.Any) -> list | None:
     assert isinstance(leaf, abjad.Leaf), repr(leaf)
     if isinstance(item, abjad.Bundle):
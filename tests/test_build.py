@@ -0,0 +1,767 @@
+import cProfile
+import json
+import os
+import pathlib
+import time
+import types
+
+import abjad
+
+import baca
+
+
+def test_mirror_writes_skip_unchanged_files(tmp_path):
+    """
+    Background mirror writer rewrites only files whose content changed.
+    """
+
+    path = tmp_path / "Regression" / "verbose" / "music.ly"
+    baca.build._submit_mirror_job(baca.build._write_mirror_files, [(path, "foo\n")])
+    assert baca.build.wait_for_mirror_writes() == 0
+    assert path.read_text() == "foo\n"
+    os.utime(path, ns=(0, 0))
+    baca.build._submit_mirror_job(baca.build._write_mirror_files, [(path, "foo\n")])
+    assert baca.build.wait_for_mirror_writes() == 0
+    assert path.stat().st_mtime_ns == 0
+    baca.build._submit_mirror_job(baca.build._write_mirror_files, [(path, "bar\n")])
+    assert baca.build.wait_for_mirror_writes() == 0
+    assert path.read_text() == "bar\n"
+
+
+def test_mirror_copies_keep_source_modes_and_mtimes(tmp_path):
+    """
+    Scorebuilds mirror copies keep source modes and mtimes, like shutil.copy2().
+    """
+
+    source = tmp_path / "source.ly"
+    source.write_text("foo\n")
+    source.chmod(0o640)
+    os.utime(source, ns=(10**9, 2 * 10**9))
+    path = tmp_path / "Regression" / "scorebuilds" / "music.ly"
+    items = [(path, source.read_bytes(), source.stat())]
+    baca.build._submit_mirror_job(baca.build._write_mirror_copies, items)
+    assert baca.build.wait_for_mirror_writes() == 0
+    assert path.read_text() == "foo\n"
+    assert path.stat().st_mtime_ns == 2 * 10**9
+    assert path.stat().st_mode & 0o7777 == 0o640
+    os.utime(source, ns=(10**9, 3 * 10**9))
+    items = [(path, source.read_bytes(), source.stat())]
+    baca.build._submit_mirror_job(baca.build._write_mirror_copies, items)
+    assert baca.build.wait_for_mirror_writes() == 0
+    assert path.stat().st_mtime_ns == 3 * 10**9
+
+
+def test_untagged_and_bw_mirrors(tmp_path):
+    """
+    Untagged and bw mirrors are made from section texts in memory; the
+    result matches what coloring and annotation undo wrote to disk.
+    """
+
+    section_directory = tmp_path / "Scores" / "trevor" / "contents"
+    section_directory = section_directory / "sections" / "01"
+    music_ly = abjad.string.normalize(
+        r"""
+        \version "2.25.0"
+        \include "music.ily"
+        \context Score = "Score"
+        <<
+            \context Staff = "Music_Staff"
+            {
+                \01.Music_Staff
+            }
+        >>
+        """
+    )
+    music_ily = abjad.string.normalize(
+        r"""
+        01.Music_Voice =
+        {
+            % BEFORE:
+            % COMMANDS:
+              %! EXPLICIT_CLEF_COLOR
+            \once \override Staff.Clef.color = #(x11-color 'blue)
+              %! EXPLICIT_CLEF
+            \clef "bass"
+              %! REDUNDANT_DYNAMIC_COLOR
+            %@% \once \override Voice.DynamicText.color = #(x11-color 'DeepPink1)
+            c'4
+            \p
+              %! CLOCK_TIME
+            ^ \markup { 0'00'' }
+              %! REAPPLIED_DYNAMIC
+            %@% \f
+            d'4
+              %! STAGE_NUMBER
+            %@% - \baca-start-snm-left-only "[1]"
+            e'4
+            \stopStaff %@%
+            f'4
+        }
+        """
+    )
+    layout_ily = abjad.string.normalize(
+        r"""
+        % Score_Layout
+        \context Score = "Score"
+        {
+              %! SPACING
+            \baca-new-spacing-section #1 #16
+            \time 4/4
+        }
+        """
+    )
+    texts = {
+        "music.ly": music_ly + "\n",
+        "music.ily": music_ily + "\n",
+        "layout.ily": layout_ily + "\n",
+    }
+    baca.build._write_untagged_and_bw_mirrors(section_directory, texts)
+    directory = tmp_path / "Regression" / "{}" / "trevor" / "contents"
+    directory = directory / "sections" / "01"
+    untagged = pathlib.Path(str(directory).format("untagged"))
+    bw = pathlib.Path(str(directory).format("bw"))
+    assert (untagged / "music.ly").read_text() == music_ly + "\n"
+    assert (bw / "music.ly").read_text() == music_ly + "\n"
+
+    assert (untagged / "music.ily").read_text() == abjad.string.normalize(
+        r"""
+        01.Music_Voice =
+        {
+            \once \override Staff.Clef.color = #(x11-color 'blue)
+            \clef "bass"
+            %@% \once \override Voice.DynamicText.color = #(x11-color 'DeepPink1)
+            c'4
+            \p
+            ^ \markup { 0'00'' }
+            %@% \f
+            d'4
+            %@% - \baca-start-snm-left-only "[1]"
+            e'4
+            \stopStaff %@%
+            f'4
+        }
+        """
+    ) + "\n"
+
+    assert (bw / "music.ily").read_text() == abjad.string.normalize(
+        r"""
+        01.Music_Voice =
+        {
+            \clef "bass"
+            c'4
+            \p
+            d'4
+            e'4
+            \stopStaff
+            f'4
+        }
+        """
+    ) + "\n"
+
+    assert (untagged / "layout.ily").read_text() == abjad.string.normalize(
+        r"""
+        % Score_Layout
+        \context Score = "Score"
+        {
+            \baca-new-spacing-section #1 #16
+            \time 4/4
+        }
+        """
+    ) + "\n"
+
+    assert (bw / "layout.ily").read_text() == abjad.string.normalize(
+        r"""
+        % Score_Layout
+        \context Score = "Score"
+        {
+            \time 4/4
+        }
+        """
+    ) + "\n"
+
+
+def test_timed_disables_profiler_on_exception():
+    """
+    An exception in a timed function leaves no profiler running.
+    """
+
+    @baca.build.timed("make_score")
+    def foo():
+        raise ValueError
+
+    timing = baca.build.Timing(cprofile=True)
+    try:
+        foo(timing=timing)
+    except ValueError:
+        pass
+    assert baca.timing.active_timing() is None
+    profile = cProfile.Profile()
+    profile.enable()
+    profile.disable()
+
+
+def test_write_timing_json(tmp_path):
+    """
+    Timing JSON records build times and stages.
+    """
+
+    timing = baca.build.Timing(make_score=1, postprocess=2, lilypond=3)
+    timing.stages.append(baca.build.Stage("foo", 0.5, 4, 1))
+    baca.build._write_timing_json(tmp_path, timing)
+    dictionary = json.loads((tmp_path / ".timing.json").read_text())
+    assert dictionary["make_score"] == 1
+    assert dictionary["postprocess"] == 2
+    assert dictionary["lilypond"] == 3
+    assert dictionary["stages"] == [
+        {"name": "foo", "seconds": 0.5, "leaves": 4, "wrappers": 1}
+    ]
+    assert not list(tmp_path.glob("*.prof"))
+
+
+def test_build_sections_runs_each_section_in_a_fresh_process(tmp_path):
+    """
+    Parallel section builds share no worker process or module state.
+    """
+
+    sections_directory = tmp_path / "sections"
+    for name in ("01", "02", "03"):
+        section_directory = sections_directory / name
+        section_directory.mkdir(parents=True)
+        (section_directory / "music.py").write_text(
+            "import os\n"
+            "import pathlib\n"
+            "import baca\n"
+            "leaked = getattr(baca.build, '_test_section', None)\n"
+            "baca.build._test_section = pathlib.Path.cwd().name\n"
+            "pathlib.Path('result.txt').write_text(f'{os.getpid()} {leaked}')\n"
+            "pathlib.Path('.metadata').write_text('{}')\n"
+        )
+    assert baca.build.build_sections(sections_directory, ["--pdf"], jobs=2) == 0
+    pids = set()
+    for name in ("01", "02", "03"):
+        pid, leaked = (sections_directory / name / "result.txt").read_text().split()
+        pids.add(pid)
+        assert leaked == "None"
+    assert len(pids) == 3
+
+
+def test_build_parts_counts_failed_parts(tmp_path, capsys):
+    """
+    build_parts() returns the number of failed parts and logs each failure.
+    """
+
+    parts_directory = tmp_path / "contents" / "builds" / "score-parts"
+    for name in ("a", "b"):
+        part_directory = parts_directory / name
+        part_directory.mkdir(parents=True)
+        (part_directory / "layout.py").write_text("")
+    (parts_directory / "c").mkdir()
+    assert baca.build.build_parts(parts_directory, jobs=2) == 2
+    string = capsys.readouterr().out
+    for name in ("a", "b"):
+        assert f"Missing {parts_directory / name / 'music.ly'}" in string
+        assert "Building" in (parts_directory / name / ".build.log").read_text()
+    assert not (parts_directory / "c" / ".build.log").exists()
+
+
+def test_run_xelatex_skips_converged_reruns(tmp_path, monkeypatch):
+    """
+    run_xelatex() reruns xelatex only while .aux output changes and keeps .aux
+    output between builds.
+    """
+
+    bin_directory = tmp_path / "bin"
+    bin_directory.mkdir()
+    xelatex = bin_directory / "xelatex"
+    xelatex.write_text(
+        "#!/bin/sh\n"
+        'for argument in "$@"; do\n'
+        "    case $argument in --jobname=*) jobname=${argument#--jobname=} ;; esac\n"
+        "done\n"
+        "echo run >> runs.txt\n"
+        "cp aux.txt $jobname.aux\n"
+        "touch $jobname.pdf\n"
+    )
+    xelatex.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_directory}{os.pathsep}{os.environ['PATH']}")
+    directory = tmp_path / "part"
+    directory.mkdir()
+    tex = directory / "part.tex"
+    tex.write_text("% tex\n")
+    runs = directory / "runs.txt"
+
+    def run_xelatex():
+        runs.write_text("")
+        baca.build.run_xelatex(tex)
+        return len(runs.read_text().splitlines())
+
+    (directory / "aux.txt").write_text("foo\n")
+    assert run_xelatex() == 2
+    assert (directory / ".part.aux").read_text() == "foo\n"
+    assert not (directory / "part.aux").exists()
+    assert run_xelatex() == 1
+    (directory / "aux.txt").write_text("bar\n")
+    assert run_xelatex() == 2
+    assert (directory / ".part.aux").read_text() == "bar\n"
+
+
+def _make_cached_section(tmp_path):
+    sections_directory = tmp_path / "contents" / "sections"
+    section_directory = sections_directory / "01"
+    section_directory.mkdir(parents=True)
+    (section_directory / "music.py").write_text("raise Exception\n")
+    (section_directory / "layout.ily").write_text("% layout\n")
+    (section_directory / ".metadata").write_text("{}\n")
+    (section_directory / "music.ly").write_text("% music\n")
+    arguments = baca.build.arguments(["music.py", "--pdf", "--do-not-call-lilypond"])
+    key = baca.build._get_build_cache_key(section_directory, arguments)
+    (section_directory / ".build_cache").write_text(key + "\n")
+    return section_directory, arguments
+
+
+def test_build_cache_hit_and_miss(tmp_path):
+    """
+    Build cache is current until an input, output or argument changes.
+    """
+
+    section_directory, arguments = _make_cached_section(tmp_path)
+    assert baca.build.build_cache_is_current(section_directory, arguments)
+    arguments_ = baca.build.arguments(["music.py", "--pdf"])
+    assert not baca.build.build_cache_is_current(section_directory, arguments_)
+    (section_directory / "layout.ily").write_text("% changed\n")
+    assert not baca.build.build_cache_is_current(section_directory, arguments)
+    (section_directory / "layout.ily").write_text("% layout\n")
+    assert baca.build.build_cache_is_current(section_directory, arguments)
+    (section_directory / "music.ly").unlink()
+    assert not baca.build.build_cache_is_current(section_directory, arguments)
+
+
+def test_build_cache_key_hashes_package_sources(tmp_path):
+    """
+    Editing a source file of a package changes its build-cache hash.
+    """
+
+    (tmp_path / "foo.py").write_text("x = 1\n")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "foo.pyc").write_bytes(b"1")
+    hash_ = baca.build._get_package_source_hash(str(tmp_path))
+    (tmp_path / "__pycache__" / "foo.pyc").write_bytes(b"2")
+    baca.build._get_package_source_hash.cache_clear()
+    assert baca.build._get_package_source_hash(str(tmp_path)) == hash_
+    (tmp_path / "foo.py").write_text("x = 2\n")
+    baca.build._get_package_source_hash.cache_clear()
+    assert baca.build._get_package_source_hash(str(tmp_path)) != hash_
+
+
+def test_build_sections_skips_cached_sections(tmp_path):
+    """
+    build_sections() skips sections with a current build cache unless
+    --ignore-cache is given.
+    """
+
+    section_directory, _ = _make_cached_section(tmp_path)
+    sections_directory = section_directory.parent
+    arguments = ["--pdf", "--do-not-call-lilypond"]
+    assert baca.build.build_sections(sections_directory, arguments) == 0
+    assert "Using cached build" in (section_directory / ".build.log").read_text()
+    arguments = [*arguments, "--ignore-cache"]
+    assert baca.build.build_sections(sections_directory, arguments) == 1
+
+
+def test_clear_build_cache(tmp_path):
+    """
+    Clearing the build cache removes .build_cache files so the cache misses.
+    """
+
+    section_directory, arguments = _make_cached_section(tmp_path)
+    removed = baca.build.clear_build_cache(section_directory.parent)
+    assert removed == [section_directory / ".build_cache"]
+    assert not baca.build.build_cache_is_current(section_directory, arguments)
+    assert baca.build.clear_build_cache(section_directory) == []
+
+
+def _make_fake_lilypond(tmp_path, body):
+    lilypond = tmp_path / "lilypond"
+    lilypond.write_text("#!/bin/sh\n" + body)
+    lilypond.chmod(0o755)
+    return str(lilypond)
+
+
+def test_run_lilypond_writes_log_and_returns_exit_code(tmp_path, monkeypatch):
+    """
+    LilyPond output goes to the dotted log file next to the .ly file.
+    """
+
+    body = 'echo "cwd $(pwd)"\necho "args $@"\nexit 3\n'
+    lilypond = _make_fake_lilypond(tmp_path, body)
+    monkeypatch.setitem(abjad.io.configuration._settings, "lilypond_path", lilypond)
+    directory = tmp_path / "section"
+    directory.mkdir()
+    music_ly = directory / "music.ly"
+    music_ly.write_text("% music\n")
+    monkeypatch.chdir(tmp_path)
+    exit_code = baca.build.run_lilypond(pathlib.Path("section/music.ly"))
+    assert exit_code == 3
+    assert pathlib.Path.cwd() == tmp_path
+    lines = (directory / ".music.ly.log").read_text().splitlines()
+    assert lines[1] == f"cwd {directory}"
+    assert lines[2].startswith("args --include=")
+    assert lines[2].endswith(f"--output={directory / 'music'} {music_ly}")
+
+
+def test_run_lilypond_timeout_kills_process_group(tmp_path, monkeypatch):
+    """
+    A timed-out LilyPond job has its whole process group killed.
+    """
+
+    body = "sleep 60 &\necho $! > child.pid\necho started\nwait\n"
+    lilypond = _make_fake_lilypond(tmp_path, body)
+    monkeypatch.setitem(abjad.io.configuration._settings, "lilypond_path", lilypond)
+    music_ly = tmp_path / "music.ly"
+    music_ly.write_text("% music\n")
+    start_time = time.time()
+    exit_code = baca.build.run_lilypond(music_ly, lilypond_timeout=1)
+    assert exit_code == 1
+    assert time.time() - start_time < 30
+    string = (tmp_path / ".music.ly.log").read_text()
+    assert "started" in string
+    assert "LilyPond failed: timed out after 1 seconds" in string
+    pid = int((tmp_path / "child.pid").read_text())
+    status = pathlib.Path(f"/proc/{pid}/status")
+    for _ in range(50):
+        if not status.exists() or "\nState:\tZ" in status.read_text():
+            break
+        time.sleep(0.1)
+    else:
+        raise AssertionError(f"process {pid} still running")
+
+
+def _make_section_texts(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        abjad.configuration.Configuration, "_lilypond_version_string", "2.25.0"
+    )
+    section_directory = tmp_path / "contents" / "sections" / "01"
+    section_directory.mkdir(parents=True)
+    metadata = {"bol_measure_numbers": [1], "final_measure_number": 4}
+    metadata = types.MappingProxyType(metadata)
+    baca.path.write_metadata_py(section_directory, metadata)
+    voice = abjad.Voice("c'4 d'4 e'4 f'4", name="Music_Voice")
+    voice.set_identifier("%*% 01.Music_Voice")
+    staff = abjad.Staff([voice], name="Music_Staff")
+    staff.set_identifier("%*% 01.Music_Staff")
+    score = abjad.Score([staff], name="Score")
+    leaves = abjad.select.leaves(voice)
+    tag = baca.tags.SHIFTED_CLEF.append(abjad.Tag("MEASURE_1"))
+    tag = tag.append(abjad.Tag("baca.clef()"))
+    abjad.attach(abjad.Clef("bass"), leaves[0], deactivate=True, tag=tag)
+    literal = abjad.LilyPondLiteral(r"\stopStaff", site="before")
+    tag = baca.tags.NOT_TOPMOST.append(abjad.Tag("baca.literal()"))
+    abjad.attach(literal, leaves[1], tag=tag)
+    markup = abjad.Markup(r"\markup pont.")
+    tag = abjad.Tag("baca.markup()")
+    abjad.attach(markup, leaves[2], direction=abjad.UP, tag=tag)
+    items = [r'\include "../../stylesheets/stylesheet.ily"', "", score]
+    lilypond_file = abjad.LilyPondFile(items)
+    string = abjad.lilypond(lilypond_file, site_comments=True, tags=True)
+    layout_ily = abjad.string.normalize(
+        r"""
+        % Score_Layout
+          %! baca.layout()
+        \context Score = "Score"
+        {
+            \time 4/4
+        }
+        """
+    )
+    texts = {"music.ly": string + "\n", "layout.ily": layout_ily + "\n"}
+    return section_directory, texts
+
+
+def _run_section_texts(section_directory, texts):
+    tags: dict[str, str] = {}
+    music_ly = section_directory / "music.ly"
+    baca.build._externalize_music_ly_path(music_ly, texts, tags)
+    baca.build._handle_section_tags(section_directory, texts, tags)
+    baca.build._remove_site_comments(section_directory, texts)
+    baca.build._remove_function_name_comments(section_directory, texts)
+    baca.build._write_section_files(section_directory, texts, tags)
+
+
+def test_section_texts_01(tmp_path, monkeypatch):
+    """
+    Section files are externalized, tagged and cleaned in memory; the result
+    matches what the file-by-file passes wrote.
+    """
+
+    section_directory, texts = _make_section_texts(tmp_path, monkeypatch)
+    (section_directory / ".music.ily.tags").write_text("stale\n")
+    _run_section_texts(section_directory, texts)
+
+    assert (section_directory / "music.ly").read_text() == abjad.string.normalize(
+        r"""
+        \version "2.25.0"
+        \language "english"
+        \include "../../stylesheets/stylesheet.ily"
+        \include "music.ily"
+        \context Score = "Score"
+        <<
+            \context Staff = "Music_Staff"
+            {
+                \01.Music_Staff
+            }
+        >>
+        """
+    ) + "\n"
+
+    assert (section_directory / "music.ily").read_text() == abjad.string.normalize(
+        r"""
+        \version "2.25.0"
+
+        01.Music_Voice =
+        {
+              %! MEASURE_1
+              %! SHIFTED_CLEF
+            %@% \clef "bass"
+            c'4
+            \stopStaff
+            d'4
+            e'4
+            ^ \markup pont.
+            f'4
+        }
+
+
+        01.Music_Staff =
+        {
+            \context Voice = "Music_Voice"
+            {
+                \01.Music_Voice
+            }
+        }
+        """
+    ) + "\n"
+
+    assert (section_directory / "layout.ily").read_text() == abjad.string.normalize(
+        r"""
+        % Score_Layout
+        \context Score = "Score"
+        {
+            \time 4/4
+        }
+        """
+    ) + "\n"
+
+    assert (section_directory / ".music.ily.tags").read_text() == (
+        abjad.string.normalize(
+            """
+            Deactivating NOT_TOPMOST ...
+            Found no not topmost tags ...
+
+            Handling edition tags ...
+            Found no other-edition tags ...
+            Found no this-edition tags ...
+
+            Handling fermata bar lines ...
+            Found no bar line adjustment tags ...
+            Found no EOL fermata bar line tags ...
+
+            Handling shifted clefs ...
+            Found 1 shifted clef tag ...
+            Activating 1 shifted clef tag ...
+            Found 1 BOL clef tag ...
+            Deactivating 1 BOL clef tag ...
+
+            Handling MOL tags ...
+            Found no MOL tags ...
+            Found no conflicting MOL tags ...
+            """
+        )
+        + "\n\n"
+    )
+    string = (section_directory / ".music.ly.tags").read_text()
+    assert string.startswith("Deactivating NOT_TOPMOST ...\n")
+    assert "Found no shifted clef tags ...\n" in string
+    string = (section_directory / ".layout.ily.tags").read_text()
+    assert string.startswith("Handling edition tags ...\n")
+    assert not list(section_directory.glob(".*.tmp"))
+
+
+def test_section_texts_02(tmp_path, monkeypatch):
+    """
+    Stale tag files are removed when their source file is not written.
+    """
+
+    section_directory, texts = _make_section_texts(tmp_path, monkeypatch)
+    del texts["layout.ily"]
+    (section_directory / ".layout.ily.tags").write_text("stale\n")
+    _run_section_texts(section_directory, texts)
+    assert not (section_directory / "layout.ily").exists()
+    assert not (section_directory / ".layout.ily.tags").exists()
+    assert (section_directory / ".music.ly.tags").exists()
+    assert (section_directory / ".music.ily.tags").exists()
+
+
+def test_externalize_01(monkeypatch):
+    """
+    Externalizes nested %*% blocks into music.ily and strips the NOT_TOPMOST
+    tag from the last paragraph of a variable.
+    """
+
+    monkeypatch.setattr(
+        abjad.configuration.Configuration, "_lilypond_version_string", "2.25.0"
+    )
+    string = abjad.string.normalize(
+        r"""
+        \version "2.25.0"
+        \language "english"
+        \include "../../stylesheets/stylesheet.ily"
+
+
+        \context Score = "Score"
+        <<
+            \context Staff = "Violin_Staff"
+            {   %*% 01.Violin_Staff
+                \context Voice = "Violin_Voice"
+                {   %*% 01.Violin_Voice
+                      %! NOT_TOPMOST
+                    \stopStaff
+                    c'4
+
+                      %! NOT_TOPMOST
+                    \startStaff
+                    d'4
+                }   %*% 01.Violin_Voice
+            }   %*% 01.Violin_Staff
+            \context Staff = "Cello_Staff"
+            <<   %*% 01.Cello_Staff
+                \context Voice = "Cello_Voice"
+                {   %*% 01.Cello_Voice
+                    c4
+                }   %*% 01.Cello_Voice
+            >>   %*% 01.Cello_Staff
+        >>
+        """
+    )
+    music_ly, music_ily = baca.build._externalize_string(
+        string + "\n", include_name="music.ily"
+    )
+
+    assert music_ly == abjad.string.normalize(
+        r"""
+        \version "2.25.0"
+        \language "english"
+        \include "../../stylesheets/stylesheet.ily"
+        \include "music.ily"
+
+        \context Score = "Score"
+        <<
+            \context Staff = "Violin_Staff"
+            {
+                \01.Violin_Staff
+            }
+            \context Staff = "Cello_Staff"
+            {
+                \01.Cello_Staff
+            }
+        >>
+        """
+    ) + "\n"
+
+    assert music_ily == abjad.string.normalize(
+        r"""
+        \version "2.25.0"
+
+        01.Violin_Voice =
+        {
+              %! NOT_TOPMOST
+            \stopStaff
+            c'4
+
+            \startStaff
+            d'4
+        }
+
+
+        01.Violin_Staff =
+        {
+            \context Voice = "Violin_Voice"
+            {
+                \01.Violin_Voice
+            }
+        }
+
+
+        01.Cello_Voice =
+        {
+            c4
+        }
+
+
+        01.Cello_Staff =
+        <<
+            \context Voice = "Cello_Voice"
+            {
+                \01.Cello_Voice
+            }
+        >>
+        """
+    ) + "\n"
+
+
+def test_externalize_02():
+    """
+    Externalizes layout %*% blocks in place, above page-layout-score.
+    """
+
+    string = abjad.string.normalize(
+        r"""
+        \version "2.25.0"
+        \include "../../stylesheets/stylesheet.ily"
+
+
+        \context Score = "Score"
+        <<
+            \context GlobalContext = "Global_Context"
+            <<   %*% Global_Context
+                \context GlobalSkips = "Global_Skips"
+                {   %*% Global_Skips
+                    \time 4/4
+                    s1 * 1
+                }   %*% Global_Skips
+            >>   %*% Global_Context
+        >>
+        """
+    )
+    layout_ily, layout_ily_ = baca.build._externalize_string(string + "\n")
+    assert layout_ily_ is None
+
+    assert layout_ily == abjad.string.normalize(
+        r"""
+        \version "2.25.0"
+        \include "../../stylesheets/stylesheet.ily"
+
+        Global_Skips =
+        {
+            \time 4/4
+            s1 * 1
+        }
+
+
+        Global_Context =
+        <<
+            \context GlobalSkips = "Global_Skips"
+            {
+                \Global_Skips
+            }
+        >>
+
+
+        page-layout-score = \context Score = "Score"
+        <<
+            \context GlobalContext = "Global_Context"
+            {
+                \Global_Context
+            }
+        >>
+        """
+    ) + "\n"
@@ -1,3 +1,6 @@
+import pathlib
+import re
+
 import abjad
 import pytest
 
@@ -147,6 +150,21 @@ def test_stop_hairpins():
     assert dynamic == abjad.StopHairpin()
 
 
+def test_scheme_manifest_dynamics():
+    """
+    Every dynamic in the scheme manifest is defined in baca-dynamics.ily.
+    """
+
+    path = pathlib.Path(baca.__file__).parent / "scm" / "baca-dynamics.ily"
+    names = re.findall(r"^(baca-[\w-]+) =", path.read_text(), re.MULTILINE)
+    missing = set(baca.dynamics.SchemeManifest().dynamics()) - set(names)
+    assert not missing, sorted(missing)
+
+    dynamic = baca.dynamics.make_dynamic("sfz-p")
+    assert dynamic is baca.dynamics.make_dynamic("sfz-p")
+    assert dynamic == abjad.Dynamic("p", command="\\baca-sfz-p", name_is_textual=False)
+
+
 def test_subito_dynamics():
     dynamic = baca.dynamics.make_dynamic("p-sub")
     assert dynamic == abjad.Dynamic("p", command="\\baca-p-sub")
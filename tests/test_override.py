@@ -0,0 +1,56 @@
+from inspect import currentframe as _frame
+
+import abjad
+
+import baca
+
+
+def test_batch_merges_contiguous_requests():
+    staff = abjad.Staff("c'4 d' e' f' g'")
+    notes = abjad.select.notes(staff)
+    wrappers = baca.override.batch(
+        _frame(),
+        [
+            (notes[0], "Stem", "color", "#red"),
+            (notes[1:3], "Stem", "color", "#red"),
+            (notes[3], "NoteHead", "font_size", 2),
+            (notes[4], "Stem", "color", "#red"),
+        ],
+        context="Staff",
+    )
+    assert [_.indicator().argument for _ in wrappers] == [
+        r"\override Staff.Stem.color = #red",
+        r"\revert Staff.Stem.color",
+        r"\once \override Staff.NoteHead.font-size = 2",
+        r"\once \override Staff.Stem.color = #red",
+    ]
+    assert [_.component() for _ in wrappers] == [notes[0], notes[2], notes[3], notes[4]]
+
+
+def test_batch_matches_single_overrides():
+    staff_1 = abjad.Staff("c'4 d' e' f'")
+    staff_2 = abjad.Staff("c'4 d' e' f'")
+    frame = _frame()
+    baca.override._override(
+        frame, staff_1[:2], "Stem", "color", "#blue", context="Staff"
+    )
+    baca.override._override(frame, staff_1[2:], "NoteHead", "font_size", -2)
+    baca.override.batch(
+        frame, [(staff_2[:2], "Stem", "color", "#blue")], context="Staff"
+    )
+    baca.override.batch(frame, [(staff_2[2:], "NoteHead", "font_size", -2)])
+    string_1 = abjad.lilypond(staff_1, tags=True)
+    string_2 = abjad.lilypond(staff_2, tags=True)
+    assert string_1 == string_2
+    assert "test_override.test_batch_matches_single_overrides(1)" in string_2
+    assert "test_override.test_batch_matches_single_overrides(2)" in string_2
+
+
+def test_batch_wrappers_are_attached_overrides():
+    staff = abjad.Staff("c'4 d' e'")
+    abjad.attach(abjad.LilyPondLiteral(r"\once \override Stem.color = #red"), staff[0])
+    wrappers = baca.override.batch(_frame(), [(staff[0], "Stem", "color", "#red")])
+    assert len(wrappers) == 1
+    assert wrappers[0].component() is staff[0]
+    assert wrappers[0] in abjad.get.wrappers(staff[0])
+    assert wrappers[0].tag() == baca.helpers.function_name(_frame(), n=1)
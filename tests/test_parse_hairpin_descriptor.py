@@ -188,3 +188,17 @@ def test_multiple_hairpins_04():
     assert specifiers[2] == baca.hairpins.HairpinSpecifier(
         indicator=abjad.Dynamic("p"),
     )
+
+
+def test_compiled_descriptor_cache():
+    """
+    Repeated descriptors reuse the compiled specifiers and count as cache hits.
+    """
+
+    cache_info = baca.hairpins._compile_hairpin_descriptor.cache_info
+    specifiers = baca.hairpins.parse_hairpin_descriptor("mp < mf - o< pp")
+    hits = cache_info().hits
+    specifiers_ = baca.hairpins.parse_hairpin_descriptor("mp < mf - o< pp")
+    assert specifiers_ == specifiers
+    assert specifiers_ is not specifiers
+    assert cache_info().hits == hits + 1
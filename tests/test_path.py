@@ -0,0 +1,94 @@
+import os
+import types
+
+import abjad
+
+import baca
+
+
+def test_path_metadata_01(tmp_path):
+    """
+    baca.path.write_metadata_py() round-trips through baca.path.get_metadata().
+    """
+
+    metadata = {
+        "final_measure_number": 12,
+        "persistent_indicators": {
+            "Score": [
+                baca.Memento(
+                    context="Score",
+                    manifest="metronome_marks",
+                    value="60",
+                ),
+                baca.Memento(
+                    context="Score",
+                    prototype="abjad.TimeSignature",
+                    synthetic_offset=abjad.Offset(abjad.Fraction(-1, 4)),
+                    value="3/8",
+                ),
+            ],
+        },
+        "start_clock_time": "0'00''",
+        "time_signatures": ["4/8", "3/8"],
+        "voice_offsets": {(1, 2): abjad.Offset(abjad.Fraction(1, 2))},
+    }
+    baca.path.write_metadata_py(tmp_path, types.MappingProxyType(metadata))
+    assert (tmp_path / ".metadata").read_text().startswith("{")
+    assert repr(dict(baca.path.get_metadata(tmp_path))) == repr(metadata)
+    assert baca.path.get_metadata(tmp_path) is not baca.path.get_metadata(tmp_path)
+
+
+def test_path_metadata_02(tmp_path):
+    """
+    baca.path.get_metadata() reads legacy Python-literal metadata, evaluating
+    abjad and baca names.
+    """
+
+    (tmp_path / ".metadata").write_text(
+        "{'first_measure_number': 1,"
+        " 'persistent_indicators': {'Score': [baca.Memento(context='Score')]},"
+        " 'time_signatures': ['4/8'],"
+        " 'voice_offsets': {(1, 2): Offset(Fraction(1, 2))}}"
+    )
+    metadata = {
+        "first_measure_number": 1,
+        "persistent_indicators": {"Score": [baca.Memento(context="Score")]},
+        "time_signatures": ["4/8"],
+        "voice_offsets": {(1, 2): abjad.Offset(abjad.Fraction(1, 2))},
+    }
+    assert repr(dict(baca.path.get_metadata(tmp_path))) == repr(metadata)
+    assert repr(dict(baca.path.get_metadata(tmp_path))) == repr(metadata)
+
+
+def test_path_metadata_03(tmp_path):
+    """
+    baca.path.get_metadata() rereads .metadata after an external rewrite that
+    changes its size or its mtime.
+    """
+
+    metadata = types.MappingProxyType({"time_signatures": ["4/8"]})
+    baca.path.write_metadata_py(tmp_path, metadata)
+    assert baca.path.get_metadata(tmp_path)["time_signatures"] == ["4/8"]
+    metadata_path = tmp_path / ".metadata"
+    metadata_path.write_text('{"time_signatures": ["4/8", "3/8"]}\n')
+    assert baca.path.get_metadata(tmp_path)["time_signatures"] == ["4/8", "3/8"]
+    stat = metadata_path.stat()
+    metadata_path.write_text('{"time_signatures": ["5/8", "3/8"]}\n')
+    assert metadata_path.stat().st_size == stat.st_size
+    os.utime(metadata_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert baca.path.get_metadata(tmp_path)["time_signatures"] == ["5/8", "3/8"]
+
+
+def test_path_metadata_04(tmp_path):
+    """
+    Callers of baca.path.get_metadata() and baca.path.write_metadata_py() do not
+    share mutable values with the read cache.
+    """
+
+    dictionary = {"time_signatures": ["4/8"]}
+    baca.path.write_metadata_py(tmp_path, types.MappingProxyType(dictionary))
+    dictionary["time_signatures"].append("3/8")
+    metadata = baca.path.get_metadata(tmp_path)
+    assert metadata["time_signatures"] == ["4/8"]
+    metadata["time_signatures"].append("2/8")
+    assert baca.path.get_metadata(tmp_path)["time_signatures"] == ["4/8"]
@@ -27,3 +27,60 @@ def test__make_accelerando_multipliers():
     durations = 4 * [abjad.Duration(1)]
     multipliers = baca.rhythm._make_accelerando_multipliers(durations, 0.5)
     assert multipliers == [(2048, 1024), (848, 1024), (651, 1024), (549, 1024)]
+
+
+def test_make_rhythm_01():
+    """
+    Replaces dummy notes with their original figures after meter rewriting:
+    figures separated by gaps, adjacent figures, figures across barlines, a
+    spacer that shifts later figures, and a figure at the end of the voice.
+    """
+
+    time_signatures = [abjad.TimeSignature(_) for _ in [(4, 8), (3, 8), (5, 8)]]
+    time_signatures += [abjad.TimeSignature(_) for _ in [(4, 8), (6, 8)]]
+    items = [
+        1,
+        baca.rhythm.T([1, 1, 1], -1),
+        baca.rhythm.C([2, -1]),
+        -2,
+        "+",
+        baca.rhythm.T([2, 2, 1], 1),
+        3,
+        baca.rhythm.C([1, 1, 1]),
+    ]
+    voice = baca.rhythm.make_rhythm(items, 8, time_signatures, voice_name="Music")
+    string = abjad.lilypond(voice)
+
+    assert string == abjad.string.normalize(
+        r"""
+        \context Voice = "Music"
+        {
+            c'8
+            \tuplet 3/2
+            {
+                c'8
+                c'8
+                c'8
+            }
+            {
+                c'4
+                r8
+            }
+            r8
+            r8
+            c'4
+            \tuplet 5/6
+            {
+                c'4
+                c'4
+                c'8
+            }
+            c'4.
+            {
+                c'8
+                c'8
+                c'8
+            }
+        }
+        """
+    )
@@ -0,0 +1,292 @@
+import gc
+
+import abjad
+
+import baca
+
+
+def test_section_leaf_index_01():
+    """
+    baca.section.LeafIndex agrees with abjad.get.
+    """
+
+    score = baca.docs.make_empty_score(1)
+    time_signatures = baca.section.wrap([(4, 8), (3, 8)])
+    baca.section.set_up_score(score, time_signatures())
+    music = baca.make_notes(time_signatures())
+    score["Music"].extend(music)
+    skips = score["Skips"]
+    offset_to_measure_number = baca.section._populate_offset_to_measure_number(1, skips)
+    index = baca.section.LeafIndex(score, offset_to_measure_number)
+    for leaf in abjad.iterate.leaves(score):
+        parentage = abjad.get.parentage(leaf)
+        assert index.voice(leaf) is parentage.get(abjad.Voice)
+        assert index.context(leaf) is parentage.get(abjad.Context)
+        start_offset = abjad.get.timespan(leaf).start_offset
+        assert index.start_offset(leaf) == start_offset
+        assert index.is_measure_initial(leaf) is (
+            start_offset in offset_to_measure_number
+        )
+    assert [index.measure_number(_) for _ in score["Music"]] == [1, 2]
+    assert [index.measure_number(_) for _ in skips] == [1, 2]
+
+
+def test_section_leaf_index_02():
+    """
+    baca.section.LeafIndex answers for leaves added after the index is built,
+    even when the leaves it indexed have left the score.
+    """
+
+    score = baca.docs.make_empty_score(1, 2)
+    time_signatures = baca.section.wrap([(4, 8), (3, 8)])
+    baca.section.set_up_score(score, time_signatures())
+    for voice_name in ("Music.1", "Music.2"):
+        score[voice_name].extend(baca.make_notes(time_signatures()))
+    index = baca.section.LeafIndex(score)
+    del score["Music.2"][:]
+    gc.collect()
+    notes = [abjad.Note("c'8") for _ in range(100)]
+    score["Music.1"].extend(notes)
+    for note in notes:
+        assert index.voice(note) is score["Music.1"]
+        assert index.start_offset(note) == abjad.get.timespan(note).start_offset
+
+
+def test_section_cache_rebuild_01():
+    """
+    Rebuilding one voice of a leaf cache matches a full rebuild.
+    """
+
+    def to_ids(cache):
+        result = {}
+        for voice_name, dictionary in cache.voice_name_to_leaves_by_measure.items():
+            result[voice_name] = {
+                measure_number: [id(_) for _ in leaves]
+                for measure_number, leaves in dictionary.items()
+            }
+        return result
+
+    score = baca.docs.make_empty_score(1, 2)
+    time_signatures = baca.section.wrap([(4, 8), (3, 8), (2, 8)])
+    baca.section.set_up_score(score, time_signatures())
+    for voice_name in ("Music.1", "Music.2"):
+        score[voice_name].extend(baca.make_notes(time_signatures()))
+    cache = baca.section.cache_leaves(score, 3, {"vn": "Music.1"})
+    score["Music.1"][:] = baca.make_even_divisions(time_signatures())
+    cache.rebuild("vn")
+    partial = to_ids(cache)
+    cache.rebuild()
+    assert partial == to_ids(cache)
+    assert cache.vn[2] == abjad.select.leaves(score["Music.1"][4:7])
+
+
+def _make_leaf_visitor_score():
+    score = baca.docs.make_empty_score(1)
+    time_signatures = baca.section.wrap([(4, 8), (3, 8), (2, 8)])
+    baca.section.set_up_score(score, time_signatures())
+    voice = score["Music"]
+    voice.extend("c'8 d'8 ~ d'8 e'8 fs'1 b'1 g'8 <c' e'>8")
+    voice.append(abjad.Voice("c,8 f'8", name="Inner"))
+    leaves = abjad.select.leaves(voice)
+    abjad.attach(abjad.Violin(), leaves[0])
+    abjad.attach(baca.enums.MOCK, leaves[0])
+    abjad.attach(baca.enums.NOT_YET_REGISTERED, leaves[3])
+    abjad.attach(abjad.RepeatTie(), leaves[4])
+    abjad.attach(abjad.LaissezVibrer(), leaves[5])
+    abjad.attach(baca.enums.FRAMED_LEAF, leaves[6])
+    abjad.attach(abjad.Dynamic("p"), leaves[7])
+    leaves[9].set_dmp((1, 2))
+    return score
+
+
+def _run_leaf_passes(score, visitor=None):
+    baca.section.transpose_score(score, visitor=visitor)
+    baca.section._color_not_yet_registered(score, visitor=visitor)
+    baca.section._color_mock_pitch(score, visitor=visitor)
+    if visitor is not None:
+        visitor.run()
+    baca.section._clean_up_repeat_tie_direction(score, visitor=visitor)
+    baca.section._clean_up_laissez_vibrer_tie_direction(score, visitor=visitor)
+    baca.section._check_doubled_dynamics(score, visitor=visitor)
+    baca.section.color_out_of_range_pitches(score, visitor=visitor)
+    if visitor is not None:
+        visitor.run()
+    baca.section._attach_shadow_tie_indicators(score, visitor=visitor)
+    baca.section._force_nonnatural_accidentals(score, visitor=visitor)
+    baca.section._label_duration_multipliers(score, visitor=visitor)
+    baca.section._style_framed_notes(score, visitor=visitor)
+    if visitor is not None:
+        visitor.run()
+
+
+def test_section_leaf_visitor_01():
+    """
+    Fused leaf walks give the same score as running each pass on its own.
+    """
+
+    separate = _make_leaf_visitor_score()
+    _run_leaf_passes(separate)
+    fused = _make_leaf_visitor_score()
+    _run_leaf_passes(fused, baca.section.LeafVisitor(fused))
+    assert abjad.lilypond(fused, tags=True) == abjad.lilypond(separate, tags=True)
+
+
+def test_section_leaf_visitor_02():
+    """
+    Fused leaf walks match the output of the per-pass loops they replace.
+
+    The inner voice's out-of-range note is colored once per enclosing voice, as
+    the per-voice loop in color_out_of_range_pitches() used to do.
+    """
+
+    score = _make_leaf_visitor_score()
+    _run_leaf_passes(score, baca.section.LeafVisitor(score))
+    string = abjad.lilypond(score["Music"], tags=True)
+
+    assert string == abjad.string.normalize(
+        r"""
+          %! baca.docs.make_empty_score()
+        \context Voice = "Music"
+          %! baca.docs.make_empty_score()
+        {
+              %! MOCK_COLORING
+              %! baca.section._color_mock_pitch()
+            \baca-mock-coloring
+            c'8
+            d'8
+            ~
+            d'8
+              %! NOT_YET_REGISTERED_COLORING
+              %! baca.section._color_not_yet_registered()
+            \baca-not-yet-registered-coloring
+            e'8
+              %! baca.section._attach_shadow_tie_indicators()
+            - \tweak stencil ##f
+              %! baca.section._attach_shadow_tie_indicators()
+            ~
+            fs'1
+            \repeatTie
+            \once \override LaissezVibrerTie.direction = #up
+            b'1
+            \laissezVibrer
+              %! FRAMED_LEAF
+              %! baca.section._style_framed_notes()
+            \once \override Accidental.stencil = ##f
+              %! FRAMED_LEAF
+              %! baca.section._style_framed_notes()
+            \once \override Stem.thickness = 6
+            g'4 * 1/2
+            <c' e'>8
+            \p
+            \context Voice = "Inner"
+            {
+                  %! OUT_OF_RANGE_COLORING
+                  %! baca.section.color_out_of_range_pitches()
+                \baca-out-of-range-coloring
+                  %! OUT_OF_RANGE_COLORING
+                  %! baca.section.color_out_of_range_pitches()
+                \baca-out-of-range-coloring
+                c,8
+                f'8 * 1/2
+                  %! DURATION_MULTIPLIER
+                  %! baca.section._label_duration_multipliers()
+                %@% ^ \baca-duration-multiplier-markup #"1" #"2"
+            }
+          %! baca.docs.make_empty_score()
+        }
+        """
+    )
+
+
+def test_section_context_index_01():
+    """
+    baca.section.ContextIndex finds contexts by name and forgets cached
+    first-leaf indicators on request, one leaf at a time.
+    """
+
+    score = baca.docs.make_empty_score(1)
+    time_signatures = baca.section.wrap([(4, 8), (3, 8)])
+    baca.section.set_up_score(score, time_signatures())
+    score["Music"].extend(baca.make_notes(time_signatures()))
+    index = baca.section.ContextIndex(score)
+    assert index.context("Music") is score["Music"]
+    assert index.context("Foo") is None
+    assert index.contexts("Foo") == []
+    assert "Music" in index.names()
+    leaf = index.first_leaf(score["Music"])
+    assert leaf is abjad.select.leaf(score["Music"], 0)
+    assert index.indicator(leaf, abjad.Clef) is None
+    clef = abjad.Clef("bass")
+    abjad.attach(clef, leaf)
+    assert index.indicator(leaf, abjad.Clef) is None
+    assert index.indicator(leaf, abjad.Dynamic) is None
+    dynamic = abjad.Dynamic("p")
+    abjad.attach(dynamic, leaf)
+    index.forget(leaf)
+    assert index.indicator(leaf, abjad.Clef) is clef
+    assert index.indicator(leaf, abjad.Dynamic) is dynamic
+    leaf_ = abjad.select.leaf(score["Music"], 1)
+    assert index.indicator(leaf_, abjad.Clef) is None
+    abjad.attach(abjad.Clef("treble"), leaf_)
+    index.forget(leaf)
+    assert index.indicator(leaf_, abjad.Clef) is None
+    index.forget(leaf_)
+    assert index.indicator(leaf_, abjad.Clef) == abjad.Clef("treble")
+
+
+def _make_persistent_wrappers_voice(reverse=False):
+    voice = abjad.Voice("c'4 d'4 e'4 f'4 g'4 a'4", name="Music")
+    abjad.Staff([voice], name="Staff")
+    leaves = abjad.select.leaves(voice)
+    abjad.attach(abjad.Clef("treble"), leaves[0])
+    abjad.attach(abjad.Dynamic("p"), leaves[0])
+    indicators = [abjad.StartHairpin("<"), abjad.Dynamic("mf")]
+    if reverse:
+        indicators.reverse()
+    for indicator in indicators:
+        abjad.attach(indicator, leaves[1])
+    container = abjad.Container()
+    abjad.mutate.wrap(leaves[2:4], container)
+    abjad.attach(baca.enums.ANCHOR_NOTE, container)
+    grace_container = abjad.BeforeGraceContainer("b'16")
+    abjad.attach(grace_container, leaves[3])
+    abjad.attach(abjad.Dynamic("pp"), grace_container[0])
+    abjad.attach(baca.enums.ANCHOR_NOTE, leaves[4])
+    abjad.attach(abjad.Clef("bass"), leaves[4])
+    abjad.attach(abjad.Dynamic("ff"), leaves[4])
+    return voice
+
+
+def test_section_persistent_wrappers_01():
+    """
+    One pass gets the same persistent wrappers as the old pair of calls: the
+    first result skips anchor notes and grace notes whose main leaf sits under
+    an anchor; a start hairpin beats a dynamic at the same offset.
+    """
+
+    clef_key = str(abjad.Clef)
+    omit_with_indicator = (baca.enums.ANCHOR_NOTE, baca.enums.ANCHOR_SKIP)
+    for reverse in (False, True):
+        voice = _make_persistent_wrappers_voice(reverse=reverse)
+        wrappers = []
+        for leaf in abjad.select.leaves(voice, grace=None):
+            wrappers.extend(abjad.get.wrappers(leaf))
+        omissions: dict[abjad.Component, bool] = {}
+        for _ in range(2):
+            unanchored, dictionary = baca.section._get_persistent_wrappers(
+                wrappers, omit_with_indicator, omissions
+            )
+            assert sorted(unanchored) == sorted(dictionary) == [clef_key, "DYNAMIC"]
+            assert unanchored[clef_key].unbundle_indicator() == abjad.Clef("treble")
+            indicator = unanchored["DYNAMIC"].unbundle_indicator()
+            assert indicator == abjad.StartHairpin("<")
+            assert dictionary[clef_key].unbundle_indicator() == abjad.Clef("bass")
+            indicator = dictionary["DYNAMIC"].unbundle_indicator()
+            assert indicator == abjad.Dynamic("ff")
+        leaves = abjad.select.leaves(voice, grace=False)
+        container = abjad.get.parentage(leaves[2]).parent()
+        grace_container = abjad.get.before_grace_container(leaves[3])
+        assert omissions[container] is True
+        assert omissions[grace_container[0]] is True
+        assert omissions[leaves[4]] is True
+        assert omissions[leaves[0]] is False
@@ -0,0 +1,45 @@
+import abjad
+
+import baca
+
+
+def test_spanners_text_01():
+    """
+    Repeated text-spanner descriptors reuse the compiled specifiers, count as
+    cache hits and return a fresh list each time.
+    """
+
+    cache_info = baca.spanners._compile_text_spanner_descriptor.cache_info
+    specifiers = baca.spanners._parse_text_spanner_descriptor("pont. => ord.")
+    hits = cache_info().hits
+    specifiers_ = baca.spanners._parse_text_spanner_descriptor("pont. => ord.")
+    assert specifiers_ == specifiers
+    assert specifiers_ is not specifiers
+    assert cache_info().hits == hits + 1
+    specifiers_.clear()
+    specifiers_ = baca.spanners._parse_text_spanner_descriptor("pont. => ord.")
+    assert specifiers_ == specifiers
+    specifiers_ = baca.spanners._parse_text_spanner_descriptor(
+        "pont. =| ord.", abjad.DOWN
+    )
+    specifiers = baca.spanners._parse_text_spanner_descriptor("pont. =| ord.")
+    assert specifiers_ != specifiers
+    assert cache_info().hits == hits + 2
+
+
+def test_spanners_text_02():
+    """
+    Text spanners made from the same descriptor format identically and attach
+    separate wrappers.
+    """
+
+    voices = [abjad.Voice("c'4 d' e' f'"), abjad.Voice("c'4 d' e' f'")]
+    wrappers = []
+    for voice in voices:
+        pieces = [voice[:2], voice[2:]]
+        wrappers.append(baca.spanners.text(pieces, "pont. => ord. -> pont."))
+    assert abjad.lilypond(voices[0]) == abjad.lilypond(voices[1])
+    assert len(wrappers[0]) == len(wrappers[1])
+    for wrapper, wrapper_ in zip(wrappers[0], wrappers[1]):
+        assert wrapper is not wrapper_
+        assert wrapper.component() is not wrapper_.component()
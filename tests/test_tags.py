@@ -1,3 +1,8 @@
+import inspect
+
+import abjad
+import pytest
+
 import baca
 
 
@@ -178,3 +183,76 @@ def test_persistent_indicator_tags():
         baca.tags.REAPPLIED_TIME_SIGNATURE,
         baca.tags.REDUNDANT_TIME_SIGNATURE,
     ]
+
+
+def test_tag_rules_01():
+    """
+    baca.build.TagRules applies rules in one pass; text and per-rule counts match
+    calling abjad.activate() and abjad.deactivate() once per rule.
+    """
+
+    text = "\n".join(
+        [
+            r"\new Staff",
+            "{",
+            "    c'4",
+            "    %! RED",
+            r"    %@% - \markup { \with-color #red Allegro }",
+            "    %! BLUE",
+            "    %! RED",
+            r"    - \tweak color #blue",
+            r"    - \markup Presto",
+            "    d'4",
+            "}",
+            "",
+        ]
+    )
+    red, blue = abjad.Tag("RED"), abjad.Tag("BLUE")
+    rules = baca.build.TagRules()
+    rules.show_tag(red)
+    rules.show_tag(blue, prepend_empty_chord=True, undo=True)
+    messages = []
+    result = rules.apply(text, messages)
+    text_, red_count, red_skipped = abjad.activate(text, red)
+    text_, blue_count, blue_skipped = abjad.deactivate(
+        text_, blue, prepend_empty_chord=True
+    )
+    assert result == text_
+    assert (red_count, red_skipped) == (1, 1)
+    assert (blue_count, blue_skipped) == (1, 0)
+    assert messages == [
+        "Showing RED tags ...",
+        "Found 2 RED tags ...",
+        "Activating 1 RED tag ...",
+        "Skipping 1 (active) RED tag ...",
+        "",
+        "Hiding BLUE tags ...",
+        "Found 1 BLUE tag ...",
+        "Deactivating 1 BLUE tag ...",
+        "",
+    ]
+
+
+def test_function_name_01():
+    """
+    baca.helpers.function_name() returns the same tag for the same frame site.
+    """
+
+    def function():
+        return baca.helpers.function_name(inspect.currentframe(), n=1)
+
+    assert function() is function()
+    assert function().string.endswith("test_tags.function(1)")
+
+
+def test_append_tag_01():
+    """
+    baca.helpers.append_tag() is memoized abjad.Tag.append().
+    """
+
+    tag = abjad.Tag("FOO")
+    result = baca.helpers.append_tag(tag, baca.tags.HIDDEN)
+    assert result == tag.append(baca.tags.HIDDEN)
+    assert result is baca.helpers.append_tag(tag, baca.tags.HIDDEN)
+    with pytest.raises(Exception):
+        baca.helpers.append_tag(result, baca.tags.HIDDEN)
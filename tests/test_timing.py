@@ -0,0 +1,47 @@
+import abjad
+
+import baca
+
+
+def test_stage_records_nothing_without_active_timing():
+    with baca.timing.stage("foo"):
+        pass
+    assert baca.timing.active_timing() is None
+
+
+def test_stage_records_leaves_and_added_wrappers_when_profiling():
+    staff = abjad.Staff("c'4 d' e'")
+    timing = baca.timing.Timing(profile=True)
+    with baca.timing.activate(timing):
+        with baca.timing.stage("foo", staff):
+            abjad.attach(abjad.Dynamic("p"), staff[0])
+    assert baca.timing.active_timing() is None
+    assert [_.name for _ in timing.stages] == ["foo"]
+    assert timing.stages[0].leaves == 3
+    assert timing.stages[0].wrappers == 1
+    assert 0 <= timing.stages[0].seconds
+
+
+def test_staged_records_one_stage_per_call_only_when_timing_is_active():
+    @baca.timing.staged
+    def foo(context, *, visitor=None):
+        return context.name()
+
+    voice = abjad.Voice("c'4", name="Music")
+    assert foo(voice) == "Music"
+    timing = baca.timing.Timing()
+    with baca.timing.activate(timing):
+        assert foo(voice) == "Music"
+        assert foo(voice, visitor=object()) == "Music"
+    assert [_.name for _ in timing.stages] == ["foo"]
+    assert timing.stages[0].leaves is None
+
+
+def test_activate_pops_timing_on_exception():
+    timing = baca.timing.Timing()
+    try:
+        with baca.timing.activate(timing):
+            raise ValueError
+    except ValueError:
+        pass
+    assert baca.timing.active_timing() is None
@@ -0,0 +1,61 @@
+import abjad
+
+import baca
+
+
+def test_treat_get_key_01():
+    """
+    Plain manifests are searched linearly and follow every change.
+    """
+
+    manifests = {"abjad.Instrument": {"A": abjad.Flute(), "B": abjad.Cello()}}
+    assert baca.treat._get_key(manifests, "abjad.Instrument", abjad.Cello()) == "B"
+    manifests["abjad.Instrument"]["A"] = abjad.Cello()
+    assert baca.treat._get_key(manifests, "abjad.Instrument", abjad.Cello()) == "A"
+    assert baca.treat._get_key(manifests, "abjad.Instrument", abjad.Viola()) is None
+    manifests["abjad.Instrument"] = None
+    assert baca.treat._get_key(manifests, "abjad.Instrument", abjad.Viola()) is None
+
+
+def test_treat_get_key_02():
+    """
+    Indexed manifests agree with linear search and keep the first key of
+    duplicate values.
+    """
+
+    instruments = {
+        "Flute": abjad.Flute(),
+        "Cello": abjad.Cello(),
+        "Violoncello": abjad.Cello(),
+    }
+    marks = {"60": abjad.MetronomeMark(abjad.Duration(1, 4), 60)}
+    manifests = {"abjad.Instrument": instruments, "abjad.MetronomeMark": marks}
+    indexed = baca.treat.index_manifests(manifests)
+    assert baca.treat.index_manifests(indexed) is indexed
+    assert indexed == manifests
+    for name, manifest in manifests.items():
+        for value in manifest.values():
+            key = baca.treat._get_key(manifests, name, value)
+            assert baca.treat._get_key(indexed, name, value) == key
+    assert baca.treat._get_key(indexed, "abjad.Instrument", abjad.Cello()) == "Cello"
+    assert baca.treat._get_key(indexed, "abjad.Instrument", abjad.Viola()) is None
+
+
+def test_treat_set_status_tag_01():
+    """
+    A status tag is not appended when the wrapper tag already contains it,
+    also as part of a longer word.
+    """
+
+    staff = abjad.Staff("c'4 d'")
+    tag = abjad.Tag("REDRAWN_REAPPLIED_CLEF")
+    abjad.attach(abjad.Clef("bass"), staff[0], tag=tag)
+    wrapper = abjad.get.wrapper(staff[0], abjad.Clef)
+    baca.treat._set_status_tag(wrapper, "reapplied")
+    assert wrapper.tag().string == "REDRAWN_REAPPLIED_CLEF:baca.treat._set_status_tag()"
+    abjad.attach(abjad.Clef("treble"), staff[1], tag=abjad.Tag("foo"))
+    wrapper = abjad.get.wrapper(staff[1], abjad.Clef)
+    baca.treat._set_status_tag(wrapper, "reapplied")
+    baca.treat._set_status_tag(wrapper, "reapplied")
+    words = wrapper.tag().words()
+    assert words == ["foo", "baca.treat._set_status_tag()", "REAPPLIED_CLEF"]